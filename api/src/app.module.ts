@@ -22,8 +22,10 @@ import { ArticleModule } from '@/article/article.module';
         url: configService.get('POSTGRES_URL'),
         autoLoadEntities: true,
         synchronize: configService.get('NODE_ENV') === 'development',
-        migrations: ['dist/migrations/*.js'],
+        migrations: [__dirname + '/migrations/*.js'],
         migrationsRun: true,
+        // Lets index migrations opt out of a transaction to build CONCURRENTLY
+        migrationsTransactionMode: 'each',
         logging: ['error', 'warn'],
       }),
     }),
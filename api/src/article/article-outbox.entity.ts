@@ -0,0 +1,38 @@
+import {
+  Entity,
+  PrimaryGeneratedColumn,
+  Column,
+  CreateDateColumn,
+  Index,
+} from 'typeorm';
+import {
+  EventEnvelope,
+  NewsCreatedEvent,
+} from '@/message-queue/message-queue.port';
+
+/**
+ * Event envelope recorded in the transaction that saves the article.
+ *
+ * The worker's outbox relay indexes every row and deletes it, so an
+ * article whose publish to RabbitMQ failed is indexed all the same. The
+ * table, its index and the trigger notifying relays are created by the
+ * `CreateArticleOutbox` migration.
+ */
+@Entity({ name: 'article_outbox' })
+export class ArticleOutbox {
+  @PrimaryGeneratedColumn({ type: 'bigint' })
+  id: string;
+
+  @Column({ type: 'jsonb' })
+  payload: EventEnvelope<NewsCreatedEvent>;
+
+  @Column({ type: 'integer', default: 0 })
+  attempts: number;
+
+  @Index('idx_article_outbox_available_at')
+  @Column({ type: 'timestamptz', name: 'available_at', default: () => 'now()' })
+  availableAt: Date;
+
+  @CreateDateColumn({ name: 'created_at', type: 'timestamptz' })
+  createdAt: Date;
+}
@@ -1,12 +1,13 @@
 import { Module } from '@nestjs/common';
 import { TypeOrmModule } from '@nestjs/typeorm';
 import { Article } from '@/article/article.entity';
+import { ArticleOutbox } from '@/article/article-outbox.entity';
 import { ArticleService } from '@/article/article.service';
 import { ArticleController } from '@/article/article.controller';
 import { MessageQueueModule } from '@/message-queue/message-queue.module';
 
 @Module({
-  imports: [TypeOrmModule.forFeature([Article]), MessageQueueModule],
+  imports: [TypeOrmModule.forFeature([Article, ArticleOutbox]), MessageQueueModule],
   providers: [ArticleService],
   controllers: [ArticleController],
 })
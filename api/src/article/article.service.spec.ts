@@ -8,6 +8,7 @@ import {
 } from '@nestjs/common';
 import { ArticleService } from '@/article/article.service';
 import { Article } from '@/article/article.entity';
+import { ArticleOutbox } from '@/article/article-outbox.entity';
 import { CreateArticleDto } from '@/article/dto/create-article.dto';
 import {
   MESSAGE_QUEUE_PORT,
@@ -41,6 +42,7 @@ describe('ArticleService', () => {
             create: jest.fn(),
             save: jest.fn(),
             findAndCount: jest.fn(),
+            manager: { transaction: jest.fn() },
           },
         },
         {
@@ -67,16 +69,21 @@ describe('ArticleService', () => {
       link: 'https://example.com/test',
     };
 
-    it('should create article and publish job', async () => {
+    it('should save article with outbox entry and publish job', async () => {
+      const manager = {
+        save: jest.fn().mockResolvedValue(mockArticle),
+        insert: jest.fn().mockResolvedValue(undefined),
+      };
       jest.spyOn(repo, 'findOne').mockResolvedValue(null);
       jest.spyOn(repo, 'create').mockReturnValue(mockArticle);
-      jest.spyOn(repo, 'save').mockResolvedValue(mockArticle);
+      (repo.manager.transaction as unknown as jest.Mock).mockImplementation(
+        (work: (m: typeof manager) => Promise<unknown>) => work(manager)
+      );
       jest.spyOn(mqService, 'publishArticleCreated').mockResolvedValue();
 
       const result = await service.create(dto);
 
-      expect(result).toEqual(mockArticle);
-      expect(mqService.publishArticleCreated).toHaveBeenCalledWith({
+      const event = {
         id: mockArticle.id,
         title: mockArticle.title,
         content: mockArticle.content,
@@ -85,7 +92,42 @@ describe('ArticleService', () => {
         link: mockArticle.link,
         createdAt: mockArticle.createdAt.toISOString(),
         updatedAt: mockArticle.updatedAt.toISOString(),
+      };
+      expect(result).toEqual(mockArticle);
+      expect(manager.save).toHaveBeenCalledWith(mockArticle);
+      expect(manager.insert).toHaveBeenCalledWith(ArticleOutbox, {
+        payload: {
+          event: 'news.created',
+          version: 1,
+          event_id: expect.any(String),
+          data: event,
+        },
       });
+      const { payload } = manager.insert.mock.calls[0][1];
+      expect(mqService.publishArticleCreated).toHaveBeenCalledWith(
+        event,
+        payload.event_id
+      );
+    });
+
+    it('should return the saved article when publishing fails', async () => {
+      const manager = {
+        save: jest.fn().mockResolvedValue(mockArticle),
+        insert: jest.fn().mockResolvedValue(undefined),
+      };
+      jest.spyOn(repo, 'findOne').mockResolvedValue(null);
+      jest.spyOn(repo, 'create').mockReturnValue(mockArticle);
+      (repo.manager.transaction as unknown as jest.Mock).mockImplementation(
+        (work: (m: typeof manager) => Promise<unknown>) => work(manager)
+      );
+      jest
+        .spyOn(mqService, 'publishArticleCreated')
+        .mockRejectedValue(new Error('channel closed'));
+
+      const result = await service.create(dto);
+
+      expect(result).toEqual(mockArticle);
+      expect(manager.insert).toHaveBeenCalledTimes(1);
     });
 
     it('should throw ConflictException if link exists', async () => {
@@ -4,20 +4,25 @@ import {
   NotFoundException,
   BadRequestException,
   Inject,
+  Logger,
 } from '@nestjs/common';
 import { InjectRepository } from '@nestjs/typeorm';
 import { Repository, FindOptionsWhere } from 'typeorm';
 import { validate as isUUID } from 'uuid';
 import { Article } from '@/article/article.entity';
+import { ArticleOutbox } from '@/article/article-outbox.entity';
 import { CreateArticleDto } from '@/article/dto/create-article.dto';
 import { QueryArticlesDto } from '@/article/dto/query-articles.dto';
 import {
   MESSAGE_QUEUE_PORT,
   MessageQueuePort,
+  createEventEnvelope,
 } from '@/message-queue/message-queue.port';
 
 @Injectable()
 export class ArticleService {
+  private readonly logger = new Logger(ArticleService.name);
+
   constructor(
     @InjectRepository(Article)
     private readonly repo: Repository<Article>,
@@ -32,21 +37,41 @@ export class ArticleService {
       throw new ConflictException('Article with this link already exists');
     }
 
-    // Create and save article
-    const article = this.repo.create(dto);
-    await this.repo.save(article);
+    // Save the article together with its event in the outbox, so the
+    // worker's outbox relay indexes it even if publishing below fails
+    const { article, envelope } = await this.repo.manager.transaction(
+      async (manager) => {
+        const saved = await manager.save(this.repo.create(dto));
+        const envelope = createEventEnvelope('news.created', {
+          id: saved.id,
+          title: saved.title,
+          content: saved.content,
+          source: saved.source,
+          author: saved.author,
+          link: saved.link,
+          createdAt: saved.createdAt.toISOString(),
+          updatedAt: saved.updatedAt.toISOString(),
+        });
+        await manager.insert(ArticleOutbox, { payload: envelope });
+        return { article: saved, envelope };
+      }
+    );
 
-    // Publish event so other services (e.g. indexer) can react
-    await this.mqService.publishArticleCreated({
-      id: article.id,
-      title: article.title,
-      content: article.content,
-      source: article.source,
-      author: article.author,
-      link: article.link,
-      createdAt: article.createdAt.toISOString(),
-      updatedAt: article.updatedAt.toISOString(),
-    });
+    // Publish event so other services (e.g. indexer) can react; the same
+    // event_id lets the worker skip whichever copy arrives second. The
+    // article is already committed, so a failed publish is left to the
+    // outbox relay instead of failing the request.
+    try {
+      await this.mqService.publishArticleCreated(
+        envelope.data,
+        envelope.event_id
+      );
+    } catch (error) {
+      this.logger.error(
+        `Failed to publish article ${article.id}; left to the outbox relay`,
+        error
+      );
+    }
 
     return article;
   }
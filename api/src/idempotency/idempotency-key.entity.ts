@@ -15,6 +15,16 @@ export enum IdempotencyStatus {
 
 @Entity('idempotency_keys')
 @Index(['idempotencyKey', 'resourcePath'], { unique: true })
+// Walked by the worker's retention purge; see the
+// AddIdempotencyKeyCompletedAgeIndex migration
+@Index('idx_idempotency_keys_completed_age', ['resourcePath', 'updatedAt'], {
+  where: `"status" = 'COMPLETED'`,
+})
+// Lets a worker's lease heartbeat find its claims; see the
+// AddIdempotencyKeyLeases migration
+@Index('idx_idempotency_keys_in_progress_owner', ['ownerId'], {
+  where: `"status" = 'IN_PROGRESS'`,
+})
 export class IdempotencyKey {
   @PrimaryGeneratedColumn('uuid')
   id: string;
@@ -38,6 +48,12 @@ export class IdempotencyKey {
   @Column({ type: 'jsonb', nullable: true, name: 'response_body' })
   responseBody: any;
 
+  @Column({ length: 255, nullable: true, name: 'owner_id' })
+  ownerId: string | null;
+
+  @Column({ type: 'timestamptz', nullable: true, name: 'lease_expires_at' })
+  leaseExpiresAt: Date | null;
+
   @CreateDateColumn({ type: 'timestamptz', name: 'created_at' })
   createdAt: Date;
 
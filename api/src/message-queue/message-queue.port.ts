@@ -1,3 +1,5 @@
+import { v4 as uuidv4 } from 'uuid';
+
 export interface NewsCreatedEvent {
   id: string;
   title: string;
@@ -29,6 +31,24 @@ export interface EventMap {
   'news.created': NewsCreatedEvent;
 }
 
+/**
+ * Wrap an event payload in the standard envelope. Callers that record the
+ * event before publishing it (e.g. in an outbox) pass the same envelope's
+ * event_id to `publish`, so consumers can deduplicate the two.
+ */
+export function createEventEnvelope<K extends keyof EventMap>(
+  routingKey: K,
+  event: EventMap[K],
+  eventId: string = uuidv4()
+): EventEnvelope<EventMap[K]> {
+  return {
+    event: String(routingKey),
+    version: 1,
+    event_id: eventId,
+    data: event,
+  };
+}
+
 export abstract class MessageQueuePort {
   /**
    * Publish a domain event to the appropriate infrastructure queue based on
@@ -44,15 +64,19 @@ export abstract class MessageQueuePort {
    */
   abstract publish<K extends keyof EventMap>(
     routingKey: K,
-    event: EventMap[K]
+    event: EventMap[K],
+    eventId?: string
   ): Promise<void>;
 
   /**
    * Convenience helper for article-related events so that article modules
    * never need to know about queue names or routing maps.
    */
-  publishArticleCreated(payload: NewsCreatedEvent): Promise<void> {
-    return this.publish('news.created', payload);
+  publishArticleCreated(
+    payload: NewsCreatedEvent,
+    eventId?: string
+  ): Promise<void> {
+    return this.publish('news.created', payload, eventId);
   }
 }
 
@@ -7,11 +7,10 @@ import {
 } from '@nestjs/common';
 import { ConfigService } from '@nestjs/config';
 import * as amqp from 'amqplib';
-import { v4 as uuidv4 } from 'uuid';
 import {
-  EventEnvelope,
   EventMap,
   MessageQueuePort,
+  createEventEnvelope,
 } from '@/message-queue/message-queue.port';
 
 @Injectable()
@@ -73,7 +72,8 @@ export class RabbitmqService
 
   async publish<K extends keyof EventMap>(
     routingKey: K,
-    event: EventMap[K]
+    event: EventMap[K],
+    eventId?: string
   ): Promise<void> {
     try {
       if (!this.channel) {
@@ -81,12 +81,7 @@ export class RabbitmqService
       }
 
       // Wrap the event payload in a standard envelope
-      const envelope: EventEnvelope<EventMap[K]> = {
-        event: String(routingKey),
-        version: 1,
-        event_id: uuidv4(),
-        data: event,
-      };
+      const envelope = createEventEnvelope(routingKey, event, eventId);
 
       const content = Buffer.from(JSON.stringify(envelope));
 
@@ -0,0 +1,47 @@
+import { MigrationInterface, QueryRunner } from 'typeorm';
+
+/**
+ * Outbox written by `ArticleService.create` and drained by the worker's
+ * `news-worker relay-outbox` command. The trigger wakes relays waiting
+ * with LISTEN once per inserting statement.
+ *
+ * Every statement is idempotent, since in development `synchronize`
+ * creates the table from the entity before migrations run.
+ */
+export class CreateArticleOutbox1792195200000 implements MigrationInterface {
+  name = 'CreateArticleOutbox1792195200000';
+
+  public async up(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(`
+      CREATE TABLE IF NOT EXISTS "article_outbox" (
+        "id" BIGSERIAL PRIMARY KEY,
+        "payload" jsonb NOT NULL,
+        "attempts" integer NOT NULL DEFAULT 0,
+        "available_at" TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+        "created_at" TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+      )
+    `);
+    await queryRunner.query(`
+      CREATE INDEX IF NOT EXISTS "idx_article_outbox_available_at"
+      ON "article_outbox" ("available_at")
+    `);
+    await queryRunner.query(`
+      CREATE OR REPLACE FUNCTION notify_article_outbox() RETURNS trigger AS $$
+      BEGIN
+        PERFORM pg_notify('article_outbox', '');
+        RETURN NULL;
+      END
+      $$ LANGUAGE plpgsql
+    `);
+    await queryRunner.query(`
+      CREATE OR REPLACE TRIGGER "article_outbox_notify"
+      AFTER INSERT ON "article_outbox"
+      FOR EACH STATEMENT EXECUTE FUNCTION notify_article_outbox()
+    `);
+  }
+
+  public async down(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(`DROP TABLE IF EXISTS "article_outbox"`);
+    await queryRunner.query(`DROP FUNCTION IF EXISTS notify_article_outbox()`);
+  }
+}
@@ -0,0 +1,29 @@
+import { MigrationInterface, QueryRunner } from 'typeorm';
+
+/**
+ * Index the worker's `news-worker purge-idempotency` command scans to find
+ * COMPLETED keys of a resource path past their retention.
+ *
+ * Built CONCURRENTLY so writes to `idempotency_keys` are not blocked, which
+ * cannot happen inside a transaction.
+ */
+export class AddIdempotencyKeyCompletedAgeIndex1792195300000
+  implements MigrationInterface
+{
+  name = 'AddIdempotencyKeyCompletedAgeIndex1792195300000';
+  transaction = false;
+
+  public async up(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(`
+      CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_idempotency_keys_completed_age"
+      ON "idempotency_keys" ("resource_path", "updated_at")
+      WHERE "status" = 'COMPLETED'
+    `);
+  }
+
+  public async down(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(
+      `DROP INDEX CONCURRENTLY IF EXISTS "idx_idempotency_keys_completed_age"`,
+    );
+  }
+}
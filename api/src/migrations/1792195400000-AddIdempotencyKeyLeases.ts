@@ -0,0 +1,38 @@
+import { MigrationInterface, QueryRunner } from 'typeorm';
+
+/**
+ * Leases of the worker's IN_PROGRESS claims: the claiming worker and when
+ * its claim may be taken over. The partial index lets a worker's heartbeat
+ * find the claims it holds.
+ *
+ * Runs outside a transaction so the index is built CONCURRENTLY; every
+ * statement is idempotent, so a migration that failed halfway can be rerun.
+ */
+export class AddIdempotencyKeyLeases1792195400000 implements MigrationInterface {
+  name = 'AddIdempotencyKeyLeases1792195400000';
+  transaction = false;
+
+  public async up(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(`
+      ALTER TABLE "idempotency_keys"
+        ADD COLUMN IF NOT EXISTS "owner_id" varchar(255),
+        ADD COLUMN IF NOT EXISTS "lease_expires_at" TIMESTAMP WITH TIME ZONE
+    `);
+    await queryRunner.query(`
+      CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_idempotency_keys_in_progress_owner"
+      ON "idempotency_keys" ("owner_id")
+      WHERE "status" = 'IN_PROGRESS'
+    `);
+  }
+
+  public async down(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(
+      `DROP INDEX CONCURRENTLY IF EXISTS "idx_idempotency_keys_in_progress_owner"`,
+    );
+    await queryRunner.query(`
+      ALTER TABLE "idempotency_keys"
+        DROP COLUMN IF EXISTS "lease_expires_at",
+        DROP COLUMN IF EXISTS "owner_id"
+    `);
+  }
+}
@@ -0,0 +1,5 @@
+"""Benchmarks for the news worker.
+
+Each module is runnable with ``python -m benchmarks.<name>`` from the worker
+directory and prints its results to stdout.
+"""
@@ -0,0 +1,60 @@
+"""Postgres setup shared by the benchmarks that claim idempotency keys."""
+
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+
+from psycopg_pool import ConnectionPool
+
+from src.config import load_config
+from src.domain.idempotency.ports import IdempotencyKey
+from src.infrastructure.postgres import create_connection_pool
+from src.infrastructure.postgres.idempotency_repository import (
+    PostgresIdempotencyRepository,
+)
+
+
+@contextmanager
+def connection_pool(max_size: int = 2) -> Iterator[ConnectionPool]:
+    """A pool on ``POSTGRES_URL``, open and filled, closed on exit."""
+    config = load_config()
+    pool = create_connection_pool(
+        config.POSTGRES_URL,
+        min_size=1,
+        max_size=max_size,
+        max_lifetime_seconds=config.POSTGRES_POOL_MAX_LIFETIME_SECONDS,
+        max_idle_seconds=config.POSTGRES_POOL_MAX_IDLE_SECONDS,
+        timeout_seconds=config.POSTGRES_POOL_TIMEOUT_SECONDS,
+    )
+    try:
+        pool.wait()
+        yield pool
+    finally:
+        pool.close()
+
+
+def idempotency_repository(pool: ConnectionPool) -> PostgresIdempotencyRepository:
+    """A repository on ``pool``, once the API's migrations are known to have run."""
+    repo = PostgresIdempotencyRepository(pool)
+    repo.check_schema()
+    return repo
+
+
+def delete_resource_path(pool: ConnectionPool, resource_path: str) -> None:
+    """Delete every idempotency key a benchmark wrote under ``resource_path``."""
+    with pool.connection() as conn:
+        conn.execute(
+            "DELETE FROM idempotency_keys WHERE resource_path = %s",
+            (resource_path,),
+        )
+
+
+def delete_keys(pool: ConnectionPool, keys: Iterable[IdempotencyKey]) -> None:
+    """Delete the given ``(idempotency_key, resource_path)`` pairs."""
+    keys = list(keys)
+    with pool.connection() as conn:
+        conn.execute(
+            "DELETE FROM idempotency_keys "
+            "WHERE (idempotency_key, resource_path) IN "
+            "(SELECT * FROM unnest(%s::text[], %s::text[]))",
+            ([key for key, _ in keys], [path for _, path in keys]),
+        )
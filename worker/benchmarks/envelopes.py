@@ -0,0 +1,64 @@
+"""Synthetic ``news.created`` v1 envelopes, shaped like the API publishes them."""
+
+import json
+import random
+import string
+import uuid
+from datetime import UTC, datetime
+
+
+def make_body(rng: random.Random, content_bytes: int) -> bytes:
+    """One encoded envelope whose article content is ``content_bytes`` long."""
+    words = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10)))
+        for _ in range(content_bytes // 6 + 1)
+    ]
+    now = datetime.now(UTC).isoformat()
+    article_id = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+    return json.dumps(
+        {
+            "event": "news.created",
+            "version": 1,
+            "event_id": article_id,
+            "data": {
+                "id": article_id,
+                "title": " ".join(words[:8]).title(),
+                "content": " ".join(words)[:content_bytes],
+                "source": "Benchmark Daily",
+                "author": "Jane Doe",
+                "link": f"https://example.com/news/{article_id}",
+                "createdAt": now,
+                "updatedAt": now,
+            },
+        }
+    ).encode("utf-8")
+
+
+class EnvelopeGenerator:
+    """Produces envelopes of which roughly ``duplicate_ratio`` are redeliveries.
+
+    A duplicate repeats the exact body of an envelope generated earlier, the
+    way a redelivery or a second publish of the same event would, so it
+    exercises the idempotency short-circuit rather than indexing.
+    """
+
+    def __init__(
+        self, content_bytes: int = 4_000, duplicate_ratio: float = 0.0, seed: int = 7
+    ) -> None:
+        if not 0.0 <= duplicate_ratio < 1.0:
+            raise ValueError("duplicate_ratio must be in [0, 1)")
+        self._rng = random.Random(seed)
+        self._content_bytes = content_bytes
+        self._duplicate_ratio = duplicate_ratio
+        self._generated: list[bytes] = []
+
+    def next_body(self) -> bytes:
+        if self._generated and self._rng.random() < self._duplicate_ratio:
+            return self._rng.choice(self._generated)
+
+        body = make_body(self._rng, self._content_bytes)
+        self._generated.append(body)
+        return body
+
+    def bodies(self, count: int) -> list[bytes]:
+        return [self.next_body() for _ in range(count)]
@@ -0,0 +1,72 @@
+"""In-process stand-ins for the worker's adapters, for benchmarks that should
+measure the worker's own overhead rather than Elasticsearch or Postgres."""
+
+import time
+from collections import defaultdict
+from collections.abc import Sequence
+from uuid import UUID
+
+from src.domain.article import Article
+from src.domain.idempotency.ports import IdempotencyChecker, IdempotencyStatus
+from src.domain.metrics.ports import NoopWorkerMetrics, Stage
+from src.domain.search.ports import IndexResult, SearchEngine
+
+
+class InMemorySearchEngine(SearchEngine):
+    """Keeps indexed articles in a dict.
+
+    Every request sleeps ``request_latency_seconds`` to stand in for the
+    round trip to Elasticsearch, so single and bulk indexing can be compared.
+    """
+
+    def __init__(self, request_latency_seconds: float = 0.0) -> None:
+        self._latency = request_latency_seconds
+        self.documents: dict[UUID, Article] = {}
+
+    def ensure_index_exists(self) -> None:
+        pass
+
+    def index_article(self, article: Article) -> None:
+        self._round_trip()
+        self.documents[article.id] = article
+
+    def index_articles(self, articles: Sequence[Article]) -> list[IndexResult]:
+        self._round_trip()
+        for article in articles:
+            self.documents[article.id] = article
+        return [IndexResult(article.id) for article in articles]
+
+    def _round_trip(self) -> None:
+        if self._latency:
+            time.sleep(self._latency)
+
+
+class InMemoryIdempotencyChecker(IdempotencyChecker):
+    """Single-process idempotency checker backed by a dict."""
+
+    def __init__(self) -> None:
+        self._statuses: dict[tuple[str, str], IdempotencyStatus] = {}
+
+    def check_and_claim(self, event_id: str, resource_key: str) -> IdempotencyStatus:
+        key = (event_id, resource_key)
+        status = self._statuses.get(key)
+        if status is None:
+            self._statuses[key] = IdempotencyStatus.IN_PROGRESS
+            return IdempotencyStatus.NEW
+        return status
+
+    def mark_completed(self, event_id: str, resource_key: str) -> None:
+        self._statuses[(event_id, resource_key)] = IdempotencyStatus.COMPLETED
+
+    def mark_failed(self, event_id: str, resource_key: str) -> None:
+        self._statuses.pop((event_id, resource_key), None)
+
+
+class StageRecorder(NoopWorkerMetrics):
+    """Metrics sink keeping every stage duration for a breakdown."""
+
+    def __init__(self) -> None:
+        self.stages: dict[Stage, list[float]] = defaultdict(list)
+
+    def observe_stage(self, stage: Stage, seconds: float) -> None:
+        self.stages[stage].append(seconds)
@@ -0,0 +1,178 @@
+"""End-to-end throughput of `ArticleJobHandler` without a message broker.
+
+Feeds synthetic ``news.created`` envelopes (see `benchmarks.envelopes`)
+straight into ``handle_message``, or ``handle_batch`` with ``--batch-size``
+above 1, and reports messages per second, latency percentiles per call and a
+breakdown of where the time went per handler stage.
+
+By default the search engine and idempotency checker are in-memory fakes,
+which isolates the worker's own overhead; ``--search-latency-ms`` adds a
+simulated Elasticsearch round trip per request. ``--search elasticsearch``
+indexes into a throwaway index on ``ELASTICSEARCH_URL`` and ``--idempotency
+postgres`` claims in ``POSTGRES_URL``; whatever a run writes is removed
+afterwards.
+
+Usage:
+    python -m benchmarks.handler_throughput --messages 20000 --duplicate-ratio 0.1
+    python -m benchmarks.handler_throughput --batch-size 200 \\
+        --search elasticsearch --idempotency postgres
+"""
+
+import argparse
+import contextlib
+import sys
+import time
+
+import msgspec
+from elasticsearch import Elasticsearch
+from loguru import logger
+
+from benchmarks.db import connection_pool, delete_keys, idempotency_repository
+from benchmarks.envelopes import EnvelopeGenerator
+from benchmarks.fakes import (
+    InMemoryIdempotencyChecker,
+    InMemorySearchEngine,
+    StageRecorder,
+)
+from benchmarks.stats import format_latencies
+from src.app.article_job_handler import ArticleJobHandler
+from src.app.article_service import ArticleService
+from src.config import load_config
+from src.domain.idempotency.ports import IdempotencyChecker
+from src.domain.metrics.ports import Stage
+from src.domain.search.ports import SearchEngine
+from src.infrastructure.elasticsearch.elasticsearch_engine import (
+    ElasticsearchEngine,
+)
+from src.infrastructure.idempotency.idempotency_checker import (
+    PostgresIdempotencyChecker,
+)
+
+_INDEX = "benchmark-handler-throughput"
+
+
+class _EventIds(msgspec.Struct):
+    event_id: str
+    event: str
+
+
+def _search_engine(
+    args: argparse.Namespace, cleanup: contextlib.ExitStack
+) -> SearchEngine:
+    if args.search == "fake":
+        return InMemorySearchEngine(args.search_latency_ms / 1000)
+
+    url = load_config().ELASTICSEARCH_URL
+    engine = ElasticsearchEngine(url, write_index=_INDEX)
+    engine.ensure_index_exists()
+    cleanup.callback(
+        lambda: Elasticsearch(url).indices.delete(
+            index=_INDEX, ignore_unavailable=True
+        )
+    )
+    return engine
+
+
+def _idempotency_checker(
+    args: argparse.Namespace,
+    bodies: list[bytes],
+    cleanup: contextlib.ExitStack,
+) -> IdempotencyChecker:
+    if args.idempotency == "memory":
+        return InMemoryIdempotencyChecker()
+
+    pool = cleanup.enter_context(connection_pool())
+    repo = idempotency_repository(pool)
+
+    keys = {
+        (ids.event_id, ids.event)
+        for ids in (msgspec.json.decode(body, type=_EventIds) for body in bodies)
+    }
+    cleanup.callback(delete_keys, pool, keys)
+    checker = PostgresIdempotencyChecker(repo)
+    cleanup.callback(checker.close)
+    return checker
+
+
+def _print_stage_breakdown(recorder: StageRecorder, elapsed: float) -> None:
+    print(f"{'stage':<16} {'calls':>7} {'total':>9} {'share':>6}  per call")
+    for stage in Stage:
+        samples = recorder.stages.get(stage, [])
+        total = sum(samples)
+        print(
+            f"{stage.value:<16} {len(samples):>7} {total:>8.3f}s "
+            f"{total / elapsed:>6.1%}  {format_latencies(samples)}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=20_000)
+    parser.add_argument("--content-bytes", type=int, default=4_000)
+    parser.add_argument("--duplicate-ratio", type=float, default=0.0)
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help="call handle_batch with this many messages (default: 1, "
+        "handle_message per message)",
+    )
+    parser.add_argument(
+        "--search", choices=("fake", "elasticsearch"), default="fake"
+    )
+    parser.add_argument("--search-latency-ms", type=float, default=0.0)
+    parser.add_argument(
+        "--idempotency", choices=("memory", "postgres"), default="memory"
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--log-level",
+        default="WARNING",
+        help="worker log level during the run; DEBUG shows the cost of "
+        "per-message logging",
+    )
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level=args.log_level)
+
+    bodies = EnvelopeGenerator(
+        args.content_bytes, args.duplicate_ratio, seed=args.seed
+    ).bodies(args.messages)
+
+    with contextlib.ExitStack() as cleanup:
+        recorder = StageRecorder()
+        handler = ArticleJobHandler(
+            ArticleService(_search_engine(args, cleanup)),
+            _idempotency_checker(args, bodies, cleanup),
+            recorder,
+        )
+
+        size = max(args.batch_size, 1)
+        chunks = [bodies[i : i + size] for i in range(0, len(bodies), size)]
+        latencies: list[float] = []
+        failed = 0
+        started = time.perf_counter()
+        for chunk in chunks:
+            call_started = time.perf_counter()
+            if args.batch_size > 1:
+                results = handler.handle_batch(chunk)
+            else:
+                try:
+                    results = [handler.handle_message(chunk[0])]
+                except Exception as exc:
+                    results = [exc]
+            latencies.append(time.perf_counter() - call_started)
+            failed += sum(result is not True for result in results)
+        elapsed = time.perf_counter() - started
+
+    per = "message" if size == 1 else f"batch of {size}"
+    print(
+        f"msgs/sec={len(bodies) / elapsed:,.0f} failed={failed} "
+        f"per {per}: {format_latencies(latencies)}"
+    )
+    _print_stage_breakdown(recorder, elapsed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Compare per-event idempotency calls with the batch variants.
+
+Runs `PostgresIdempotencyChecker` against the Postgres instance configured
+through ``POSTGRES_URL`` and reports, per batch of ``--batch-size`` events,
+the time to claim every event and mark it completed, once with
+``check_and_claim``/``mark_completed`` per event and once with
+``check_and_claim_many``/``mark_completed_many``.
+
+Usage:
+    python -m benchmarks.idempotency_batch --batches 20 --batch-size 500
+"""
+
+import argparse
+import time
+import uuid
+
+from benchmarks.db import connection_pool, delete_resource_path, idempotency_repository
+from benchmarks.stats import format_latencies
+from src.domain.idempotency.ports import IdempotencyKey
+from src.infrastructure.idempotency.idempotency_checker import (
+    PostgresIdempotencyChecker,
+)
+
+_RESOURCE_PATH = "benchmark.idempotency_batch"
+
+
+def _per_event(checker: PostgresIdempotencyChecker, keys: list[IdempotencyKey]) -> None:
+    for event_id, resource_key in keys:
+        checker.check_and_claim(event_id, resource_key)
+    for event_id, resource_key in keys:
+        checker.mark_completed(event_id, resource_key)
+
+
+def _batched(checker: PostgresIdempotencyChecker, keys: list[IdempotencyKey]) -> None:
+    checker.check_and_claim_many(keys)
+    checker.mark_completed_many(keys)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batches", type=int, default=20)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    with connection_pool() as pool:
+        checker = PostgresIdempotencyChecker(idempotency_repository(pool))
+        try:
+            for name, process in (("per event", _per_event), ("batched", _batched)):
+                latencies: list[float] = []
+                for _ in range(args.batches):
+                    keys = [
+                        (str(uuid.uuid4()), _RESOURCE_PATH)
+                        for _ in range(args.batch_size)
+                    ]
+                    started = time.perf_counter()
+                    process(checker, keys)
+                    latencies.append(time.perf_counter() - started)
+
+                events_per_second = args.batches * args.batch_size / sum(latencies)
+                print(
+                    f"{name:<10} events/sec={events_per_second:,.0f} "
+                    f"per batch: {format_latencies(latencies)}"
+                )
+        finally:
+            checker.close()
+            delete_resource_path(pool, _RESOURCE_PATH)
+
+
+if __name__ == "__main__":
+    main()
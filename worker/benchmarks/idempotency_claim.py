@@ -0,0 +1,99 @@
+"""Compare the legacy SELECT + INSERT claim with the single-statement claim.
+
+Runs both strategies against the Postgres instance configured through
+``POSTGRES_URL`` (the ``idempotency_keys`` table must exist) and reports
+round trips per claim and claim latency percentiles for fresh keys and for
+replays of already completed keys.
+
+Usage:
+    python -m benchmarks.idempotency_claim --claims 5000
+"""
+
+import argparse
+import time
+import uuid
+from collections.abc import Callable
+
+from psycopg.errors import UniqueViolation
+
+from benchmarks.db import connection_pool, delete_resource_path, idempotency_repository
+from benchmarks.stats import format_latencies
+from src.infrastructure.postgres.idempotency_repository import (
+    PostgresIdempotencyRepository,
+)
+
+_RESOURCE_PATH = "benchmark.idempotency_claim"
+_OWNER_ID = "benchmark"
+
+
+def _legacy_claim(repo: PostgresIdempotencyRepository, key: str) -> int:
+    """The previous check_and_claim: SELECT, then INSERT catching races.
+
+    Returns the number of round trips it took.
+    """
+    record = repo.get(key, _RESOURCE_PATH)
+    if record is not None and record.status in ("COMPLETED", "IN_PROGRESS"):
+        return 1
+
+    try:
+        with repo._get_connection() as conn:
+            conn.execute(
+                """
+                INSERT INTO idempotency_keys (idempotency_key, resource_path, status)
+                VALUES (%s, %s, 'IN_PROGRESS')
+                """,
+                (key, _RESOURCE_PATH),
+            )
+    except UniqueViolation:
+        pass
+    return 2
+
+
+def _single_statement_claim(repo: PostgresIdempotencyRepository, key: str) -> int:
+    repo.claim(key, _RESOURCE_PATH, _OWNER_ID, 60.0)
+    return 1
+
+
+def _run(
+    name: str,
+    claim: Callable[[PostgresIdempotencyRepository, str], int],
+    repo: PostgresIdempotencyRepository,
+    keys: list[str],
+) -> None:
+    latencies: list[float] = []
+    round_trips = 0
+    for key in keys:
+        started = time.perf_counter()
+        round_trips += claim(repo, key)
+        latencies.append(time.perf_counter() - started)
+
+    print(
+        f"{name:<40} round_trips/claim={round_trips / len(keys):.2f} "
+        f"{format_latencies(latencies)}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--claims", type=int, default=5000)
+    args = parser.parse_args()
+
+    with connection_pool(max_size=1) as pool:
+        repo = idempotency_repository(pool)
+        delete_resource_path(pool, _RESOURCE_PATH)
+        try:
+            for name, claim in (
+                ("legacy select+insert", _legacy_claim),
+                ("insert on conflict returning", _single_statement_claim),
+            ):
+                keys = [str(uuid.uuid4()) for _ in range(args.claims)]
+                _run(f"{name} (new)", claim, repo, keys)
+                for key in keys:
+                    repo.update_status(key, _RESOURCE_PATH, "COMPLETED")
+                _run(f"{name} (completed)", claim, repo, keys)
+        finally:
+            delete_resource_path(pool, _RESOURCE_PATH)
+
+
+if __name__ == "__main__":
+    main()
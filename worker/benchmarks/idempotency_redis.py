@@ -0,0 +1,86 @@
+"""Compare claim latency of the Postgres and the Redis idempotency checkers.
+
+Each checker claims ``--claims`` fresh keys and completes them, then claims
+them all again as duplicates. Postgres is the one configured through
+``POSTGRES_URL``; Redis is ``REDIS_URL``, or an in-process fakeredis server
+with ``--fake`` (useful to check behaviour, not representative of latency).
+
+Usage:
+    python -m benchmarks.idempotency_redis --claims 5000 [--fake]
+"""
+
+import argparse
+import time
+import uuid
+
+from redis import Redis
+
+from benchmarks.db import connection_pool, delete_resource_path, idempotency_repository
+from benchmarks.stats import format_latencies
+from src.config import load_config
+from src.domain.idempotency.ports import IdempotencyChecker, IdempotencyStatus
+from src.infrastructure.idempotency.idempotency_checker import (
+    PostgresIdempotencyChecker,
+)
+from src.infrastructure.idempotency.redis_idempotency_checker import (
+    RedisIdempotencyChecker,
+)
+
+_RESOURCE_PATH = "benchmark.idempotency_redis"
+
+
+def _run(name: str, checker: IdempotencyChecker, keys: list[str]) -> None:
+    for label, expected in (
+        ("fresh", IdempotencyStatus.NEW),
+        ("duplicate", IdempotencyStatus.COMPLETED),
+    ):
+        latencies: list[float] = []
+        started = time.perf_counter()
+        for key in keys:
+            claim_started = time.perf_counter()
+            status = checker.check_and_claim(key, _RESOURCE_PATH)
+            latencies.append(time.perf_counter() - claim_started)
+            if status is not expected:
+                raise RuntimeError(f"{name}: expected {expected}, got {status}")
+            if status is IdempotencyStatus.NEW:
+                checker.mark_completed(key, _RESOURCE_PATH)
+        elapsed = time.perf_counter() - started
+
+        print(
+            f"{name + ' ' + label:<20} claims/sec={len(keys) / elapsed:,.0f} "
+            f"{format_latencies(latencies)}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--claims", type=int, default=5000)
+    parser.add_argument("--fake", action="store_true", help="use fakeredis")
+    args = parser.parse_args()
+
+    if args.fake:
+        import fakeredis
+
+        redis = fakeredis.FakeRedis()
+    else:
+        redis = Redis.from_url(load_config().REDIS_URL)
+
+    with connection_pool() as pool:
+        repo = idempotency_repository(pool)
+        postgres_checker = PostgresIdempotencyChecker(repo)
+        redis_checker = RedisIdempotencyChecker(redis, repo)
+        try:
+            _run("postgres", postgres_checker, _keys(args.claims))
+            _run("redis", redis_checker, _keys(args.claims))
+        finally:
+            postgres_checker.close()
+            redis_checker.close()
+            delete_resource_path(pool, _RESOURCE_PATH)
+
+
+def _keys(count: int) -> list[str]:
+    return [str(uuid.uuid4()) for _ in range(count)]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Throughput of the message path under each logging configuration.
+
+Runs `ArticleJobHandler` against the in-memory fakes (see
+`benchmarks.fakes`) and logs around every message the way the consumer does:
+a "processing" and an "acknowledged" line plus the settlement summary. The
+log is written to ``--sink`` (a file, so the write cost is real) and each
+configuration is run in turn:
+
+- ``verbose``: the per-message lines at the level they used to be logged at,
+  in the colored text format, written by the handling thread with
+  ``diagnose`` on; what the worker did before the production logging mode.
+- ``verbose-enqueued``: the same lines written by loguru's background thread.
+- ``production``: ``LOG_FORMAT=json``, ``LOG_ENQUEUE=true`` at INFO, where
+  only the periodic summary is written.
+- ``off``: no sink at all, the upper bound.
+
+``msgs/sec`` stops the clock when the last message was handled;
+``drained`` is how long the background thread then needed to write the
+rest of the log.
+
+Usage:
+    python -m benchmarks.logging_overhead --messages 20000 --sink /tmp/worker.log
+"""
+
+import argparse
+import contextlib
+import os
+import time
+
+from loguru import logger
+
+from benchmarks.envelopes import EnvelopeGenerator
+from benchmarks.fakes import InMemoryIdempotencyChecker, InMemorySearchEngine
+from benchmarks.stats import format_latencies
+from src.app.article_job_handler import ArticleJobHandler
+from src.app.article_service import ArticleService
+from src.config import LogFormat, LogLevel, setup_logger
+from src.domain.metrics.ports import DeliveryOutcome, NoopWorkerMetrics
+from src.infrastructure.rabbitmq.settlement_log import SettlementLog
+
+_QUEUE = "news.created"
+
+# (level, format, enqueue) per configuration; None runs without a sink
+_CONFIGURATIONS: dict[str, tuple[LogLevel, LogFormat, bool] | None] = {
+    "verbose": (LogLevel.DEBUG, LogFormat.TEXT, False),
+    "verbose-enqueued": (LogLevel.DEBUG, LogFormat.TEXT, True),
+    "production": (LogLevel.INFO, LogFormat.JSON, True),
+    "off": None,
+}
+
+
+def _run(bodies: list[bytes], summary_interval: float) -> list[float]:
+    handler = ArticleJobHandler(
+        ArticleService(InMemorySearchEngine()),
+        InMemoryIdempotencyChecker(),
+        NoopWorkerMetrics(),
+    )
+    settlement_log = SettlementLog(summary_interval)
+    latencies: list[float] = []
+    for tag, body in enumerate(bodies, start=1):
+        started = time.perf_counter()
+        logger.debug(
+            "Processing message from queue '{}': {} (retry {}/{})", _QUEUE, tag, 0, 3
+        )
+        handler.handle_message(body)
+        logger.debug("Message {} acknowledged", tag)
+        settlement_log.record(_QUEUE, DeliveryOutcome.ACKED)
+        latencies.append(time.perf_counter() - started)
+    settlement_log.flush()
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=20_000)
+    parser.add_argument("--content-bytes", type=int, default=4_000)
+    parser.add_argument(
+        "--sink",
+        default="logging_overhead.log",
+        help="file the log is written to; removed afterwards",
+    )
+    parser.add_argument(
+        "--summary-interval",
+        type=float,
+        default=1.0,
+        help="seconds between settlement summaries (default: 1)",
+    )
+    parser.add_argument(
+        "--configurations",
+        nargs="+",
+        choices=tuple(_CONFIGURATIONS),
+        default=tuple(_CONFIGURATIONS),
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    bodies = EnvelopeGenerator(args.content_bytes, seed=args.seed).bodies(
+        args.messages
+    )
+
+    results: list[tuple[str, float, float, float, list[float]]] = []
+    try:
+        for name in args.configurations:
+            configuration = _CONFIGURATIONS[name]
+            with open(args.sink, "w", encoding="utf-8") as sink:
+                logger.remove()
+                if configuration is not None:
+                    with contextlib.redirect_stdout(sink):
+                        setup_logger(*configuration)
+
+                started = time.perf_counter()
+                latencies = _run(bodies, args.summary_interval)
+                elapsed = time.perf_counter() - started
+                # Removing an enqueued sink waits for its thread to write
+                # everything still queued
+                logger.remove()
+                drained = time.perf_counter() - started - elapsed
+            results.append(
+                (name, elapsed, drained, os.path.getsize(args.sink), latencies)
+            )
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(args.sink)
+
+    for name, elapsed, drained, size, latencies in results:
+        print(
+            f"{name:<17} msgs/sec={len(bodies) / elapsed:>9,.0f} "
+            f"drained={drained:.3f}s log={size / 1e6:.1f}MB "
+            f"per message: {format_latencies(latencies)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
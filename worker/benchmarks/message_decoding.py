@@ -0,0 +1,97 @@
+"""Compare the legacy json.loads decoding with the msgspec schema decoder.
+
+Generates realistic ``news.created`` envelopes and decodes each one with
+both strategies, reporting messages per second and per-message latency
+percentiles. The legacy strategy reproduces the previous handler: decode to
+``str``, ``json.loads``, manual field checks, then UUID and ISO 8601 parsing.
+
+Usage:
+    python -m benchmarks.message_decoding --messages 50000 --content-bytes 4000
+"""
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from benchmarks.envelopes import EnvelopeGenerator
+from benchmarks.stats import format_latencies
+from src.app.messages import decode_job_message
+from src.domain.article import InvalidJobMessageError
+
+_REQUIRED_TOP_LEVEL = ("event", "version", "event_id", "data")
+_REQUIRED_DATA = (
+    "id",
+    "title",
+    "content",
+    "source",
+    "author",
+    "link",
+    "createdAt",
+    "updatedAt",
+)
+
+
+def _legacy_decode(body: bytes) -> Any:
+    message = json.loads(body.decode("utf-8"))
+    for field in _REQUIRED_TOP_LEVEL:
+        if field not in message:
+            raise InvalidJobMessageError(f"Missing required top-level field: {field}")
+
+    data = message["data"]
+    if not isinstance(data, dict):
+        raise InvalidJobMessageError("'data' field must be an object")
+    for field in _REQUIRED_DATA:
+        if field not in data:
+            raise InvalidJobMessageError(f"Missing required data field: {field}")
+
+    if message["event"] != "news.created" or message["version"] != 1:
+        raise InvalidJobMessageError("Unsupported event")
+
+    return (
+        UUID(data["id"]),
+        datetime.fromisoformat(data["createdAt"]),
+        datetime.fromisoformat(data["updatedAt"]),
+    )
+
+
+def _run(name: str, decode: Callable[[bytes], Any], bodies: list[bytes]) -> None:
+    latencies: list[float] = []
+    started = time.perf_counter()
+    for body in bodies:
+        message_started = time.perf_counter()
+        decode(body)
+        latencies.append(time.perf_counter() - message_started)
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"{name:<20} msgs/sec={len(bodies) / elapsed:,.0f} "
+        f"{format_latencies(latencies)}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=50_000)
+    parser.add_argument("--content-bytes", type=int, default=4_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    bodies = EnvelopeGenerator(args.content_bytes, seed=args.seed).bodies(
+        args.messages
+    )
+
+    # Warm both paths up before measuring.
+    for body in bodies[:1000]:
+        _legacy_decode(body)
+        decode_job_message(body)
+
+    _run("json.loads", _legacy_decode, bodies)
+    _run("msgspec", decode_job_message, bodies)
+
+
+if __name__ == "__main__":
+    main()
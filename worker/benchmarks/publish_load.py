@@ -0,0 +1,91 @@
+"""Publish synthetic ``news.created`` envelopes to RabbitMQ as load for a worker.
+
+Sends ``--messages`` envelopes (see `benchmarks.envelopes`) to the events
+exchange of the broker configured through ``RABBITMQ_URL``, the way the API
+publishes them, optionally throttled to ``--rate`` messages per second.
+Publishes are confirmed by the broker; the confirmed publish rate is printed
+at the end. Start the worker first so ``news.created`` is declared and bound,
+then watch its ``news_worker_*`` metrics while the load drains.
+
+Usage:
+    python -m benchmarks.publish_load --messages 100000 --duplicate-ratio 0.05
+"""
+
+import argparse
+import time
+
+import pika
+
+from benchmarks.envelopes import EnvelopeGenerator
+from src.config import load_config
+from src.infrastructure.rabbitmq.confirmed_publisher import ConfirmedPublisher
+
+_EVENTS_EXCHANGE = "news.events"
+_ROUTING_KEY = "news.created"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=10_000)
+    parser.add_argument("--content-bytes", type=int, default=4_000)
+    parser.add_argument("--duplicate-ratio", type=float, default=0.0)
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=0.0,
+        help="messages per second (default: 0, as fast as possible)",
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    generator = EnvelopeGenerator(
+        args.content_bytes, args.duplicate_ratio, seed=args.seed
+    )
+    parameters = pika.URLParameters(load_config().RABBITMQ_URL)
+    connection = pika.BlockingConnection(parameters)
+    connection.channel().exchange_declare(
+        exchange=_EVENTS_EXCHANGE, exchange_type="topic", durable=True
+    )
+    publisher = ConfirmedPublisher(parameters, connection)
+    nacked = 0
+
+    def _on_confirmed(acked: bool) -> None:
+        nonlocal nacked
+        nacked += not acked
+
+    properties = pika.BasicProperties(
+        content_type="application/json", delivery_mode=2
+    )
+    interval = 1 / args.rate if args.rate > 0 else 0.0
+    started = time.perf_counter()
+    try:
+        for number in range(args.messages):
+            if interval:
+                delay = started + number * interval - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            publisher.publish(
+                _EVENTS_EXCHANGE,
+                _ROUTING_KEY,
+                generator.next_body(),
+                properties,
+                _on_confirmed,
+            )
+            # Run the confirm callbacks
+            connection.process_data_events(time_limit=0)
+
+        while publisher.pending:
+            connection.process_data_events(time_limit=1)
+        elapsed = time.perf_counter() - started
+    finally:
+        publisher.close()
+        connection.close()
+
+    print(
+        f"published={args.messages} nacked={nacked} "
+        f"elapsed={elapsed:.1f}s msgs/sec={args.messages / elapsed:,.0f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Measure how fast failing messages are republished to their retry queue.
+
+Simulates an Elasticsearch outage: every message fails, so each one is
+republished to the retry queue and its original acked only once the broker
+confirmed the copy. ``--messages`` messages are queued up front on throwaway
+queues of the broker configured through ``RABBITMQ_URL``, then drained by a
+`RabbitMQConsumer` once per message at a time and once in batches of
+``--batch-size``. The backoff is long enough that no message comes back
+during a run.
+
+Usage:
+    python -m benchmarks.republish_throughput --messages 5000 --batch-size 100
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Sequence
+
+import pika
+from loguru import logger
+
+from benchmarks.stats import format_latencies
+from src.config import load_config
+from src.domain.message_queue.ports import HandlerResult
+from src.domain.metrics.ports import DeliveryOutcome, NoopWorkerMetrics
+from src.infrastructure.rabbitmq.rabbitmq_consumer import (
+    RabbitMQConsumer,
+    retry_delays_ms,
+    retry_queue_name,
+)
+
+_NAMESPACE = "benchmark.republish_throughput"
+_QUEUE = f"{_NAMESPACE}.jobs"
+_EVENTS_EXCHANGE = f"{_NAMESPACE}.events"
+_BACKOFF_SECONDS = 600
+_IN_PROGRESS_RETRY_DELAY_MS = 2000
+
+
+class _SettleRecorder(NoopWorkerMetrics):
+    """Records when deliveries were settled and stops after the last one."""
+
+    def __init__(self, expected: int) -> None:
+        self.settled_at: list[float] = []
+        self.outcomes: dict[DeliveryOutcome, int] = {}
+        self._expected = expected
+
+    def message_settled(self, queue: str, outcome: DeliveryOutcome) -> None:
+        self.settled_at.append(time.perf_counter())
+        self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+        if len(self.settled_at) == self._expected:
+            # Unwinds out of start_consuming, which closes the connection
+            raise KeyboardInterrupt
+
+
+def _es_unavailable(body: bytes) -> bool:
+    raise ConnectionError("Elasticsearch unavailable")
+
+
+def _es_unavailable_batch(bodies: Sequence[bytes]) -> list[HandlerResult]:
+    return [ConnectionError("Elasticsearch unavailable")] * len(bodies)
+
+
+def _run(rabbitmq_url: str, messages: int, batch_size: int) -> None:
+    recorder = _SettleRecorder(messages)
+    consumer = RabbitMQConsumer(
+        rabbitmq_url,
+        namespace=_NAMESPACE,
+        events_exchange=_EVENTS_EXCHANGE,
+        queue_callbacks={_QUEUE: _es_unavailable},
+        queue_batch_callbacks=(
+            {_QUEUE: _es_unavailable_batch} if batch_size > 1 else None
+        ),
+        batch_size=batch_size,
+        max_retries=1,
+        initial_backoff_seconds=_BACKOFF_SECONDS,
+        max_backoff_seconds=_BACKOFF_SECONDS,
+        metrics=recorder,
+        in_progress_retry_delay_ms=_IN_PROGRESS_RETRY_DELAY_MS,
+    )
+
+    connection = pika.BlockingConnection(pika.URLParameters(rabbitmq_url))
+    channel = connection.channel()
+    channel.queue_declare(
+        queue=_QUEUE,
+        durable=True,
+        arguments={
+            "x-dead-letter-exchange": f"{_NAMESPACE}.dlx",
+            "x-dead-letter-routing-key": f"{_NAMESPACE}.dlq",
+        },
+    )
+    for number in range(messages):
+        channel.basic_publish(
+            exchange="", routing_key=_QUEUE, body=f"message-{number}".encode()
+        )
+    connection.close()
+
+    started = time.perf_counter()
+    consumer.start_consuming()
+    elapsed = recorder.settled_at[-1] - started
+
+    gaps = [
+        after - before
+        for before, after in zip(recorder.settled_at, recorder.settled_at[1:])
+    ]
+    label = "per message" if batch_size == 1 else f"batch={batch_size}"
+    print(
+        f"{label:<12} republished/sec={messages / elapsed:,.0f} "
+        f"retried={recorder.outcomes.get(DeliveryOutcome.RETRIED, 0)} "
+        f"gap between settles: {format_latencies(gaps)}"
+    )
+
+
+def _cleanup(rabbitmq_url: str) -> None:
+    delays = retry_delays_ms(
+        1,
+        _BACKOFF_SECONDS,
+        _BACKOFF_SECONDS,
+        2.0,
+        extra_delays_ms=(_IN_PROGRESS_RETRY_DELAY_MS,),
+    )
+    connection = pika.BlockingConnection(pika.URLParameters(rabbitmq_url))
+    channel = connection.channel()
+    for queue in (
+        _QUEUE,
+        f"{_NAMESPACE}.dlq",
+        *(retry_queue_name(_QUEUE, delay_ms) for delay_ms in delays),
+    ):
+        channel.queue_delete(queue=queue)
+    channel.exchange_delete(exchange=f"{_NAMESPACE}.dlx")
+    channel.exchange_delete(exchange=_EVENTS_EXCHANGE)
+    connection.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="CRITICAL")
+
+    rabbitmq_url = load_config().RABBITMQ_URL
+    for batch_size in (1, args.batch_size):
+        try:
+            _run(rabbitmq_url, args.messages, batch_size)
+        finally:
+            # Start the next run from empty retry queues
+            _cleanup(rabbitmq_url)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""Measure actual redelivery delays of failing messages against the schedule.
+
+Runs a `RabbitMQConsumer` whose handler always fails against the broker
+configured through ``RABBITMQ_URL``, on throwaway queues. ``--blockers``
+messages that are already on their last retry are published first, so the
+longest delay tier is busy while ``--messages`` fresh messages go through
+every retry. For each retry count the expected backoff is printed next to
+the observed gap between deliveries; with a shared retry queue the short
+delays would queue up behind the blockers.
+
+Usage:
+    python -m benchmarks.retry_schedule --messages 50 --blockers 20
+"""
+
+import argparse
+import sys
+import threading
+import time
+from collections import defaultdict
+
+import pika
+from loguru import logger
+
+from benchmarks.stats import format_latencies
+from src.config import load_config
+from src.infrastructure.rabbitmq.rabbitmq_consumer import (
+    RETRY_COUNT_HEADER,
+    RabbitMQConsumer,
+    calculate_backoff_delay_ms,
+    retry_delays_ms,
+    retry_queue_name,
+)
+
+_NAMESPACE = "benchmark.retry_schedule"
+_QUEUE = f"{_NAMESPACE}.jobs"
+_EVENTS_EXCHANGE = f"{_NAMESPACE}.events"
+_IN_PROGRESS_RETRY_DELAY_MS = 2000
+
+
+class _Recorder:
+    """Failing handler that records when every message was delivered."""
+
+    def __init__(self, expected_deliveries: int) -> None:
+        self.deliveries: dict[bytes, list[float]] = defaultdict(list)
+        self._remaining = expected_deliveries
+
+    def __call__(self, body: bytes) -> bool:
+        self.deliveries[body].append(time.monotonic())
+        self._remaining -= 1
+        if self._remaining == 0:
+            # Unwinds out of start_consuming, which closes the connection
+            raise KeyboardInterrupt
+        return False
+
+
+def _wait_for_queue(
+    connection: pika.BlockingConnection, name: str, timeout_seconds: float = 30.0
+):
+    """Return a channel once the consumer has declared ``name``."""
+    deadline = time.monotonic() + timeout_seconds
+    while True:
+        # A failed passive declare closes the channel
+        channel = connection.channel()
+        try:
+            channel.queue_declare(queue=name, passive=True)
+            return channel
+        except pika.exceptions.ChannelClosedByBroker:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=50)
+    parser.add_argument("--blockers", type=int, default=20)
+    parser.add_argument("--max-retries", type=int, default=4)
+    parser.add_argument("--initial-backoff", type=int, default=1)
+    parser.add_argument("--max-backoff", type=int, default=8)
+    parser.add_argument("--multiplier", type=float, default=2.0)
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    def backoff_ms(retry_count: int) -> int:
+        return calculate_backoff_delay_ms(
+            retry_count, args.initial_backoff, args.max_backoff, args.multiplier
+        )
+
+    recorder = _Recorder(args.messages * (args.max_retries + 1) + args.blockers * 2)
+    rabbitmq_url = load_config().RABBITMQ_URL
+    consumer = RabbitMQConsumer(
+        rabbitmq_url,
+        namespace=_NAMESPACE,
+        events_exchange=_EVENTS_EXCHANGE,
+        queue_callbacks={_QUEUE: recorder},
+        max_retries=args.max_retries,
+        initial_backoff_seconds=args.initial_backoff,
+        max_backoff_seconds=args.max_backoff,
+        backoff_multiplier=args.multiplier,
+        in_progress_retry_delay_ms=_IN_PROGRESS_RETRY_DELAY_MS,
+    )
+    consuming = threading.Thread(target=consumer.start_consuming, daemon=True)
+    consuming.start()
+
+    connection = pika.BlockingConnection(pika.URLParameters(rabbitmq_url))
+    channel = _wait_for_queue(connection, _QUEUE)
+
+    last_retry = args.max_retries - 1
+    for number in range(args.blockers):
+        channel.basic_publish(
+            exchange="",
+            routing_key=_QUEUE,
+            body=f"blocker-{number}".encode(),
+            properties=pika.BasicProperties(
+                headers={RETRY_COUNT_HEADER: last_retry}
+            ),
+        )
+    for number in range(args.messages):
+        channel.basic_publish(
+            exchange="", routing_key=_QUEUE, body=f"message-{number}".encode()
+        )
+
+    try:
+        while consuming.is_alive():
+            # Keep servicing heartbeats of the publishing connection
+            connection.process_data_events(time_limit=1)
+
+        gaps: dict[int, list[float]] = defaultdict(list)
+        for body, delivered_at in recorder.deliveries.items():
+            first_retry = last_retry if body.startswith(b"blocker-") else 0
+            for offset, (before, after) in enumerate(
+                zip(delivered_at, delivered_at[1:])
+            ):
+                gaps[first_retry + offset].append(after - before)
+
+        print(f"{'retry':<6} {'expected':>10}  observed gap between deliveries")
+        for retry_count in sorted(gaps):
+            print(
+                f"{retry_count:<6} {backoff_ms(retry_count):>8}ms  "
+                f"{format_latencies(gaps[retry_count])}"
+            )
+    finally:
+        delays = retry_delays_ms(
+            args.max_retries,
+            args.initial_backoff,
+            args.max_backoff,
+            args.multiplier,
+            extra_delays_ms=(_IN_PROGRESS_RETRY_DELAY_MS,),
+        )
+        for queue in (
+            _QUEUE,
+            f"{_NAMESPACE}.dlq",
+            *(retry_queue_name(_QUEUE, delay_ms) for delay_ms in delays),
+        ):
+            channel.queue_delete(queue=queue)
+        channel.exchange_delete(exchange=f"{_NAMESPACE}.dlx")
+        channel.exchange_delete(exchange=_EVENTS_EXCHANGE)
+        connection.close()
+
+
+if __name__ == "__main__":
+    main()
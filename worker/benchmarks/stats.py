@@ -0,0 +1,20 @@
+"""Small helpers for summarising benchmark samples."""
+
+from collections.abc import Sequence
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """Return the ``q``-th percentile (0-100) using nearest-rank."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, round(q / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def format_latencies(samples_seconds: Sequence[float]) -> str:
+    """Format p50/p95/p99/max of latency samples given in seconds."""
+    return " ".join(
+        f"{label}={percentile(samples_seconds, q) * 1000:.3f}ms"
+        for label, q in (("p50", 50), ("p95", 95), ("p99", 99), ("max", 100))
+    )
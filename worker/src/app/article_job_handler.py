@@ -1,11 +1,21 @@
-import json
-from uuid import UUID
+from collections.abc import Sequence
 
 from loguru import logger
 
-from src.app.article_service import ArticleService
-from src.domain.article import InvalidJobMessageError, MessageRequeueError
-from src.domain.idempotency.ports import IdempotencyChecker, IdempotencyStatus
+from src.app.article_service import ArticleService, AsyncArticleService
+from src.app.messages import NewsCreatedEnvelope, decode_job_message
+from src.domain.article import (
+    ArticleIndexingError,
+    InvalidJobMessageError,
+    MessageRequeueError,
+)
+from src.domain.idempotency.ports import (
+    AsyncIdempotencyChecker,
+    IdempotencyChecker,
+    IdempotencyStatus,
+)
+from src.domain.message_queue.ports import HandlerResult
+from src.domain.metrics.ports import NoopWorkerMetrics, Stage, WorkerMetrics
 
 
 class ArticleJobHandler:
@@ -15,9 +25,11 @@ class ArticleJobHandler:
         self,
         article_service: ArticleService,
         idempotency_checker: IdempotencyChecker,
+        metrics: WorkerMetrics | None = None,
     ) -> None:
         self._service = article_service
         self._idempotency = idempotency_checker
+        self._metrics = metrics or NoopWorkerMetrics()
 
     def handle_message(self, body: bytes) -> bool:
         """Process a job message. Returns True if successfully handled.
@@ -42,88 +54,225 @@ class ArticleJobHandler:
         }
         """
         try:
-            message = json.loads(body.decode("utf-8"))
-            self._validate_message(message)
-
-            event_id: str = message["event_id"]
-            event_type: str = message["event"]
-            version: int = message["version"]
-            data: dict = message["data"]
-
-            # Currently we only handle v1 of the news.created event
-            if event_type != "news.created" or version != 1:
-                raise InvalidJobMessageError(
-                    f"Unsupported event {event_type!r} with version {version}"
-                )
+            with self._metrics.time_stage(Stage.PARSE):
+                envelope = decode_job_message(body)
+        except InvalidJobMessageError as exc:
+            logger.error("Invalid message: {}", exc)
+            return False
+
+        event_id = envelope.event_id
+        event_type = envelope.event
 
-            # Idempotency check using event_id as the deduplication key
+        # Idempotency check using event_id as the deduplication key
+        with self._metrics.time_stage(Stage.CLAIM):
             status = self._idempotency.check_and_claim(event_id, event_type)
 
-            if status is IdempotencyStatus.COMPLETED:
-                logger.info("Event {} already processed; skipping", event_id)
-                return True
+        if status is IdempotencyStatus.COMPLETED:
+            logger.debug("Event {} already processed; skipping", event_id)
+            return True
+
+        if status is IdempotencyStatus.IN_PROGRESS:
+            # Another worker is currently handling this event. Raise exception
+            # to signal immediate requeue without counting as retry.
+            logger.debug(
+                "Event {} currently in progress elsewhere; requeuing",
+                event_id,
+            )
+            raise MessageRequeueError(
+                f"Event {event_id} is currently being processed by another worker"
+            )
 
-            if status is IdempotencyStatus.IN_PROGRESS:
-                # Another worker is currently handling this event. Raise exception
-                # to signal immediate requeue without counting as retry.
-                logger.info(
+        # NEW event - we own processing, and must release the claim on failure
+        try:
+            with self._metrics.time_stage(Stage.INDEX):
+                self._service.index_article_from_event(envelope.data)
+            with self._metrics.time_stage(Stage.MARK_COMPLETED):
+                self._idempotency.mark_completed(event_id, event_type)
+            return True
+        except Exception as exc:
+            self._release_claim(event_id, event_type)
+            logger.exception("Unexpected error handling message: {}", exc)
+            raise
+
+    def handle_batch(self, bodies: Sequence[bytes]) -> list[HandlerResult]:
+        """Process a batch of job messages with a single bulk index request.
+
+        Returns one result per body, in order. Each result is what
+        `handle_message` would have returned for that body, or the exception
+        it would have raised, so the consumer can settle every delivery on
+        its own.
+        """
+        results: list[HandlerResult] = [False] * len(bodies)
+        parsed: list[tuple[int, NewsCreatedEnvelope]] = []
+
+        for position, body in enumerate(bodies):
+            try:
+                with self._metrics.time_stage(Stage.PARSE):
+                    envelope = decode_job_message(body)
+            except InvalidJobMessageError as exc:
+                logger.error("Invalid message: {}", exc)
+                results[position] = False
+                continue
+            parsed.append((position, envelope))
+
+        if not parsed:
+            return results
+
+        # One claim, one completion and at most one release for the whole
+        # batch, however many events it holds
+        try:
+            with self._metrics.time_stage(Stage.CLAIM):
+                statuses = self._idempotency.check_and_claim_many(
+                    [(envelope.event_id, envelope.event) for _, envelope in parsed]
+                )
+        except Exception as exc:
+            logger.exception(
+                "Unexpected error claiming {} events: {}", len(parsed), exc
+            )
+            for position, _ in parsed:
+                results[position] = exc
+            return results
+
+        claimed: list[tuple[int, NewsCreatedEnvelope]] = []
+        for (position, envelope), status in zip(parsed, statuses):
+            event_id = envelope.event_id
+            if status is IdempotencyStatus.COMPLETED:
+                logger.debug("Event {} already processed; skipping", event_id)
+                results[position] = True
+            elif status is IdempotencyStatus.IN_PROGRESS:
+                logger.debug(
                     "Event {} currently in progress elsewhere; requeuing",
                     event_id,
                 )
-                raise MessageRequeueError(
+                results[position] = MessageRequeueError(
                     f"Event {event_id} is currently being processed by another worker"
                 )
+            else:
+                claimed.append((position, envelope))
 
-            # NEW event - we own processing
-            article_id = UUID(data["id"])
-            self._service.index_article_from_event(article_id, data)
-            self._idempotency.mark_completed(event_id, event_type)
-            return True
+        if not claimed:
+            return results
+
+        try:
+            with self._metrics.time_stage(Stage.INDEX):
+                index_results = self._service.index_articles_from_events(
+                    [envelope.data for _, envelope in claimed]
+                )
+        except Exception as exc:
+            logger.exception("Unexpected error bulk indexing articles: {}", exc)
+            for position, _ in claimed:
+                results[position] = exc
+            self._release_claims([envelope for _, envelope in claimed])
+            return results
+
+        indexed: list[tuple[int, NewsCreatedEnvelope]] = []
+        failed: list[NewsCreatedEnvelope] = []
+        for (position, envelope), index_result in zip(claimed, index_results):
+            if index_result.ok:
+                indexed.append((position, envelope))
+                continue
+            failed.append(envelope)
+            results[position] = ArticleIndexingError(
+                f"Failed to index article {index_result.article_id}: "
+                f"{index_result.error}"
+            )
 
-        except (json.JSONDecodeError, InvalidJobMessageError) as exc:
+        if indexed:
+            try:
+                with self._metrics.time_stage(Stage.MARK_COMPLETED):
+                    self._idempotency.mark_completed_many(
+                        [(env.event_id, env.event) for _, env in indexed]
+                    )
+                for position, _ in indexed:
+                    results[position] = True
+            except Exception as exc:
+                logger.exception(
+                    "Unexpected error completing {} events: {}", len(indexed), exc
+                )
+                for position, envelope in indexed:
+                    results[position] = exc
+                    failed.append(envelope)
+
+        self._release_claims(failed)
+        return results
+
+    def _release_claims(self, envelopes: Sequence[NewsCreatedEnvelope]) -> None:
+        """Clear claimed keys so later deliveries can retry them."""
+        if not envelopes:
+            return
+        try:
+            self._idempotency.mark_failed_many(
+                [(envelope.event_id, envelope.event) for envelope in envelopes]
+            )
+        except Exception as exc:
+            logger.error(
+                "Failed to release claims for {} events: {}", len(envelopes), exc
+            )
+
+    def _release_claim(self, event_id: str, event_type: str) -> None:
+        """Clear a claimed key so a later delivery can retry it."""
+        try:
+            self._idempotency.mark_failed(event_id, event_type)
+        except Exception as exc:
+            logger.error("Failed to release claim for event {}: {}", event_id, exc)
+
+
+class AsyncArticleJobHandler:
+    """Asyncio variant of `ArticleJobHandler` for the concurrent runtime."""
+
+    def __init__(
+        self,
+        article_service: AsyncArticleService,
+        idempotency_checker: AsyncIdempotencyChecker,
+        metrics: WorkerMetrics | None = None,
+    ) -> None:
+        self._service = article_service
+        self._idempotency = idempotency_checker
+        self._metrics = metrics or NoopWorkerMetrics()
+
+    async def handle_message(self, body: bytes) -> bool:
+        """Process a job message; see `ArticleJobHandler.handle_message`."""
+        try:
+            with self._metrics.time_stage(Stage.PARSE):
+                envelope = decode_job_message(body)
+        except InvalidJobMessageError as exc:
             logger.error("Invalid message: {}", exc)
             return False
-        except Exception as exc:  
-            try:
-                message = json.loads(body.decode("utf-8"))
-                if isinstance(message, dict) and "event_id" in message:
-                    self._idempotency.mark_failed(message["event_id"], message.get("event", "unknown"))
-            except Exception:  
-                pass
 
-            logger.exception("Unexpected error handling message: {}", exc)
-            raise
+        event_id = envelope.event_id
+        event_type = envelope.event
 
-    def _validate_message(self, message: dict) -> None:
-        """Validate message structure; raise InvalidJobMessageError on failure."""
+        with self._metrics.time_stage(Stage.CLAIM):
+            status = await self._idempotency.check_and_claim(event_id, event_type)
 
-        required_top_level = ["event", "version", "event_id", "data"]
-        for field in required_top_level:
-            if field not in message:
-                raise InvalidJobMessageError(
-                    f"Missing required top-level field: {field}"
-                )
+        if status is IdempotencyStatus.COMPLETED:
+            logger.debug("Event {} already processed; skipping", event_id)
+            return True
 
-        data = message["data"]
-        if not isinstance(data, dict):
-            raise InvalidJobMessageError("'data' field must be an object")
-
-        required_data_fields = [
-            "id",
-            "title",
-            "content",
-            "source",
-            "author",
-            "link",
-            "createdAt",
-            "updatedAt",
-        ]
-        for field in required_data_fields:
-            if field not in data:
-                raise InvalidJobMessageError(f"Missing required data field: {field}")
+        if status is IdempotencyStatus.IN_PROGRESS:
+            logger.debug(
+                "Event {} currently in progress elsewhere; requeuing",
+                event_id,
+            )
+            raise MessageRequeueError(
+                f"Event {event_id} is currently being processed by another worker"
+            )
 
+        # NEW event - we own processing
         try:
-            UUID(data["id"])
-        except ValueError:
-            raise InvalidJobMessageError("Invalid UUID format for id") from None
+            with self._metrics.time_stage(Stage.INDEX):
+                await self._service.index_article_from_event(envelope.data)
+            with self._metrics.time_stage(Stage.MARK_COMPLETED):
+                await self._idempotency.mark_completed(event_id, event_type)
+        except Exception as exc:
+            try:
+                await self._idempotency.mark_failed(event_id, event_type)
+            except Exception as release_exc:
+                logger.error(
+                    "Failed to release claim for event {}: {}", event_id, release_exc
+                )
+
+            logger.exception("Unexpected error handling message: {}", exc)
+            raise
 
+        return True
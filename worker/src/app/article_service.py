@@ -1,10 +1,10 @@
-from datetime import datetime
-from uuid import UUID
+from collections.abc import Sequence
 
 from loguru import logger
 
-from src.domain.article import Article
-from src.domain.search.ports import SearchEngine
+from src.app.messages import ArticlePayload
+from src.domain.article import Article, content_hash
+from src.domain.search.ports import AsyncSearchEngine, IndexResult, SearchEngine
 
 
 class ArticleService:
@@ -16,34 +16,63 @@ class ArticleService:
     ) -> None:
         self._search_engine = search_engine
 
-    def index_article_from_event(self, article_id: UUID, data: dict) -> None:
+    def index_article_from_event(self, payload: ArticlePayload) -> None:
         """Index an article in Elasticsearch using event payload data.
 
-        The event payload is expected to contain the full article row fields
-        (id, title, content, source, author, link, createdAt, updatedAt).
+        The payload carries the full article row fields (id, title, content,
+        source, author, link, createdAt, updatedAt), already validated.
         """
-        logger.info("Indexing article {} from event", article_id)
-
-        article = Article(
-            id=article_id,
-            title=data["title"],
-            content=data["content"],
-            source=data["source"],
-            author=data["author"],
-            link=data["link"],
-            created_at=_parse_iso8601(data["createdAt"]),
-            updated_at=_parse_iso8601(data["updatedAt"]),
-        )
+        logger.debug("Indexing article {} from event", payload.id)
+
+        article = _article_from_event(payload)
 
         self._search_engine.index_article(article)
-        logger.info("Indexed article {}", article_id)
+        logger.debug("Indexed article {}", payload.id)
+
+    def index_articles_from_events(
+        self, payloads: Sequence[ArticlePayload]
+    ) -> list[IndexResult]:
+        """Index a batch of articles from event payloads in one bulk request.
+
+        Returns one result per payload, in order.
+        """
+        logger.debug("Indexing {} articles from events", len(payloads))
+
+        articles = [_article_from_event(payload) for payload in payloads]
+        return self._search_engine.index_articles(articles)
+
+
+class AsyncArticleService:
+    """Asyncio variant of `ArticleService`."""
+
+    def __init__(
+        self,
+        search_engine: AsyncSearchEngine,
+    ) -> None:
+        self._search_engine = search_engine
+
+    async def index_article_from_event(self, payload: ArticlePayload) -> None:
+        """Index an article in Elasticsearch using event payload data."""
+        logger.debug("Indexing article {} from event", payload.id)
 
+        article = _article_from_event(payload)
 
-def _parse_iso8601(value: str) -> datetime:
-    """Parse an ISO 8601 datetime string into a `datetime`.
+        await self._search_engine.index_article(article)
+        logger.debug("Indexed article {}", payload.id)
 
-    We intentionally rely on `fromisoformat`, which supports the format
-    produced by ``datetime.isoformat`` in the API service.
-    """
-    return datetime.fromisoformat(value)
 
+def _article_from_event(payload: ArticlePayload) -> Article:
+    article = Article(
+        id=payload.id,
+        title=payload.title,
+        content=payload.content,
+        source=payload.source,
+        author=payload.author,
+        link=payload.link,
+        created_at=payload.created_at,
+        updated_at=payload.updated_at,
+    )
+    # Lets the engine skip the write when a replayed or re-published event
+    # carries the document that is already indexed
+    article.content_hash = content_hash(article)
+    return article
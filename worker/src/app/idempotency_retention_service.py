@@ -0,0 +1,79 @@
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from loguru import logger
+
+from src.domain.idempotency.ports import CompletedKeyPurger
+
+
+@dataclass(frozen=True)
+class PurgeReport:
+    """Outcome of a retention purge run."""
+
+    purged: int
+    batches: int
+    elapsed_seconds: float
+    # False when another purge held the lock and this run did nothing
+    ran: bool = True
+
+
+class IdempotencyRetentionService:
+    """Deletes the worker's COMPLETED idempotency keys past a retention horizon.
+
+    Rows are deleted in batches of ``batch_size``, each in its own short
+    transaction, with an optional pause between batches so the purge never
+    holds many row locks or saturates the database. Only keys of the worker's
+    own ``resource_paths`` are touched; the API service's keys and any
+    IN_PROGRESS claim are left alone.
+    """
+
+    def __init__(
+        self,
+        purger: CompletedKeyPurger,
+        resource_paths: Sequence[str],
+        retention_seconds: float,
+        batch_size: int = 1000,
+        batch_pause_seconds: float = 0.0,
+    ) -> None:
+        self._purger = purger
+        self._resource_paths = list(resource_paths)
+        self._retention = retention_seconds
+        self._batch_size = batch_size
+        self._batch_pause = batch_pause_seconds
+
+    def run(self) -> PurgeReport:
+        """Purge until no expired key is left, unless another run is active."""
+        started = time.perf_counter()
+        purged = 0
+        batches = 0
+
+        with self._purger.purge_lock() as locked:
+            if not locked:
+                logger.info("Another idempotency purge is running; skipping")
+                return PurgeReport(purged=0, batches=0, elapsed_seconds=0.0, ran=False)
+
+            while True:
+                deleted = self._purger.purge_completed(
+                    self._resource_paths, self._retention, self._batch_size
+                )
+                batches += 1
+                purged += deleted
+                if deleted < self._batch_size:
+                    break
+                if self._batch_pause:
+                    time.sleep(self._batch_pause)
+
+        report = PurgeReport(
+            purged=purged,
+            batches=batches,
+            elapsed_seconds=time.perf_counter() - started,
+        )
+        logger.info(
+            "Purged {} idempotency keys older than {}s in {} batches ({:.1f}s)",
+            report.purged,
+            self._retention,
+            report.batches,
+            report.elapsed_seconds,
+        )
+        return report
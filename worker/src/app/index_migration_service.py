@@ -0,0 +1,59 @@
+import time
+
+from loguru import logger
+
+from src.app.reindex_service import ReindexReport, ReindexService
+from src.domain.article import IndexMigrationError
+from src.domain.search.ports import SearchIndexMigrator
+
+
+class IndexMigrationService:
+    """Rebuilds the search index into a new index and switches readers to it.
+
+    The flow is: create the target index for bulk loading and add it to the
+    write targets, wait until every worker has picked up the dual writes,
+    backfill it from the database, then restore its settings and swap the
+    aliases in one atomic step. If the backfill fails the target is dropped
+    and the live index keeps serving.
+    """
+
+    def __init__(
+        self,
+        migrator: SearchIndexMigrator,
+        backfill: ReindexService,
+        target_index: str,
+        dual_write_grace_seconds: float,
+    ) -> None:
+        self._migrator = migrator
+        self._backfill = backfill
+        self._target_index = target_index
+        self._dual_write_grace = dual_write_grace_seconds
+
+    def run(self) -> ReindexReport | None:
+        """Migrate to the target index; returns None if it is already live."""
+        live = self._migrator.live_index()
+        if live == self._target_index:
+            logger.info("{} is already live; nothing to migrate", live)
+            return None
+
+        logger.info("Migrating search index from {} to {}", live, self._target_index)
+        self._migrator.start(self._target_index)
+
+        try:
+            # Workers cache their write targets; documents they index after
+            # this point reach the target index as well.
+            time.sleep(self._dual_write_grace)
+
+            report = self._backfill.run()
+            if report.failed:
+                raise IndexMigrationError(
+                    f"{report.failed} articles failed to index into "
+                    f"{self._target_index}"
+                )
+        except BaseException:
+            self._migrator.abort(self._target_index)
+            raise
+
+        self._migrator.complete(self._target_index)
+        logger.info("Search index migrated to {}", self._target_index)
+        return report
@@ -0,0 +1,59 @@
+"""Compiled schemas for the job messages the worker consumes.
+
+Messages are decoded straight from the raw ``bytes`` body and validated in
+the same pass, so no intermediate ``str``/``dict`` is built.
+"""
+
+from datetime import datetime
+from typing import Literal
+from uuid import UUID
+
+import msgspec
+
+from src.domain.article import InvalidJobMessageError
+
+
+class ArticlePayload(msgspec.Struct, rename="camel"):
+    """The article row carried in the ``data`` field of a news event."""
+
+    id: UUID
+    title: str
+    content: str
+    source: str
+    author: str
+    link: str
+    created_at: datetime
+    updated_at: datetime
+
+
+# Event types the worker handles; they double as the resource_path of the
+# idempotency keys it writes
+HANDLED_EVENTS = ("news.created",)
+
+
+class NewsCreatedEnvelope(msgspec.Struct):
+    """Enveloped ``news.created`` v1 event published by the API service.
+
+    Currently we only handle v1 of the news.created event; anything else
+    fails validation.
+    """
+
+    event: Literal["news.created"]
+    version: Literal[1]
+    event_id: str
+    data: ArticlePayload
+
+
+_DECODER = msgspec.json.Decoder(NewsCreatedEnvelope)
+
+
+def decode_job_message(body: bytes) -> NewsCreatedEnvelope:
+    """Decode and validate a job message body.
+
+    Raises `InvalidJobMessageError` for malformed JSON, missing fields,
+    wrong types or an unsupported event/version.
+    """
+    try:
+        return _DECODER.decode(body)
+    except msgspec.DecodeError as exc:
+        raise InvalidJobMessageError(str(exc)) from None
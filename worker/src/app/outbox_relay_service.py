@@ -0,0 +1,72 @@
+from loguru import logger
+
+from src.app.article_job_handler import ArticleJobHandler
+from src.domain.outbox.ports import Outbox
+
+
+class OutboxRelayService:
+    """Indexes the articles recorded in the outbox the API writes.
+
+    The API inserts the event envelope into the outbox in the transaction
+    that saves the article, so an article whose publish to RabbitMQ failed
+    is still indexed from there. Entries go through
+    `ArticleJobHandler.handle_batch` like a batch of deliveries: an event
+    the consumer already handled, or is handling, is claimed through the
+    same idempotency keys and not indexed twice.
+
+    Each batch stays locked while it is indexed, and relays skip locked
+    entries, so any number of relays can run side by side without taking
+    the same entry.
+    """
+
+    def __init__(
+        self,
+        outbox: Outbox,
+        handler: ArticleJobHandler,
+        batch_size: int = 500,
+        poll_interval_seconds: float = 5.0,
+        retry_delay_seconds: float = 5.0,
+    ) -> None:
+        self._outbox = outbox
+        self._handler = handler
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval_seconds
+        self._retry_delay = retry_delay_seconds
+
+    def run(self) -> None:
+        """Relay until interrupted, waiting for new entries once drained."""
+        while True:
+            if self.relay_batch() < self._batch_size:
+                self._outbox.wait_for_entries(self._poll_interval)
+
+    def relay_batch(self) -> int:
+        """Relay one batch of due entries; returns how many were locked.
+
+        Indexed entries and entries whose event was already processed are
+        deleted. Entries that failed, or whose event is being handled
+        elsewhere, are retried after ``retry_delay_seconds``. Entries that
+        are not a valid event can never succeed and are dropped.
+        """
+        with self._outbox.lock_batch(self._batch_size, self._retry_delay) as batch:
+            if not batch.entries:
+                return 0
+
+            results = self._handler.handle_batch(
+                [entry.body for entry in batch.entries]
+            )
+            for entry, result in zip(batch.entries, results):
+                if result is True:
+                    batch.done.append(entry.id)
+                elif result is False:
+                    logger.error("Dropping invalid outbox entry {}", entry.id)
+                    batch.done.append(entry.id)
+                else:
+                    batch.deferred.append(entry.id)
+
+        logger.info(
+            "Relayed {} outbox entries, {} deferred for {}s",
+            len(batch.done),
+            len(batch.deferred),
+            self._retry_delay,
+        )
+        return len(batch.entries)
@@ -0,0 +1,138 @@
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from uuid import UUID
+
+from loguru import logger
+
+from src.domain.article import Article, content_hash
+from src.domain.article.ports import ArticleRepository
+from src.domain.search.ports import IndexResult, SearchEngine
+
+# Seconds between progress log lines
+_PROGRESS_INTERVAL_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class ReindexReport:
+    """Outcome of a reindex run."""
+
+    indexed: int
+    failed: int
+    elapsed_seconds: float
+    # ID of the last article of the last fully settled chunk; pass it as
+    # ``after_id`` to resume. Every article up to it has been sent.
+    resume_after_id: UUID | None
+
+    @property
+    def docs_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return (self.indexed + self.failed) / self.elapsed_seconds
+
+
+class ReindexService:
+    """Streams every article from the repository into the search index.
+
+    Chunks are read sequentially from the repository and indexed through
+    bulk requests on a thread pool, with at most ``concurrency`` chunks in
+    flight. Chunks are settled in order, so the resume point only ever moves
+    past articles whose chunk has been fully indexed.
+    """
+
+    def __init__(
+        self,
+        article_repository: ArticleRepository,
+        search_engine: SearchEngine,
+        chunk_size: int = 1000,
+        concurrency: int = 4,
+    ) -> None:
+        self._repository = article_repository
+        self._search_engine = search_engine
+        self._chunk_size = chunk_size
+        self._concurrency = concurrency
+
+    def run(self, after_id: UUID | None = None) -> ReindexReport:
+        """Index every article after ``after_id`` (or all of them)."""
+        self._search_engine.ensure_index_exists()
+
+        started = time.perf_counter()
+        last_progress = started
+        indexed = failed = 0
+        resume_after_id = after_id
+        in_flight: deque[tuple[UUID, Future[list[IndexResult]]]] = deque()
+
+        def _settle_oldest() -> None:
+            nonlocal indexed, failed, resume_after_id
+            last_id, future = in_flight.popleft()
+            results = future.result()
+            ok = sum(result.ok for result in results)
+            indexed += ok
+            failed += len(results) - ok
+            resume_after_id = last_id
+
+        logger.info(
+            "Reindexing articles after {} ({} per bulk request, {} in flight)",
+            after_id or "the beginning",
+            self._chunk_size,
+            self._concurrency,
+        )
+
+        with ThreadPoolExecutor(
+            max_workers=self._concurrency, thread_name_prefix="reindex"
+        ) as executor:
+            try:
+                for chunk in self._repository.iter_articles(
+                    after_id=after_id, chunk_size=self._chunk_size
+                ):
+                    if len(in_flight) >= self._concurrency:
+                        _settle_oldest()
+                    in_flight.append((chunk[-1].id, self._submit(executor, chunk)))
+
+                    now = time.perf_counter()
+                    if now - last_progress >= _PROGRESS_INTERVAL_SECONDS:
+                        last_progress = now
+                        logger.info(
+                            "Reindexed {} articles ({:.0f} docs/sec), "
+                            "resumable after {}",
+                            indexed + failed,
+                            (indexed + failed) / (now - started),
+                            resume_after_id,
+                        )
+
+                while in_flight:
+                    _settle_oldest()
+            except BaseException:
+                for _, future in in_flight:
+                    future.cancel()
+                logger.error(
+                    "Reindex stopped; resume with --after-id {}", resume_after_id
+                )
+                raise
+
+        report = ReindexReport(
+            indexed=indexed,
+            failed=failed,
+            elapsed_seconds=time.perf_counter() - started,
+            resume_after_id=resume_after_id,
+        )
+        logger.info(
+            "Reindexed {} articles ({} failed) in {:.1f}s ({:.0f} docs/sec)",
+            report.indexed,
+            report.failed,
+            report.elapsed_seconds,
+            report.docs_per_second,
+        )
+        return report
+
+    def _submit(
+        self, executor: ThreadPoolExecutor, chunk: list[Article]
+    ) -> Future[list[IndexResult]]:
+        return executor.submit(self._index_chunk, chunk)
+
+    def _index_chunk(self, chunk: list[Article]) -> list[IndexResult]:
+        # Hashed on the pool, so an article re-sent unchanged is skipped
+        for article in chunk:
+            article.content_hash = content_hash(article)
+        return self._search_engine.index_articles(chunk)
@@ -0,0 +1,195 @@
+"""Command line interface of the ``news-worker`` script.
+
+``news-worker`` (or ``news-worker consume``) runs the queue consumer;
+the other subcommands run the outbox relay or one-off maintenance jobs.
+"""
+
+import argparse
+import signal
+import sys
+import time
+from uuid import UUID
+
+from loguru import logger
+
+from src.config.config import Config, load_config, setup_logger
+from src.app.reindex_service import ReindexReport
+from src.di.container import (
+    build_idempotency_purge_container,
+    build_index_migration_container,
+    build_outbox_relay_container,
+    build_reindex_container,
+)
+from src.infrastructure.elasticsearch.elasticsearch_engine import INDEX_VERSION
+from src.main import main as consume
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Entry point for the ``news-worker`` Poetry script."""
+    parser = argparse.ArgumentParser(prog="news-worker")
+    commands = parser.add_subparsers(dest="command")
+
+    commands.add_parser("consume", help="consume job messages (default)")
+
+    reindex = commands.add_parser(
+        "reindex",
+        help="stream the articles table from Postgres into Elasticsearch",
+    )
+    reindex.add_argument(
+        "--after-id",
+        type=UUID,
+        default=None,
+        help="resume after this article ID, as printed by a previous run",
+    )
+    _add_bulk_arguments(reindex)
+
+    migrate_index = commands.add_parser(
+        "migrate-index",
+        help="rebuild the search index into a new mapping version and swap to it",
+    )
+    migrate_index.add_argument(
+        "--version",
+        type=_positive_int,
+        default=INDEX_VERSION,
+        help=f"index version to migrate to (default: {INDEX_VERSION})",
+    )
+    _add_bulk_arguments(migrate_index)
+
+    purge_idempotency = commands.add_parser(
+        "purge-idempotency",
+        help="delete completed idempotency keys past their retention",
+    )
+    purge_idempotency.add_argument(
+        "--every",
+        type=_positive_int,
+        default=None,
+        metavar="SECONDS",
+        help="keep running and purge every SECONDS instead of once",
+    )
+
+    commands.add_parser(
+        "relay-outbox",
+        help="index articles from the outbox table until interrupted",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command in (None, "consume"):
+        consume()
+        return
+
+    config = load_config()
+    setup_logger(config.LOG_LEVEL, config.LOG_FORMAT, config.LOG_ENQUEUE)
+
+    if args.command == "reindex":
+        _reindex(config, args)
+    elif args.command == "migrate-index":
+        _migrate_index(config, args)
+    elif args.command == "purge-idempotency":
+        _purge_idempotency(config, args)
+    elif args.command == "relay-outbox":
+        _relay_outbox(config)
+
+
+def _add_bulk_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--chunk-size",
+        type=_positive_int,
+        default=None,
+        help="articles per bulk request (default: REINDEX_CHUNK_SIZE)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=None,
+        help="bulk requests in flight (default: REINDEX_CONCURRENCY)",
+    )
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return number
+
+
+def _reindex(config: Config, args: argparse.Namespace) -> None:
+    container = build_reindex_container(
+        config,
+        chunk_size=args.chunk_size or config.REINDEX_CHUNK_SIZE,
+        concurrency=args.concurrency or config.REINDEX_CONCURRENCY,
+    )
+    try:
+        report = container.reindex_service.run(after_id=args.after_id)
+    except KeyboardInterrupt:
+        sys.exit(130)
+    finally:
+        container.postgres_pool.close()
+
+    _print_report(report)
+    if report.failed:
+        logger.warning("{} articles failed to index; see errors above", report.failed)
+        sys.exit(1)
+
+
+def _migrate_index(config: Config, args: argparse.Namespace) -> None:
+    container = build_index_migration_container(
+        config,
+        version=args.version,
+        chunk_size=args.chunk_size or config.REINDEX_CHUNK_SIZE,
+        concurrency=args.concurrency or config.REINDEX_CONCURRENCY,
+    )
+    try:
+        report = container.index_migration_service.run()
+    except KeyboardInterrupt:
+        sys.exit(130)
+    finally:
+        container.postgres_pool.close()
+
+    if report is not None:
+        _print_report(report)
+
+
+def _purge_idempotency(config: Config, args: argparse.Namespace) -> None:
+    container = build_idempotency_purge_container(config)
+    try:
+        while True:
+            report = container.retention_service.run()
+            print(
+                f"purged={report.purged} batches={report.batches} "
+                f"elapsed={report.elapsed_seconds:.1f}s"
+            )
+            if args.every is None:
+                break
+            time.sleep(args.every)
+    except KeyboardInterrupt:
+        sys.exit(130)
+    finally:
+        container.postgres_pool.close()
+
+
+def _relay_outbox(config: Config) -> None:
+    # A locked batch is rolled back on interrupt and relayed again later, so
+    # SIGTERM can stop the relay the same way Ctrl+C does
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    container = build_outbox_relay_container(config)
+    try:
+        container.relay_service.run()
+    except KeyboardInterrupt:
+        sys.exit(130)
+    finally:
+        container.idempotency_checker.close()
+        container.postgres_pool.close()
+
+
+def _print_report(report: ReindexReport) -> None:
+    print(
+        f"indexed={report.indexed} failed={report.failed} "
+        f"elapsed={report.elapsed_seconds:.1f}s "
+        f"docs/sec={report.docs_per_second:.0f} "
+        f"resume_after_id={report.resume_after_id}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,24 @@
 Re-exports the main configuration helpers and types.
 """
 
-from .config import Config, LogLevel, load_config, setup_logger
+from .config import (
+    Config,
+    IdempotencyBackend,
+    LogFormat,
+    LogLevel,
+    WorkerRuntime,
+    load_config,
+    setup_logger,
+)
 
-__all__ = ["Config", "LogLevel", "load_config", "setup_logger"]
+__all__ = [
+    "Config",
+    "IdempotencyBackend",
+    "LogFormat",
+    "LogLevel",
+    "WorkerRuntime",
+    "load_config",
+    "setup_logger",
+]
 
 
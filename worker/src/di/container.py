@@ -1,43 +1,157 @@
 from dataclasses import dataclass
 
-from src.app.article_service import ArticleService
-from src.app.article_job_handler import ArticleJobHandler
-from src.config.config import Config
-from src.domain.idempotency.ports import IdempotencyChecker
-from src.infrastructure.elasticsearch.elasticsearch_engine import ElasticsearchEngine
+from loguru import logger
+from psycopg_pool import AsyncConnectionPool, ConnectionPool
+from redis import Redis
+
+from src.app.article_service import ArticleService, AsyncArticleService
+from src.app.article_job_handler import ArticleJobHandler, AsyncArticleJobHandler
+from src.app.idempotency_retention_service import IdempotencyRetentionService
+from src.app.index_migration_service import IndexMigrationService
+from src.app.messages import HANDLED_EVENTS
+from src.app.outbox_relay_service import OutboxRelayService
+from src.app.reindex_service import ReindexService
+from src.config.config import Config, IdempotencyBackend, WorkerRuntime
+from src.domain.idempotency.ports import AsyncIdempotencyChecker, IdempotencyChecker
+from src.domain.message_queue.ports import AsyncMessageConsumer, MessageConsumer
+from src.domain.metrics.ports import NoopWorkerMetrics, WorkerMetrics
+from src.domain.search.ports import AsyncSearchEngine, SearchEngine
+from src.infrastructure.elasticsearch.async_elasticsearch_engine import (
+    AsyncElasticsearchEngine,
+)
+from src.infrastructure.elasticsearch.elasticsearch_engine import (
+    WRITE_TARGETS_TTL_SECONDS,
+    ElasticsearchEngine,
+    versioned_index_name,
+)
+from src.infrastructure.elasticsearch.index_migrator import (
+    ElasticsearchIndexMigrator,
+)
+from src.infrastructure.elasticsearch.transport import TransportSettings
+from src.infrastructure.idempotency.async_idempotency_checker import (
+    AsyncPostgresIdempotencyChecker,
+)
+from src.infrastructure.idempotency.caching_idempotency_checker import (
+    AsyncCachingIdempotencyChecker,
+    CachingIdempotencyChecker,
+    CompletedKeyCache,
+)
 from src.infrastructure.idempotency.idempotency_checker import (
     PostgresIdempotencyChecker,
 )
+from src.infrastructure.idempotency.redis_idempotency_checker import (
+    RedisIdempotencyChecker,
+)
+from src.infrastructure.metrics.prometheus_metrics import PrometheusWorkerMetrics
+from src.infrastructure.postgres import (
+    create_async_connection_pool,
+    create_connection_pool,
+)
+from src.infrastructure.postgres.article_repository import PostgresArticleRepository
+from src.infrastructure.postgres.async_idempotency_repository import (
+    AsyncPostgresIdempotencyRepository,
+)
 from src.infrastructure.postgres.idempotency_repository import (
     PostgresIdempotencyRepository,
 )
+from src.infrastructure.postgres.outbox_repository import PostgresOutboxRepository
+from src.infrastructure.rabbitmq.aio_pika_consumer import AioPikaConsumer
 from src.infrastructure.rabbitmq.rabbitmq_consumer import RabbitMQConsumer
 
 
 @dataclass
 class Container:
-    """Holds all wired dependencies for the worker."""
+    """Holds all wired dependencies for the worker.
+
+    With ``WORKER_RUNTIME=asyncio`` every component is its asyncio variant.
+    """
+
+    article_service: ArticleService | AsyncArticleService
+    article_job_handler: ArticleJobHandler | AsyncArticleJobHandler
+    article_message_consumer: MessageConsumer | AsyncMessageConsumer
+    idempotency_checker: IdempotencyChecker | AsyncIdempotencyChecker
+    idempotency_repo: PostgresIdempotencyRepository | AsyncPostgresIdempotencyRepository
+    search_engine: SearchEngine | AsyncSearchEngine
+    postgres_pool: ConnectionPool | AsyncConnectionPool
+    metrics: WorkerMetrics
+
+
+@dataclass
+class ReindexContainer:
+    """Dependencies of the ``reindex`` command; no message queue involved."""
+
+    reindex_service: ReindexService
+    search_engine: SearchEngine
+    postgres_pool: ConnectionPool
+
+
+@dataclass
+class IdempotencyPurgeContainer:
+    """Dependencies of the ``purge-idempotency`` command."""
+
+    retention_service: IdempotencyRetentionService
+    postgres_pool: ConnectionPool
+
+
+@dataclass
+class IndexMigrationContainer:
+    """Dependencies of the ``migrate-index`` command."""
+
+    index_migration_service: IndexMigrationService
+    postgres_pool: ConnectionPool
+
+
+@dataclass
+class OutboxRelayContainer:
+    """Dependencies of the ``relay-outbox`` command."""
 
-    article_service: ArticleService
-    article_job_handler: ArticleJobHandler
-    article_message_consumer: RabbitMQConsumer
+    relay_service: OutboxRelayService
     idempotency_checker: IdempotencyChecker
+    postgres_pool: ConnectionPool
 
 
 def build_container(config: Config) -> Container:
     """Construct and wire all dependencies."""
-    search_engine = ElasticsearchEngine(config.ELASTICSEARCH_URL)
-    idempotency_repo = PostgresIdempotencyRepository(config.POSTGRES_URL)
-    idempotency_checker = PostgresIdempotencyChecker(
-        repo=idempotency_repo,
+    if config.WORKER_RUNTIME is WorkerRuntime.ASYNCIO:
+        return _build_async_container(config)
+
+    metrics = _build_metrics(config)
+    search_engine = ElasticsearchEngine(
+        config.ELASTICSEARCH_URL,
+        transport=_elasticsearch_transport(config),
+        metrics=metrics,
+        skip_unchanged=config.ELASTICSEARCH_SKIP_UNCHANGED,
+    )
+    _bootstrap_index(search_engine)
+    postgres_pool = create_connection_pool(
+        config.POSTGRES_URL,
+        min_size=config.POSTGRES_POOL_MIN_SIZE,
+        max_size=config.POSTGRES_POOL_MAX_SIZE,
+        max_lifetime_seconds=config.POSTGRES_POOL_MAX_LIFETIME_SECONDS,
+        max_idle_seconds=config.POSTGRES_POOL_MAX_IDLE_SECONDS,
+        timeout_seconds=config.POSTGRES_POOL_TIMEOUT_SECONDS,
     )
+    idempotency_repo = PostgresIdempotencyRepository(postgres_pool)
+    idempotency_repo.check_schema()
+    idempotency_checker = _build_idempotency_checker(config, idempotency_repo)
+    if config.IDEMPOTENCY_CACHE_SIZE > 0:
+        idempotency_checker = CachingIdempotencyChecker(
+            idempotency_checker, _build_completed_key_cache(config, metrics)
+        )
 
     article_service = ArticleService(search_engine)
-    article_job_handler = ArticleJobHandler(article_service, idempotency_checker)
+    article_job_handler = ArticleJobHandler(
+        article_service, idempotency_checker, metrics
+    )
 
     queue_callbacks = {
         'news.created': article_job_handler.handle_message
     }
+    queue_batch_callbacks = (
+        {'news.created': article_job_handler.handle_batch}
+        if config.BATCH_SIZE > 1
+        else None
+    )
     article_message_consumer = RabbitMQConsumer(
         config.RABBITMQ_URL,
         namespace="news",
@@ -47,6 +161,16 @@ def build_container(config: Config) -> Container:
         initial_backoff_seconds=config.INITIAL_BACKOFF_SECONDS,
         max_backoff_seconds=config.MAX_BACKOFF_SECONDS,
         backoff_multiplier=config.BACKOFF_MULTIPLIER,
+        queue_batch_callbacks=queue_batch_callbacks,
+        batch_size=config.BATCH_SIZE,
+        batch_max_wait_ms=config.BATCH_MAX_WAIT_MS,
+        metrics=metrics,
+        queue_depth_interval_seconds=config.METRICS_QUEUE_DEPTH_INTERVAL_SECONDS,
+        in_progress_retry_delay_ms=config.IN_PROGRESS_RETRY_DELAY_MS,
+        reconnect_initial_seconds=config.RABBITMQ_RECONNECT_INITIAL_SECONDS,
+        reconnect_max_seconds=config.RABBITMQ_RECONNECT_MAX_SECONDS,
+        drain_timeout_seconds=config.SHUTDOWN_DRAIN_TIMEOUT_SECONDS,
+        log_summary_interval_seconds=config.LOG_SUMMARY_INTERVAL_SECONDS,
     )
 
     return Container(
@@ -54,6 +178,282 @@ def build_container(config: Config) -> Container:
         article_job_handler=article_job_handler,
         article_message_consumer=article_message_consumer,
         idempotency_checker=idempotency_checker,
+        idempotency_repo=idempotency_repo,
+        search_engine=search_engine,
+        postgres_pool=postgres_pool,
+        metrics=metrics,
+    )
+
+
+def build_reindex_container(
+    config: Config, chunk_size: int, concurrency: int
+) -> ReindexContainer:
+    """Wire the Postgres-to-Elasticsearch reindex."""
+    search_engine = ElasticsearchEngine(
+        config.ELASTICSEARCH_URL,
+        transport=_elasticsearch_transport(config),
+        skip_unchanged=config.ELASTICSEARCH_SKIP_UNCHANGED,
+    )
+    postgres_pool = _create_reindex_pool(config)
+    reindex_service = ReindexService(
+        PostgresArticleRepository(postgres_pool),
+        search_engine,
+        chunk_size=chunk_size,
+        concurrency=concurrency,
+    )
+
+    return ReindexContainer(
+        reindex_service=reindex_service,
+        search_engine=search_engine,
+        postgres_pool=postgres_pool,
+    )
+
+
+def build_index_migration_container(
+    config: Config, version: int, chunk_size: int, concurrency: int
+) -> IndexMigrationContainer:
+    """Wire the migration of the search index to mapping ``version``.
+
+    The backfill writes straight to the new versioned index, while running
+    workers dual-write to it through the write alias.
+    """
+    target_index = versioned_index_name(version)
+    transport = _elasticsearch_transport(config)
+    postgres_pool = _create_reindex_pool(config)
+    backfill = ReindexService(
+        PostgresArticleRepository(postgres_pool),
+        # The new index starts empty, so there is nothing to skip
+        ElasticsearchEngine(
+            config.ELASTICSEARCH_URL,
+            write_index=target_index,
+            transport=transport,
+            skip_unchanged=False,
+        ),
+        chunk_size=chunk_size,
+        concurrency=concurrency,
+    )
+    index_migration_service = IndexMigrationService(
+        ElasticsearchIndexMigrator(config.ELASTICSEARCH_URL, transport=transport),
+        backfill,
+        target_index=target_index,
+        dual_write_grace_seconds=WRITE_TARGETS_TTL_SECONDS + 5,
+    )
+
+    return IndexMigrationContainer(
+        index_migration_service=index_migration_service,
+        postgres_pool=postgres_pool,
+    )
+
+
+def build_idempotency_purge_container(config: Config) -> IdempotencyPurgeContainer:
+    """Wire the retention purge of the worker's idempotency keys."""
+    # One connection holds the purge lock, the other runs the batches
+    postgres_pool = create_connection_pool(
+        config.POSTGRES_URL,
+        min_size=1,
+        max_size=2,
+        max_lifetime_seconds=config.POSTGRES_POOL_MAX_LIFETIME_SECONDS,
+        max_idle_seconds=config.POSTGRES_POOL_MAX_IDLE_SECONDS,
+        timeout_seconds=config.POSTGRES_POOL_TIMEOUT_SECONDS,
+    )
+    idempotency_repo = PostgresIdempotencyRepository(postgres_pool)
+    idempotency_repo.check_schema()
+    retention_service = IdempotencyRetentionService(
+        idempotency_repo,
+        resource_paths=HANDLED_EVENTS,
+        retention_seconds=config.IDEMPOTENCY_RETENTION_SECONDS,
+        batch_size=config.IDEMPOTENCY_PURGE_BATCH_SIZE,
+        batch_pause_seconds=config.IDEMPOTENCY_PURGE_BATCH_PAUSE_SECONDS,
+    )
+
+    return IdempotencyPurgeContainer(
+        retention_service=retention_service,
+        postgres_pool=postgres_pool,
+    )
+
+
+def build_outbox_relay_container(config: Config) -> OutboxRelayContainer:
+    """Wire the outbox relay; it claims events like the consumer does."""
+    search_engine = ElasticsearchEngine(
+        config.ELASTICSEARCH_URL,
+        transport=_elasticsearch_transport(config),
+        skip_unchanged=config.ELASTICSEARCH_SKIP_UNCHANGED,
+    )
+    _bootstrap_index(search_engine)
+    # The locked batch, the idempotency claims and the lease heartbeat each
+    # hold a connection while a batch is indexed
+    postgres_pool = create_connection_pool(
+        config.POSTGRES_URL,
+        min_size=1,
+        max_size=3,
+        max_lifetime_seconds=config.POSTGRES_POOL_MAX_LIFETIME_SECONDS,
+        max_idle_seconds=config.POSTGRES_POOL_MAX_IDLE_SECONDS,
+        timeout_seconds=config.POSTGRES_POOL_TIMEOUT_SECONDS,
+    )
+    idempotency_repo = PostgresIdempotencyRepository(postgres_pool)
+    idempotency_repo.check_schema()
+    outbox = PostgresOutboxRepository(postgres_pool)
+    idempotency_checker = _build_idempotency_checker(config, idempotency_repo)
+    relay_service = OutboxRelayService(
+        outbox,
+        ArticleJobHandler(ArticleService(search_engine), idempotency_checker),
+        batch_size=config.OUTBOX_BATCH_SIZE,
+        poll_interval_seconds=config.OUTBOX_POLL_INTERVAL_SECONDS,
+        retry_delay_seconds=config.OUTBOX_RETRY_DELAY_SECONDS,
+    )
+
+    return OutboxRelayContainer(
+        relay_service=relay_service,
+        idempotency_checker=idempotency_checker,
+        postgres_pool=postgres_pool,
+    )
+
+
+def _build_idempotency_checker(
+    config: Config, repo: PostgresIdempotencyRepository
+) -> IdempotencyChecker:
+    # The consumer and the outbox relay must claim in the same store
+    if config.IDEMPOTENCY_BACKEND is IdempotencyBackend.REDIS:
+        return RedisIdempotencyChecker(
+            Redis.from_url(config.REDIS_URL),
+            repo,
+            lease_ms=int(config.IDEMPOTENCY_LEASE_SECONDS * 1000),
+            completed_ttl_ms=int(config.IDEMPOTENCY_COMPLETED_TTL_SECONDS * 1000),
+            flush_interval_ms=config.IDEMPOTENCY_FLUSH_INTERVAL_MS,
+            flush_batch_size=config.IDEMPOTENCY_FLUSH_BATCH_SIZE,
+            max_pending_completions=config.IDEMPOTENCY_MAX_PENDING_COMPLETIONS,
+        )
+    return PostgresIdempotencyChecker(
+        repo=repo,
+        lease_seconds=config.IDEMPOTENCY_LEASE_SECONDS,
+    )
+
+
+def _create_reindex_pool(config: Config) -> ConnectionPool:
+    # A reindex streams through a single cursor
+    return create_connection_pool(
+        config.POSTGRES_URL,
+        min_size=1,
+        max_size=1,
+        max_lifetime_seconds=config.POSTGRES_POOL_MAX_LIFETIME_SECONDS,
+        max_idle_seconds=config.POSTGRES_POOL_MAX_IDLE_SECONDS,
+        timeout_seconds=config.POSTGRES_POOL_TIMEOUT_SECONDS,
+    )
+
+
+def _elasticsearch_transport(config: Config) -> TransportSettings:
+    return TransportSettings(
+        connections_per_node=config.ELASTICSEARCH_CONNECTIONS_PER_NODE,
+        http_compress=config.ELASTICSEARCH_HTTP_COMPRESS,
+        request_timeout_seconds=config.ELASTICSEARCH_REQUEST_TIMEOUT_SECONDS,
+        bulk_timeout_seconds=config.ELASTICSEARCH_BULK_TIMEOUT_SECONDS,
+        max_retries=config.ELASTICSEARCH_MAX_RETRIES,
+        retry_on_timeout=config.ELASTICSEARCH_RETRY_ON_TIMEOUT,
+        sniff=config.ELASTICSEARCH_SNIFF,
+        sniff_interval_seconds=config.ELASTICSEARCH_SNIFF_INTERVAL_SECONDS,
+    )
+
+
+def _build_metrics(config: Config) -> WorkerMetrics:
+    """Prometheus collectors, or a no-op sink when metrics are disabled.
+
+    The HTTP endpoint is started by the entry point, not here.
+    """
+    if config.METRICS_ENABLED:
+        return PrometheusWorkerMetrics()
+    return NoopWorkerMetrics()
+
+
+def _build_completed_key_cache(
+    config: Config, metrics: WorkerMetrics
+) -> CompletedKeyCache:
+    return CompletedKeyCache(
+        max_entries=config.IDEMPOTENCY_CACHE_SIZE,
+        ttl_seconds=config.IDEMPOTENCY_CACHE_TTL_SECONDS,
+        metrics=metrics,
+    )
+
+
+def _bootstrap_index(search_engine: SearchEngine) -> None:
+    """Create the search index once at startup instead of per document.
+
+    If Elasticsearch is not reachable yet the engine retries lazily on the
+    first write, so a slow Elasticsearch does not stop the worker starting.
+    """
+    try:
+        search_engine.ensure_index_exists()
+    except Exception as exc:
+        logger.warning("Could not bootstrap Elasticsearch index: {}", exc)
+
+
+def _build_async_container(config: Config) -> Container:
+    """Wire the asyncio runtime (aio-pika, AsyncConnection, AsyncElasticsearch).
+
+    The async Postgres pool is returned unopened and the search index is not
+    bootstrapped yet; both have to happen on the running event loop.
+    """
+    if config.BATCH_SIZE > 1:
+        logger.warning(
+            "BATCH_SIZE is ignored by the asyncio runtime; "
+            "use ASYNC_MAX_CONCURRENCY to control throughput"
+        )
+
+    metrics = _build_metrics(config)
+    search_engine = AsyncElasticsearchEngine(
+        config.ELASTICSEARCH_URL,
+        transport=_elasticsearch_transport(config),
+        metrics=metrics,
+        skip_unchanged=config.ELASTICSEARCH_SKIP_UNCHANGED,
+    )
+    postgres_pool = create_async_connection_pool(
+        config.POSTGRES_URL,
+        min_size=config.POSTGRES_POOL_MIN_SIZE,
+        max_size=config.POSTGRES_POOL_MAX_SIZE,
+        max_lifetime_seconds=config.POSTGRES_POOL_MAX_LIFETIME_SECONDS,
+        max_idle_seconds=config.POSTGRES_POOL_MAX_IDLE_SECONDS,
+        timeout_seconds=config.POSTGRES_POOL_TIMEOUT_SECONDS,
     )
+    idempotency_repo = AsyncPostgresIdempotencyRepository(postgres_pool)
+    idempotency_checker: AsyncIdempotencyChecker = AsyncPostgresIdempotencyChecker(
+        repo=idempotency_repo,
+        lease_seconds=config.IDEMPOTENCY_LEASE_SECONDS,
+    )
+    if config.IDEMPOTENCY_CACHE_SIZE > 0:
+        idempotency_checker = AsyncCachingIdempotencyChecker(
+            idempotency_checker, _build_completed_key_cache(config, metrics)
+        )
 
+    article_service = AsyncArticleService(search_engine)
+    article_job_handler = AsyncArticleJobHandler(
+        article_service, idempotency_checker, metrics
+    )
 
+    article_message_consumer = AioPikaConsumer(
+        config.RABBITMQ_URL,
+        namespace="news",
+        events_exchange="news.events",
+        queue_callbacks={'news.created': article_job_handler.handle_message},
+        max_concurrency=config.ASYNC_MAX_CONCURRENCY,
+        max_retries=config.MAX_RETRIES,
+        initial_backoff_seconds=config.INITIAL_BACKOFF_SECONDS,
+        max_backoff_seconds=config.MAX_BACKOFF_SECONDS,
+        backoff_multiplier=config.BACKOFF_MULTIPLIER,
+        metrics=metrics,
+        queue_depth_interval_seconds=config.METRICS_QUEUE_DEPTH_INTERVAL_SECONDS,
+        in_progress_retry_delay_ms=config.IN_PROGRESS_RETRY_DELAY_MS,
+        reconnect_initial_seconds=config.RABBITMQ_RECONNECT_INITIAL_SECONDS,
+        reconnect_max_seconds=config.RABBITMQ_RECONNECT_MAX_SECONDS,
+        drain_timeout_seconds=config.SHUTDOWN_DRAIN_TIMEOUT_SECONDS,
+        log_summary_interval_seconds=config.LOG_SUMMARY_INTERVAL_SECONDS,
+    )
+
+    return Container(
+        article_service=article_service,
+        article_job_handler=article_job_handler,
+        article_message_consumer=article_message_consumer,
+        idempotency_checker=idempotency_checker,
+        idempotency_repo=idempotency_repo,
+        search_engine=search_engine,
+        postgres_pool=postgres_pool,
+        metrics=metrics,
+    )
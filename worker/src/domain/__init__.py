@@ -8,20 +8,23 @@ This package contains:
 
 from .article import (
     Article,
+    ArticleIndexingError,
     ArticleNotFoundError,
     InvalidJobMessageError,
     MessageRequeueError,
 )
 from .article.ports import ArticleRepository
-from .search.ports import SearchEngine
+from .search.ports import IndexResult, SearchEngine
 from .message_queue.ports import MessageConsumer
 
 __all__ = [
     "Article",
+    "ArticleIndexingError",
     "ArticleNotFoundError",
     "InvalidJobMessageError",
     "MessageRequeueError",
     "ArticleRepository",
+    "IndexResult",
     "SearchEngine",
     "MessageConsumer",
 ]
@@ -1,16 +1,21 @@
 """Article aggregate and related errors/ports."""
 
-from .article import Article
+from .article import Article, content_hash
 from .errors import (
+    ArticleIndexingError,
     ArticleNotFoundError,
+    IndexMigrationError,
     InvalidJobMessageError,
     MessageRequeueError,
 )
 
 __all__ = [
     "Article",
+    "ArticleIndexingError",
     "ArticleNotFoundError",
+    "IndexMigrationError",
     "InvalidJobMessageError",
     "MessageRequeueError",
+    "content_hash",
 ]
 
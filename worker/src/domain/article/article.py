@@ -1,7 +1,10 @@
+import hashlib
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from uuid import UUID
 
+import msgspec
+
 
 @dataclass
 class Article:
@@ -13,5 +16,35 @@ class Article:
     link: str
     created_at: datetime
     updated_at: datetime
+    # `content_hash` of the fields above, when the caller computed it
+    content_hash: str | None = None
+
+
+def content_hash(article: Article) -> str:
+    """Stable digest of everything an article's search document holds.
+
+    Equal for two articles exactly when they hold the same values, in any
+    process and whichever source they were read from, so a stored hash
+    tells whether a write would change the document. Timestamps are
+    compared in UTC at millisecond precision: events carry them that way,
+    while rows read back from Postgres have microseconds and the session's
+    time zone.
+    """
+    fields = (
+        str(article.id),
+        article.title,
+        article.content,
+        article.source,
+        article.author,
+        article.link,
+        _utc_milliseconds(article.created_at),
+        _utc_milliseconds(article.updated_at),
+    )
+    return hashlib.blake2b(msgspec.json.encode(fields), digest_size=16).hexdigest()
 
 
+def _utc_milliseconds(value: datetime) -> str:
+    """``value`` in UTC, truncated to milliseconds; naive values are UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat(timespec="milliseconds")
@@ -6,11 +6,18 @@ class InvalidJobMessageError(Exception):
     """Raised when a job message has an invalid format or data."""
 
 
+class ArticleIndexingError(Exception):
+    """Raised when the search engine rejects an article document."""
+
+
 class MessageRequeueError(Exception):
-    """Raised when a message should be requeued immediately without retry counting.
+    """Raised when a message should be requeued after a short delay without retry counting.
     
     This is used for transient conditions like IN_PROGRESS status where
-    the message should be retried immediately, not counted as a failure.
+    another worker holds the message's claim; the message is tried again
+    shortly and not counted as a failure.
     """
 
 
+class IndexMigrationError(Exception):
+    """Raised when a search index migration cannot be completed."""
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from uuid import UUID
 
 from src.domain.article import Article
@@ -11,4 +12,12 @@ class ArticleRepository(ABC):
         """Fetch an article by its ID."""
         raise NotImplementedError
 
+    @abstractmethod
+    def iter_articles(
+        self, after_id: UUID | None = None, chunk_size: int = 1000
+    ) -> Iterator[list[Article]]:
+        """Stream every article ordered by ID, in chunks of ``chunk_size``.
 
+        With ``after_id`` set, streaming resumes after that article.
+        """
+        raise NotImplementedError
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from contextlib import AbstractContextManager
 from enum import Enum
 
 
@@ -12,6 +14,10 @@ class IdempotencyStatus(str, Enum):
     COMPLETED = "COMPLETED"
 
 
+# An (event_id, resource_key) pair, as taken by the batch methods
+IdempotencyKey = tuple[str, str]
+
+
 class IdempotencyChecker(ABC):
     @abstractmethod
     def check_and_claim(self, event_id: str, resource_key: str) -> IdempotencyStatus:
@@ -36,4 +42,71 @@ class IdempotencyChecker(ABC):
 
         raise NotImplementedError
 
+    def check_and_claim_many(
+        self, keys: Sequence[IdempotencyKey]
+    ) -> list[IdempotencyStatus]:
+        """Batch variant of `check_and_claim`, returning one status per key.
+
+        Equivalent to claiming the keys one by one in order, so a key that
+        appears twice is NEW at most once. The default implementation does
+        exactly that; backends override it to claim in a few round trips.
+        """
+        return [self.check_and_claim(event_id, key) for event_id, key in keys]
+
+    def mark_completed_many(self, keys: Sequence[IdempotencyKey]) -> None:
+        """Batch variant of `mark_completed`."""
+        for event_id, resource_key in keys:
+            self.mark_completed(event_id, resource_key)
+
+    def mark_failed_many(self, keys: Sequence[IdempotencyKey]) -> None:
+        """Batch variant of `mark_failed`."""
+        for event_id, resource_key in keys:
+            self.mark_failed(event_id, resource_key)
+
+    def close(self) -> None:
+        """Flush buffered writes and stop background work, if any."""
+
+
+class AsyncIdempotencyChecker(ABC):
+    """Asyncio variant of `IdempotencyChecker` with the same guarantees."""
 
+    @abstractmethod
+    async def check_and_claim(
+        self, event_id: str, resource_key: str
+    ) -> IdempotencyStatus:
+        """Check current status and claim the idempotency key if it's new."""
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def mark_completed(self, event_id: str, resource_key: str) -> None:
+        """Mark the idempotency key as COMPLETED so future calls can short-circuit."""
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def mark_failed(self, event_id: str, resource_key: str) -> None:
+        """Mark the idempotency key as failed/clear it to allow retry."""
+
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """Stop background work, if any."""
+
+
+class CompletedKeyPurger(ABC):
+    """Deletes COMPLETED idempotency keys past their retention horizon."""
+
+    @abstractmethod
+    def purge_lock(self) -> AbstractContextManager[bool]:
+        """Try to become the only purger; yields whether the lock was taken."""
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def purge_completed(
+        self, resource_paths: Sequence[str], older_than_seconds: float, limit: int
+    ) -> int:
+        """Delete up to ``limit`` old COMPLETED keys; returns how many."""
+
+        raise NotImplementedError
@@ -2,6 +2,10 @@
 
 from abc import ABC, abstractmethod
 
+# Result of handling one message in a batch: the boolean a single-message
+# callback would have returned, or the exception it would have raised.
+HandlerResult = bool | Exception
+
 
 class MessageConsumer(ABC):
     """Port for consuming messages from a queue."""
@@ -10,4 +14,22 @@ class MessageConsumer(ABC):
     def start_consuming(self) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    def stop(self) -> None:
+        """Stop taking deliveries, drain in-flight ones and return from
+        `start_consuming`. Safe to call from a signal handler."""
+        raise NotImplementedError
+
+
+class AsyncMessageConsumer(ABC):
+    """Port for consuming messages from a queue on an asyncio event loop."""
 
+    @abstractmethod
+    async def start_consuming(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def stop(self) -> None:
+        """Stop taking deliveries, drain in-flight ones and return from
+        `start_consuming`. Must be called on the consumer's event loop."""
+        raise NotImplementedError
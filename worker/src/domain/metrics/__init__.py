@@ -0,0 +1 @@
+"""Metrics-related domain ports."""
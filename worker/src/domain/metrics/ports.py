@@ -0,0 +1,139 @@
+"""Metrics-related ports (interfaces)."""
+
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+from enum import Enum
+
+
+class DeliveryOutcome(str, Enum):
+    """How a consumed delivery was settled."""
+
+    ACKED = "acked"
+    REQUEUED = "requeued"
+    RETRIED = "retried"
+    DEAD_LETTERED = "dead_lettered"
+
+
+class DocumentOutcome(str, Enum):
+    """What indexing an article did to its search document."""
+
+    WRITTEN = "written"
+    # The stored document already had the article's content hash
+    UNCHANGED = "unchanged"
+    # The stored document is a newer version of the article
+    STALE = "stale"
+
+
+class Stage(str, Enum):
+    """Timed stages of handling one job message."""
+
+    PARSE = "parse"
+    CLAIM = "claim"
+    INDEX = "index"
+    MARK_COMPLETED = "mark_completed"
+
+
+class WorkerMetrics(ABC):
+    """Port for recording worker throughput and latency metrics."""
+
+    @abstractmethod
+    def message_consumed(self, queue: str) -> None:
+        """Count a delivery received from ``queue``."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def message_settled(self, queue: str, outcome: DeliveryOutcome) -> None:
+        """Count how a delivery from ``queue`` was settled."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def observe_stage(self, stage: Stage, seconds: float) -> None:
+        """Record how long one run of ``stage`` took."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_in_flight(self, queue: str, count: int) -> None:
+        """Set the number of deliveries from ``queue`` not yet settled."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_queue_depth(self, queue: str, depth: int) -> None:
+        """Set the number of ready messages in ``queue`` (e.g. a retry queue)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def cache_lookup(self, cache: str, hit: bool) -> None:
+        """Count a hit or miss of the in-process cache named ``cache``."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_broker_connected(self, connected: bool) -> None:
+        """Record whether the consumer currently has a broker connection."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def observe_reconnect(self, downtime_seconds: float) -> None:
+        """Count a reconnect after ``downtime_seconds`` without a connection."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def observe_search_request(self, node: str, status: str, seconds: float) -> None:
+        """Record one HTTP request to search ``node`` and its response status.
+
+        ``status`` is the HTTP status code, or ``"error"`` when no response
+        arrived (connection failure or timeout).
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def documents_indexed(self, outcome: DocumentOutcome, count: int = 1) -> None:
+        """Count ``count`` articles whose indexing had ``outcome``."""
+        raise NotImplementedError
+
+    @contextmanager
+    def time_stage(self, stage: Stage) -> Iterator[None]:
+        """Time the body of a ``with`` block as one run of ``stage``.
+
+        The duration is recorded whether or not the block raises.
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe_stage(stage, time.perf_counter() - started)
+
+
+class NoopWorkerMetrics(WorkerMetrics):
+    """Metrics sink that discards everything; used when metrics are disabled."""
+
+    def message_consumed(self, queue: str) -> None:
+        pass
+
+    def message_settled(self, queue: str, outcome: DeliveryOutcome) -> None:
+        pass
+
+    def observe_stage(self, stage: Stage, seconds: float) -> None:
+        pass
+
+    def set_in_flight(self, queue: str, count: int) -> None:
+        pass
+
+    def set_queue_depth(self, queue: str, depth: int) -> None:
+        pass
+
+    def cache_lookup(self, cache: str, hit: bool) -> None:
+        pass
+
+    def set_broker_connected(self, connected: bool) -> None:
+        pass
+
+    def observe_reconnect(self, downtime_seconds: float) -> None:
+        pass
+
+    def observe_search_request(self, node: str, status: str, seconds: float) -> None:
+        pass
+
+    def documents_indexed(self, outcome: DocumentOutcome, count: int = 1) -> None:
+        pass
@@ -0,0 +1 @@
+"""Outbox-related domain ports."""
@@ -0,0 +1,51 @@
+"""Ports of the transactional outbox the API writes next to each article."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class OutboxEntry:
+    """One outbox row: the event envelope exactly as the API published it."""
+
+    id: int
+    body: bytes
+
+
+@dataclass
+class OutboxBatch:
+    """Entries locked by one relay, and what the relay did with them.
+
+    Entries whose IDs the relay adds to ``done`` are deleted, those in
+    ``deferred`` are hidden from relays for the retry delay; the rest are
+    unlocked as they were.
+    """
+
+    entries: list[OutboxEntry]
+    done: list[int] = field(default_factory=list)
+    deferred: list[int] = field(default_factory=list)
+
+
+class Outbox(ABC):
+    """Source of events that were saved but maybe never published."""
+
+    @abstractmethod
+    def lock_batch(
+        self, limit: int, retry_delay_seconds: float
+    ) -> AbstractContextManager[OutboxBatch]:
+        """Lock up to ``limit`` due entries that no other relay has locked.
+
+        The entries stay locked while the context is open; ``done`` and
+        ``deferred`` are applied when it exits without an error.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def wait_for_entries(self, timeout_seconds: float) -> None:
+        """Block until new entries may be due, or ``timeout_seconds`` passed."""
+
+        raise NotImplementedError
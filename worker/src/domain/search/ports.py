@@ -1,10 +1,25 @@
 """Search-related ports (interfaces)."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+from uuid import UUID
 
 from src.domain.article import Article
 
 
+@dataclass(frozen=True)
+class IndexResult:
+    """Outcome of indexing a single article as part of a batch."""
+
+    article_id: UUID
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
 class SearchEngine(ABC):
     """Port for search indexing."""
 
@@ -18,4 +33,64 @@ class SearchEngine(ABC):
         """Index an article for search."""
         raise NotImplementedError
 
+    @abstractmethod
+    def index_articles(self, articles: Sequence[Article]) -> list[IndexResult]:
+        """Index several articles in one request.
+
+        Returns one result per article, in the same order as ``articles``.
+        Failures of individual documents are reported through the result
+        instead of being raised, so callers can settle each item on its own.
+        """
+        raise NotImplementedError
+
 
+class AsyncSearchEngine(ABC):
+    """Asyncio variant of `SearchEngine`."""
+
+    @abstractmethod
+    async def ensure_index_exists(self) -> None:
+        """Ensure the underlying search index exists and is ready."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def index_article(self, article: Article) -> None:
+        """Index an article for search."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def index_articles(self, articles: Sequence[Article]) -> list[IndexResult]:
+        """Index several articles in one request; see `SearchEngine`."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release the underlying client."""
+        raise NotImplementedError
+
+
+class SearchIndexMigrator(ABC):
+    """Port for moving documents to a new index without downtime.
+
+    Indices are identified by their concrete name. While a migration is in
+    progress every write goes to both the live index and the new one.
+    """
+
+    @abstractmethod
+    def live_index(self) -> str | None:
+        """Name of the index readers currently search, if any."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def start(self, index: str) -> None:
+        """Create ``index`` tuned for bulk loading and start dual writes to it."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def complete(self, index: str) -> None:
+        """Restore normal settings on ``index`` and atomically make it live."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def abort(self, index: str) -> None:
+        """Stop writing to ``index`` and delete it, leaving the live index as is."""
+        raise NotImplementedError
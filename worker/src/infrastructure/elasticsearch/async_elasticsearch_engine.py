@@ -0,0 +1,265 @@
+import time
+from collections.abc import Sequence
+
+from elasticsearch import (
+    AsyncElasticsearch,
+    BadRequestError,
+    ConflictError,
+    NotFoundError,
+)
+from elasticsearch.helpers import async_streaming_bulk
+from loguru import logger
+
+from src.domain.article import Article
+from src.domain.metrics.ports import DocumentOutcome, NoopWorkerMetrics, WorkerMetrics
+from src.domain.search.ports import AsyncSearchEngine, IndexResult
+from src.infrastructure.elasticsearch.elasticsearch_engine import (
+    ARTICLES_INDEX_BODY,
+    INDEX_NOT_FOUND,
+    INDEX_VERSION,
+    READ_ALIAS,
+    VERSION_CONFLICT,
+    VERSION_TYPE,
+    WRITE_ALIAS,
+    WRITE_TARGETS_TTL_SECONDS,
+    added_properties,
+    article_document,
+    bulk_index_action,
+    bulk_index_result,
+    default_aliases,
+    document_version,
+    is_index_not_found_item,
+    is_version_conflict_item,
+    merge_target_outcomes,
+    stored_hash_lookups,
+    unchanged_positions,
+    versioned_index_name,
+)
+from src.infrastructure.elasticsearch.transport import (
+    TransportSettings,
+    create_async_client,
+)
+
+
+class AsyncElasticsearchEngine(AsyncSearchEngine):
+    """`AsyncElasticsearch` counterpart of `ElasticsearchEngine`.
+
+    Writes the same indices, aliases and versioned documents as the
+    synchronous engine, and skips unchanged and stale articles the same way.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        transport: TransportSettings | None = None,
+        metrics: WorkerMetrics | None = None,
+        skip_unchanged: bool = True,
+    ):
+        self._url = url
+        self._transport = transport or TransportSettings()
+        self._metrics = metrics or NoopWorkerMetrics()
+        self._skip_unchanged = skip_unchanged
+        self._index_ready = False
+        self._write_targets: list[str] = []
+        self._write_targets_expire_at = 0.0
+        try:
+            self._client = create_async_client(url, self._transport, metrics)
+        except Exception as exc:
+            logger.error("Failed to connect to Elasticsearch: {}", exc)
+            raise
+
+    def _get_client(self) -> AsyncElasticsearch:
+        return self._client
+
+    async def ensure_index_exists(self) -> None:
+        """Create the current index version and its aliases if missing."""
+        es = self._get_client()
+
+        if not await es.indices.exists_alias(name=WRITE_ALIAS):
+            if await es.indices.exists(index=READ_ALIAS):
+                await es.indices.put_alias(index=READ_ALIAS, name=WRITE_ALIAS)
+                logger.info("Added write alias {} to {}", WRITE_ALIAS, READ_ALIAS)
+            else:
+                await self._create_index(
+                    versioned_index_name(INDEX_VERSION),
+                    {**ARTICLES_INDEX_BODY, "aliases": default_aliases()},
+                )
+        await self._put_added_properties()
+        self._index_ready = True
+
+    async def _put_added_properties(self) -> None:
+        try:
+            await self._get_client().indices.put_mapping(
+                index=WRITE_ALIAS, properties=added_properties()
+            )
+        except BadRequestError as exc:
+            logger.warning("Could not add new fields to {}: {}", WRITE_ALIAS, exc)
+
+    async def _create_index(self, index: str, body: dict) -> None:
+        try:
+            await self._get_client().indices.create(index=index, body=body)
+            logger.info("Created Elasticsearch index: {}", index)
+        except BadRequestError as exc:
+            if exc.error != "resource_already_exists_exception":
+                raise
+
+    async def _ensure_index_ready(self) -> None:
+        if not self._index_ready:
+            await self.ensure_index_exists()
+
+    async def _recreate_index(self) -> None:
+        logger.warning("Elasticsearch write index is missing; recreating it")
+        self._index_ready = False
+        self._write_targets_expire_at = 0.0
+        await self.ensure_index_exists()
+
+    async def _resolve_write_targets(self) -> list[str]:
+        """Concrete indices every document has to be written to."""
+        now = time.monotonic()
+        if now >= self._write_targets_expire_at:
+            es = self._get_client()
+            try:
+                aliases = await es.indices.get_alias(name=WRITE_ALIAS)
+            except NotFoundError:
+                await self._recreate_index()
+                aliases = await es.indices.get_alias(name=WRITE_ALIAS)
+            self._write_targets = sorted(aliases.body)
+            self._write_targets_expire_at = now + WRITE_TARGETS_TTL_SECONDS
+        return self._write_targets
+
+    async def index_article(self, article: Article) -> None:
+        """Index an article document, unless it is already indexed as is."""
+        await self._ensure_index_ready()
+
+        if await self._unchanged_positions([article]):
+            self._metrics.documents_indexed(DocumentOutcome.UNCHANGED)
+            logger.debug("Article {} unchanged in Elasticsearch", article.id)
+            return
+
+        try:
+            try:
+                written = await self._index_into_targets(article)
+            except NotFoundError as exc:
+                if exc.error != INDEX_NOT_FOUND:
+                    raise
+                await self._recreate_index()
+                written = await self._index_into_targets(article)
+        except Exception as exc:
+            logger.error(
+                "Failed to index article {} in Elasticsearch: {}", article.id, exc
+            )
+            raise
+
+        if written:
+            self._metrics.documents_indexed(DocumentOutcome.WRITTEN)
+            logger.debug("Indexed article {} in Elasticsearch", article.id)
+        else:
+            self._metrics.documents_indexed(DocumentOutcome.STALE)
+            logger.debug("Article {} has a newer version indexed", article.id)
+
+    async def _index_into_targets(self, article: Article) -> bool:
+        """Write to every target; whether any of them took this version."""
+        es = self._get_client()
+        doc = article_document(article)
+        written = False
+        for index in await self._resolve_write_targets():
+            try:
+                await es.index(
+                    index=index,
+                    id=str(article.id),
+                    document=doc,
+                    version=document_version(article),
+                    version_type=VERSION_TYPE,
+                )
+                written = True
+            except ConflictError as exc:
+                if exc.error != VERSION_CONFLICT:
+                    raise
+        return written
+
+    async def index_articles(self, articles: Sequence[Article]) -> list[IndexResult]:
+        """Index a batch of article documents through the ``_bulk`` API."""
+        if not articles:
+            return []
+
+        await self._ensure_index_ready()
+
+        unchanged = await self._unchanged_positions(articles)
+        changed = [
+            article
+            for position, article in enumerate(articles)
+            if position not in unchanged
+        ]
+        outcomes = await self._write_articles(changed) if changed else []
+        written = iter(outcomes)
+        results = [
+            IndexResult(article.id)
+            if position in unchanged
+            else bulk_index_result(article, *next(written))
+            for position, article in enumerate(articles)
+        ]
+
+        stale = sum(ok and is_version_conflict_item(item) for ok, item in outcomes)
+        written_ok = sum(ok for ok, _ in outcomes) - stale
+        self._metrics.documents_indexed(DocumentOutcome.UNCHANGED, len(unchanged))
+        self._metrics.documents_indexed(DocumentOutcome.STALE, stale)
+        self._metrics.documents_indexed(DocumentOutcome.WRITTEN, written_ok)
+        return results
+
+    async def _unchanged_positions(self, articles: Sequence[Article]) -> set[int]:
+        """Positions of the articles whose stored documents have their hash."""
+        if not self._skip_unchanged or not any(
+            article.content_hash for article in articles
+        ):
+            return set()
+
+        targets = await self._resolve_write_targets()
+        try:
+            response = await self._get_client().mget(
+                docs=stored_hash_lookups(articles, targets),
+                source_includes=["content_hash"],
+            )
+        except Exception as exc:
+            logger.warning("Could not look up stored content hashes: {}", exc)
+            return set()
+        return unchanged_positions(articles, response["docs"], len(targets))
+
+    async def _write_articles(
+        self, articles: Sequence[Article]
+    ) -> list[tuple[bool, dict]]:
+        outcomes = await self._bulk(articles)
+        missing = [
+            position
+            for position, (ok, item) in enumerate(outcomes)
+            if not ok and is_index_not_found_item(item)
+        ]
+        if missing:
+            await self._recreate_index()
+            retried = await self._bulk([articles[position] for position in missing])
+            for position, outcome in zip(missing, retried):
+                outcomes[position] = outcome
+        return outcomes
+
+    async def _bulk(self, articles: Sequence[Article]) -> list[tuple[bool, dict]]:
+        targets = await self._resolve_write_targets()
+        actions = (
+            bulk_index_action(index, article)
+            for article in articles
+            for index in targets
+        )
+        outcomes = [
+            outcome
+            async for outcome in async_streaming_bulk(
+                self._get_client().options(
+                    request_timeout=self._transport.bulk_timeout_seconds
+                ),
+                actions,
+                chunk_size=len(articles) * len(targets),
+                raise_on_error=False,
+                raise_on_exception=False,
+            )
+        ]
+        return merge_target_outcomes(outcomes, len(targets))
+
+    async def close(self) -> None:
+        await self._client.close()
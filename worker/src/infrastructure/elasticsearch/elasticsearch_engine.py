@@ -1,17 +1,113 @@
-from elasticsearch import Elasticsearch
+import time
+from collections.abc import Sequence
+
+from elasticsearch import BadRequestError, ConflictError, Elasticsearch, NotFoundError
+from elasticsearch.helpers import streaming_bulk
 from loguru import logger
 
 from src.domain.article import Article
-from src.domain.search.ports import SearchEngine
+from src.domain.metrics.ports import DocumentOutcome, NoopWorkerMetrics, WorkerMetrics
+from src.domain.search.ports import IndexResult, SearchEngine
+from src.infrastructure.elasticsearch.transport import (
+    TransportSettings,
+    create_client,
+)
+
+INDEX_NOT_FOUND = "index_not_found_exception"
+VERSION_CONFLICT = "version_conflict_engine_exception"
+
+# Documents are versioned by the article's updated_at, so a delivery that
+# arrives after a newer one for the same article is rejected instead of
+# overwriting it. The same version is accepted again, for reindexing.
+VERSION_TYPE = "external_gte"
+
+# Documents live in versioned indices (articles_v1, articles_v2, ...). Readers
+# such as the API search the read alias; the worker writes to every index
+# behind the write alias, which holds two indices while a migration catches
+# up. Bump INDEX_VERSION whenever ARTICLES_INDEX_BODY changes in a way
+# existing indices cannot take and run `news-worker migrate-index`.
+INDEX_VERSION = 1
+READ_ALIAS = "articles"
+WRITE_ALIAS = "articles_write"
+
+# How long the indices behind the write alias are cached. A migration waits
+# at least this long after enabling dual writes before it starts backfilling.
+WRITE_TARGETS_TTL_SECONDS = 10.0
+
+ARTICLES_INDEX_BODY = {
+    "mappings": {
+        "properties": {
+            "id": {"type": "keyword"},
+            "title": {
+                "type": "text",
+                "analyzer": "standard",
+                "fields": {
+                    "raw": { "type": "keyword" },
+                    "autocomplete": {
+                        "type": "search_as_you_type"
+                    }
+                }
+            },
+            "content": {
+                "type": "text",
+                "analyzer": "standard",
+                "fields": {
+                    "raw": { "type": "keyword" } 
+                }
+            },
+            "source": {"type": "keyword"},
+            "author": {"type": "keyword"},
+            "link": {"type": "keyword"},
+            "created_at": {"type": "date"},
+            "updated_at": {"type": "date"},
+            # Only read back by ID to skip unchanged writes, never searched
+            "content_hash": {"type": "keyword", "index": False},
+        }
+    }
+}
+
+# Fields added to ARTICLES_INDEX_BODY since INDEX_VERSION was last bumped.
+# Adding a field needs no new index: `ensure_index_exists` puts them on the
+# indices behind the write alias.
+ADDED_PROPERTIES = ("content_hash",)
 
 
 class ElasticsearchEngine(SearchEngine):
-    _INDEX_NAME = "articles"
+    """Indexes articles into the indices behind `WRITE_ALIAS`.
+
+    With ``write_index`` set, documents go to that concrete index only; the
+    index migration uses this to backfill a new index before it goes live.
+    Requests to every node are timed into ``metrics``.
+
+    With ``skip_unchanged``, articles of a batch carrying a ``content_hash``
+    are first looked up in one ``_mget``, and those whose stored documents
+    already have that hash in every write target are not written again.
 
-    def __init__(self, url: str):
+    Documents are written with `document_version` as their external
+    version. A target that already holds a newer version rejects the write;
+    the article then counts as indexed, since the index is already ahead.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        write_index: str | None = None,
+        transport: TransportSettings | None = None,
+        metrics: WorkerMetrics | None = None,
+        skip_unchanged: bool = True,
+    ):
         self._url = url
+        self._write_index = write_index
+        self._transport = transport or TransportSettings()
+        self._metrics = metrics or NoopWorkerMetrics()
+        self._skip_unchanged = skip_unchanged
+        # Whether the index is known to exist; checked once, then only
+        # re-checked after a write reports the index missing.
+        self._index_ready = False
+        self._write_targets: list[str] = []
+        self._write_targets_expire_at = 0.0
         try:
-            self._client = Elasticsearch([url])
+            self._client = create_client(url, self._transport, metrics)
         except Exception as exc:
             logger.error("Failed to connect to Elasticsearch: {}", exc)
             raise
@@ -20,70 +116,351 @@ class ElasticsearchEngine(SearchEngine):
         return self._client
 
     def ensure_index_exists(self) -> None:
-        """Create the index if it doesn't already exist."""
+        """Create the current index version and its aliases if missing.
+
+        A concrete ``articles`` index from before index versioning is kept
+        and put behind the write alias, until `news-worker migrate-index`
+        moves it to a versioned index.
+        """
         es = self._get_client()
 
-        if es.indices.exists(index=self._INDEX_NAME):
-            # delete
-            # es.indices.delete(index=self._INDEX_NAME)
-            return
+        if self._write_index is not None:
+            self._create_index(self._write_index, ARTICLES_INDEX_BODY)
+        elif not es.indices.exists_alias(name=WRITE_ALIAS):
+            if es.indices.exists(index=READ_ALIAS):
+                es.indices.put_alias(index=READ_ALIAS, name=WRITE_ALIAS)
+                logger.info("Added write alias {} to {}", WRITE_ALIAS, READ_ALIAS)
+            else:
+                self._create_index(
+                    versioned_index_name(INDEX_VERSION),
+                    {**ARTICLES_INDEX_BODY, "aliases": default_aliases()},
+                )
+        self._put_added_properties(self._write_index or WRITE_ALIAS)
+        self._index_ready = True
 
-        mapping = {
-            "mappings": {
-                "properties": {
-                    "id": {"type": "keyword"},
-                    "title": {
-                        "type": "text",
-                        "analyzer": "standard",
-                        "fields": {
-                            "raw": { "type": "keyword" },
-                            "autocomplete": {
-                                "type": "search_as_you_type"
-                            }
-                        }
-                    },
-                    "content": {
-                        "type": "text",
-                        "analyzer": "standard",
-                        "fields": {
-                            "raw": { "type": "keyword" } 
-                        }
-                    },
-                    "source": {"type": "keyword"},
-                    "author": {"type": "keyword"},
-                    "link": {"type": "keyword"},
-                    "created_at": {"type": "date"},
-                    "updated_at": {"type": "date"},
-                }
-            }
-        }
+    def _put_added_properties(self, index: str) -> None:
+        """Add `ADDED_PROPERTIES` to the mapping of indices created without them."""
+        try:
+            self._get_client().indices.put_mapping(
+                index=index, properties=added_properties()
+            )
+        except BadRequestError as exc:
+            # Already mapped differently, e.g. dynamically before this field
+            # was declared; its values are still stored in _source
+            logger.warning("Could not add new fields to {}: {}", index, exc)
 
-        es.indices.create(index=self._INDEX_NAME, body=mapping)
-        logger.info("Created Elasticsearch index: {}", self._INDEX_NAME)
+    def _create_index(self, index: str, body: dict) -> None:
+        try:
+            self._get_client().indices.create(index=index, body=body)
+            logger.info("Created Elasticsearch index: {}", index)
+        except BadRequestError as exc:
+            # Another worker created it between our check and create
+            if exc.error != "resource_already_exists_exception":
+                raise
 
-    def index_article(self, article: Article) -> None:
-        """Index an article document."""
-        es = self._get_client()
+    def _ensure_index_ready(self) -> None:
+        if not self._index_ready:
+            self.ensure_index_exists()
+
+    def _recreate_index(self) -> None:
+        logger.warning("Elasticsearch write index is missing; recreating it")
+        self._index_ready = False
+        self._write_targets_expire_at = 0.0
         self.ensure_index_exists()
 
-        doc = {
-            "id": str(article.id),
-            "title": article.title,
-            "content": article.content,
-            "source": article.source,
-            "author": article.author,
-            "link": article.link,
-            "created_at": article.created_at.isoformat(),
-            "updated_at": article.updated_at.isoformat(),
-        }
+    def _resolve_write_targets(self) -> list[str]:
+        """Concrete indices every document has to be written to."""
+        if self._write_index is not None:
+            return [self._write_index]
+
+        now = time.monotonic()
+        if now >= self._write_targets_expire_at:
+            try:
+                aliases = self._get_client().indices.get_alias(name=WRITE_ALIAS)
+            except NotFoundError:
+                self._recreate_index()
+                aliases = self._get_client().indices.get_alias(name=WRITE_ALIAS)
+            self._write_targets = sorted(aliases.body)
+            self._write_targets_expire_at = now + WRITE_TARGETS_TTL_SECONDS
+        return self._write_targets
+
+    def index_article(self, article: Article) -> None:
+        """Index an article document, unless it is already indexed as is."""
+        self._ensure_index_ready()
+
+        if self._unchanged_positions([article]):
+            self._metrics.documents_indexed(DocumentOutcome.UNCHANGED)
+            logger.debug("Article {} unchanged in Elasticsearch", article.id)
+            return
 
         try:
-            es.index(index=self._INDEX_NAME, id=str(article.id), document=doc)
-            logger.info("Indexed article {} in Elasticsearch", article.id)
+            try:
+                written = self._index_into_targets(article)
+            except NotFoundError as exc:
+                if exc.error != INDEX_NOT_FOUND:
+                    raise
+                self._recreate_index()
+                written = self._index_into_targets(article)
         except Exception as exc:  # pragma: no cover - defensive logging
             logger.error(
                 "Failed to index article {} in Elasticsearch: {}", article.id, exc
             )
             raise
 
+        if written:
+            self._metrics.documents_indexed(DocumentOutcome.WRITTEN)
+            logger.debug("Indexed article {} in Elasticsearch", article.id)
+        else:
+            self._metrics.documents_indexed(DocumentOutcome.STALE)
+            logger.debug("Article {} has a newer version indexed", article.id)
+
+    def _index_into_targets(self, article: Article) -> bool:
+        """Write to every target; whether any of them took this version."""
+        es = self._get_client()
+        doc = article_document(article)
+        written = False
+        for index in self._resolve_write_targets():
+            try:
+                es.index(
+                    index=index,
+                    id=str(article.id),
+                    document=doc,
+                    version=document_version(article),
+                    version_type=VERSION_TYPE,
+                )
+                written = True
+            except ConflictError as exc:
+                if exc.error != VERSION_CONFLICT:
+                    raise
+        return written
+
+    def index_articles(self, articles: Sequence[Article]) -> list[IndexResult]:
+        """Index a batch of article documents through the ``_bulk`` API.
+
+        Articles that are already indexed as is, or as a newer version, count
+        as indexed without being written.
+        """
+        if not articles:
+            return []
+
+        self._ensure_index_ready()
+
+        unchanged = self._unchanged_positions(articles)
+        changed = [
+            article
+            for position, article in enumerate(articles)
+            if position not in unchanged
+        ]
+        outcomes = self._write_articles(changed) if changed else []
+        written = iter(outcomes)
+        results = [
+            IndexResult(article.id)
+            if position in unchanged
+            else bulk_index_result(article, *next(written))
+            for position, article in enumerate(articles)
+        ]
+
+        stale = sum(ok and is_version_conflict_item(item) for ok, item in outcomes)
+        written_ok = sum(ok for ok, _ in outcomes) - stale
+        self._metrics.documents_indexed(DocumentOutcome.UNCHANGED, len(unchanged))
+        self._metrics.documents_indexed(DocumentOutcome.STALE, stale)
+        self._metrics.documents_indexed(DocumentOutcome.WRITTEN, written_ok)
+        logger.debug(
+            "Bulk indexed {}/{} articles in Elasticsearch ({} unchanged, {} stale)",
+            written_ok,
+            len(changed),
+            len(unchanged),
+            stale,
+        )
+        return results
+
+    def _unchanged_positions(self, articles: Sequence[Article]) -> set[int]:
+        """Positions of the articles whose stored documents have their hash.
+
+        A failed lookup only costs the skip, so it writes everything.
+        """
+        if not self._skip_unchanged or not any(
+            article.content_hash for article in articles
+        ):
+            return set()
+
+        targets = self._resolve_write_targets()
+        try:
+            response = self._get_client().mget(
+                docs=stored_hash_lookups(articles, targets),
+                source_includes=["content_hash"],
+            )
+        except Exception as exc:
+            logger.warning("Could not look up stored content hashes: {}", exc)
+            return set()
+        return unchanged_positions(articles, response["docs"], len(targets))
+
+    def _write_articles(
+        self, articles: Sequence[Article]
+    ) -> list[tuple[bool, dict]]:
+        """``_bulk`` outcome per article, retried once if the index is gone."""
+        outcomes = self._bulk(articles)
+        missing = [
+            position
+            for position, (ok, item) in enumerate(outcomes)
+            if not ok and is_index_not_found_item(item)
+        ]
+        if missing:
+            self._recreate_index()
+            retried = self._bulk([articles[position] for position in missing])
+            for position, outcome in zip(missing, retried):
+                outcomes[position] = outcome
+        return outcomes
+
+    def _bulk(self, articles: Sequence[Article]) -> list[tuple[bool, dict]]:
+        targets = self._resolve_write_targets()
+        actions = (
+            bulk_index_action(index, article)
+            for article in articles
+            for index in targets
+        )
+
+        # Items come back in request order as long as nothing is retried
+        # inside the helper, so they line up with the input.
+        outcomes = list(
+            streaming_bulk(
+                self._get_client().options(
+                    request_timeout=self._transport.bulk_timeout_seconds
+                ),
+                actions,
+                chunk_size=len(articles) * len(targets),
+                raise_on_error=False,
+                raise_on_exception=False,
+            )
+        )
+        return merge_target_outcomes(outcomes, len(targets))
+
+
+def versioned_index_name(version: int) -> str:
+    """Concrete index holding version ``version`` of the mapping."""
+    return f"{READ_ALIAS}_v{version}"
+
+
+def default_aliases() -> dict:
+    """Aliases of a live index that is the only write target."""
+    return {READ_ALIAS: {}, WRITE_ALIAS: {"is_write_index": True}}
+
+
+def article_document(article: Article) -> dict:
+    """Build the Elasticsearch document for an article."""
+    document = {
+        "id": str(article.id),
+        "title": article.title,
+        "content": article.content,
+        "source": article.source,
+        "author": article.author,
+        "link": article.link,
+        "created_at": article.created_at.isoformat(),
+        "updated_at": article.updated_at.isoformat(),
+    }
+    if article.content_hash is not None:
+        document["content_hash"] = article.content_hash
+    return document
+
+
+def added_properties() -> dict:
+    """Mapping of `ADDED_PROPERTIES`, for ``put_mapping``."""
+    properties = ARTICLES_INDEX_BODY["mappings"]["properties"]
+    return {name: properties[name] for name in ADDED_PROPERTIES}
+
+
+def document_version(article: Article) -> int:
+    """External version of an article's document: ``updated_at`` in ms."""
+    return int(article.updated_at.timestamp() * 1000)
+
+
+def bulk_index_action(index: str, article: Article) -> dict:
+    """Build a ``_bulk`` index action for an article."""
+    return {
+        "_op_type": "index",
+        "_index": index,
+        "_id": str(article.id),
+        "_version": document_version(article),
+        "_version_type": VERSION_TYPE,
+        "_source": article_document(article),
+    }
+
+
+def bulk_index_result(article: Article, ok: bool, item: dict) -> IndexResult:
+    """Turn one item of a ``_bulk`` response into an `IndexResult`."""
+    if ok:
+        return IndexResult(article_id=article.id)
+
+    error = item.get("index", {}).get("error")
+    logger.error(
+        "Failed to bulk index article {} in Elasticsearch: {}",
+        article.id,
+        error,
+    )
+    return IndexResult(article_id=article.id, error=str(error))
+
+
+def stored_hash_lookups(articles: Sequence[Article], targets: Sequence[str]) -> list:
+    """``_mget`` docs for every article in every write target, grouped by article."""
+    return [
+        {"_index": index, "_id": str(article.id)}
+        for article in articles
+        for index in targets
+    ]
+
+
+def unchanged_positions(
+    articles: Sequence[Article], docs: Sequence[dict], targets: int
+) -> set[int]:
+    """Positions of the articles every target stores with the same hash.
+
+    ``docs`` is the ``_mget`` response to `stored_hash_lookups`; a missing
+    document or index never matches.
+    """
+    unchanged = set()
+    for position, article in enumerate(articles):
+        group = docs[position * targets : (position + 1) * targets]
+        if article.content_hash and all(
+            doc.get("found")
+            and doc.get("_source", {}).get("content_hash") == article.content_hash
+            for doc in group
+        ):
+            unchanged.add(position)
+    return unchanged
+
+
+def merge_target_outcomes(
+    outcomes: Sequence[tuple[bool, dict]], targets: int
+) -> list[tuple[bool, dict]]:
+    """Fold per-index ``_bulk`` outcomes into one outcome per article.
+
+    ``outcomes`` holds ``targets`` consecutive items per article. A version
+    conflict means the target already holds a newer version, so it counts
+    as accepted. An article only counts as indexed when every write target
+    accepted it; otherwise its first failed item is kept. Of an indexed
+    article, an item that was written is kept over a conflict.
+    """
+    merged = []
+    for start in range(0, len(outcomes), targets):
+        group = [
+            (ok or is_version_conflict_item(item), item)
+            for ok, item in outcomes[start : start + targets]
+        ]
+        failed = [outcome for outcome in group if not outcome[0]]
+        written = [
+            outcome for outcome in group if not is_version_conflict_item(outcome[1])
+        ]
+        merged.append(failed[0] if failed else (written or group)[0])
+    return merged
+
+
+def is_version_conflict_item(item: dict) -> bool:
+    """Whether a ``_bulk`` item was rejected for an older version."""
+    error = item.get("index", {}).get("error")
+    return isinstance(error, dict) and error.get("type") == VERSION_CONFLICT
+
 
+def is_index_not_found_item(item: dict) -> bool:
+    """Whether a failed ``_bulk`` item was rejected because the index is gone."""
+    error = item.get("index", {}).get("error")
+    return isinstance(error, dict) and error.get("type") == INDEX_NOT_FOUND
@@ -0,0 +1,116 @@
+from elasticsearch import NotFoundError
+from loguru import logger
+
+from src.domain.search.ports import SearchIndexMigrator
+from src.infrastructure.elasticsearch.elasticsearch_engine import (
+    ARTICLES_INDEX_BODY,
+    READ_ALIAS,
+    WRITE_ALIAS,
+)
+from src.infrastructure.elasticsearch.transport import (
+    TransportSettings,
+    create_client,
+)
+
+# Settings for the initial load of a new index: no periodic refreshes and no
+# replicas to copy every document to. Both are restored before it goes live.
+BULK_LOAD_SETTINGS = {"index": {"refresh_interval": "-1", "number_of_replicas": 0}}
+
+
+class ElasticsearchIndexMigrator(SearchIndexMigrator):
+    """Moves `READ_ALIAS` and `WRITE_ALIAS` to a new concrete index.
+
+    Dual writes rely on `ElasticsearchEngine` writing to every index behind
+    the write alias; the live index stays the alias's write index until the
+    swap, so the new one never receives writes addressed to the alias alone.
+    """
+
+    def __init__(self, url: str, transport: TransportSettings | None = None) -> None:
+        try:
+            self._client = create_client(url, transport)
+        except Exception as exc:
+            logger.error("Failed to connect to Elasticsearch: {}", exc)
+            raise
+
+    def live_index(self) -> str | None:
+        es = self._client
+        if es.indices.exists_alias(name=READ_ALIAS):
+            return sorted(es.indices.get_alias(name=READ_ALIAS).body)[0]
+        if es.indices.exists(index=READ_ALIAS):
+            # Concrete index created before index versioning
+            return READ_ALIAS
+        return None
+
+    def start(self, index: str) -> None:
+        es = self._client
+        es.indices.create(
+            index=index, body={**ARTICLES_INDEX_BODY, "settings": BULK_LOAD_SETTINGS}
+        )
+        logger.info("Created Elasticsearch index {} for bulk loading", index)
+
+        actions = [
+            {"add": {"index": live, "alias": WRITE_ALIAS, "is_write_index": True}}
+            for live in self._write_indices()
+        ]
+        actions.append(
+            {"add": {"index": index, "alias": WRITE_ALIAS, "is_write_index": False}}
+        )
+        es.indices.update_aliases(actions=actions)
+        logger.info("Dual writes enabled: {} now includes {}", WRITE_ALIAS, index)
+
+    def complete(self, index: str) -> None:
+        es = self._client
+        live = self.live_index()
+
+        replicas = None
+        if live is not None:
+            settings = es.indices.get_settings(
+                index=live, name="index.number_of_replicas"
+            )
+            replicas = next(iter(settings.body.values()))["settings"]["index"][
+                "number_of_replicas"
+            ]
+
+        # None resets refresh_interval to the cluster default
+        es.indices.put_settings(
+            index=index,
+            settings={
+                "index": {"refresh_interval": None, "number_of_replicas": replicas}
+            },
+        )
+        es.indices.refresh(index=index)
+
+        actions: list[dict] = []
+        for old in self._write_indices():
+            if old not in (index, READ_ALIAS):
+                actions.append({"remove": {"index": old, "alias": WRITE_ALIAS}})
+        if live == READ_ALIAS:
+            # The alias can only take the name once the legacy concrete
+            # index is gone; removing it in the same request keeps the swap
+            # atomic for readers.
+            actions.append({"remove_index": {"index": READ_ALIAS}})
+        elif live is not None:
+            actions.append({"remove": {"index": live, "alias": READ_ALIAS}})
+        actions += [
+            {"add": {"index": index, "alias": READ_ALIAS}},
+            {"add": {"index": index, "alias": WRITE_ALIAS, "is_write_index": True}},
+        ]
+        es.indices.update_aliases(actions=actions)
+        logger.info("Swapped {} and {} to {}", READ_ALIAS, WRITE_ALIAS, index)
+
+    def abort(self, index: str) -> None:
+        es = self._client
+        try:
+            es.indices.update_aliases(
+                actions=[{"remove": {"index": index, "alias": WRITE_ALIAS}}]
+            )
+        except NotFoundError:
+            pass
+        es.indices.delete(index=index, ignore_unavailable=True)
+        logger.warning("Aborted migration: removed {}", index)
+
+    def _write_indices(self) -> list[str]:
+        try:
+            return sorted(self._client.indices.get_alias(name=WRITE_ALIAS).body)
+        except NotFoundError:
+            return []
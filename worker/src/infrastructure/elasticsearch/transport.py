@@ -0,0 +1,116 @@
+"""Elasticsearch client construction shared by the engines and the migrator."""
+
+import time
+from dataclasses import dataclass
+
+from elastic_transport import AiohttpHttpNode, Urllib3HttpNode
+from elasticsearch import AsyncElasticsearch, Elasticsearch
+
+from src.domain.metrics.ports import NoopWorkerMetrics, WorkerMetrics
+
+# Statuses of a whole request that are retried on another node: too many
+# requests and the gateway/unavailable errors of a node that is restarting
+RETRY_ON_STATUS = (429, 502, 503, 504)
+
+
+@dataclass(frozen=True)
+class TransportSettings:
+    """Connection pool, compression, timeout, retry and sniffing options.
+
+    ``bulk_timeout_seconds`` applies to ``_bulk`` requests, which carry many
+    documents and legitimately take longer than a single index request.
+    """
+
+    connections_per_node: int = 10
+    http_compress: bool = True
+    request_timeout_seconds: float = 10.0
+    bulk_timeout_seconds: float = 60.0
+    max_retries: int = 3
+    retry_on_timeout: bool = True
+    sniff: bool = False
+    sniff_interval_seconds: float = 60.0
+
+
+def create_client(
+    url: str,
+    settings: TransportSettings | None = None,
+    metrics: WorkerMetrics | None = None,
+) -> Elasticsearch:
+    """Elasticsearch client whose node requests are timed into ``metrics``."""
+    return Elasticsearch(
+        [url],
+        node_class=_instrumented_node(metrics or NoopWorkerMetrics()),
+        **_client_options(settings or TransportSettings()),
+    )
+
+
+def create_async_client(
+    url: str,
+    settings: TransportSettings | None = None,
+    metrics: WorkerMetrics | None = None,
+) -> AsyncElasticsearch:
+    """`AsyncElasticsearch` counterpart of `create_client`."""
+    return AsyncElasticsearch(
+        [url],
+        node_class=_instrumented_async_node(metrics or NoopWorkerMetrics()),
+        **_client_options(settings or TransportSettings()),
+    )
+
+
+def _client_options(settings: TransportSettings) -> dict:
+    options = {
+        "connections_per_node": settings.connections_per_node,
+        "http_compress": settings.http_compress,
+        "request_timeout": settings.request_timeout_seconds,
+        "max_retries": settings.max_retries,
+        "retry_on_status": RETRY_ON_STATUS,
+        "retry_on_timeout": settings.retry_on_timeout,
+    }
+    if settings.sniff:
+        # Discover the cluster's other nodes at startup, after a node fails
+        # and before requests at most every sniff_interval_seconds. Passing
+        # the interval at all turns sniffing before requests on.
+        options.update(
+            sniff_on_start=True,
+            sniff_on_node_failure=True,
+            min_delay_between_sniffing=settings.sniff_interval_seconds,
+        )
+    return options
+
+
+def _instrumented_node(metrics: WorkerMetrics) -> type[Urllib3HttpNode]:
+    class InstrumentedNode(Urllib3HttpNode):
+        """Records the latency and status of every request to this node."""
+
+        def perform_request(self, *args, **kwargs):
+            started = time.perf_counter()
+            status = "error"
+            try:
+                response = super().perform_request(*args, **kwargs)
+                status = str(response.meta.status)
+                return response
+            finally:
+                metrics.observe_search_request(
+                    self.base_url, status, time.perf_counter() - started
+                )
+
+    return InstrumentedNode
+
+
+def _instrumented_async_node(metrics: WorkerMetrics) -> type[AiohttpHttpNode]:
+    class InstrumentedAsyncNode(AiohttpHttpNode):
+        """Records the latency and status of every request to this node."""
+
+        async def perform_request(self, *args, **kwargs):
+            started = time.perf_counter()
+            status = "error"
+            try:
+                response = await super().perform_request(*args, **kwargs)
+                status = str(response.meta.status)
+                return response
+            finally:
+                metrics.observe_search_request(
+                    self.base_url, status, time.perf_counter() - started
+                )
+
+    return InstrumentedAsyncNode
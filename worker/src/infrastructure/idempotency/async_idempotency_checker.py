@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+
+from loguru import logger
+
+from src.domain.idempotency.ports import (
+    AsyncIdempotencyChecker,
+    IdempotencyKey,
+    IdempotencyStatus,
+)
+from src.infrastructure.idempotency.idempotency_checker import make_owner_id
+from src.infrastructure.postgres.async_idempotency_repository import (
+    AsyncPostgresIdempotencyRepository,
+)
+
+
+class AsyncPostgresIdempotencyChecker(AsyncIdempotencyChecker):
+    """Asyncio counterpart of `PostgresIdempotencyChecker`.
+
+    The lease heartbeat runs as a task on the event loop, started with the
+    first claim, and renews the same in-flight claims.
+    """
+
+    def __init__(
+        self,
+        repo: AsyncPostgresIdempotencyRepository,
+        lease_seconds: float = 60.0,
+        owner_id: str | None = None,
+    ) -> None:
+        self._repo = repo
+        self._lease_seconds = lease_seconds
+        self._owner_id = owner_id or make_owner_id()
+        self._in_flight: set[IdempotencyKey] = set()
+        self._heartbeat: asyncio.Task | None = None
+
+    async def check_and_claim(
+        self, event_id: str, resource_key: str
+    ) -> IdempotencyStatus:
+        """Check idempotency status and claim the key if new."""
+        if self._heartbeat is None:
+            self._heartbeat = asyncio.create_task(self._heartbeat_loop())
+
+        status = await self._repo.claim(
+            event_id, resource_key, self._owner_id, self._lease_seconds
+        )
+
+        if status == "NEW":
+            self._in_flight.add((event_id, resource_key))
+            return IdempotencyStatus.NEW
+        if status == "COMPLETED":
+            return IdempotencyStatus.COMPLETED
+
+        if status is None:
+            logger.debug(
+                "Race condition for idempotency key {}/{} - already claimed",
+                event_id,
+                resource_key,
+            )
+        return IdempotencyStatus.IN_PROGRESS
+
+    async def mark_completed(self, event_id: str, resource_key: str) -> None:
+        """Mark the idempotency key as completed."""
+        self._in_flight.discard((event_id, resource_key))
+        await self._repo.update_status(event_id, resource_key, "COMPLETED")
+
+    async def mark_failed(self, event_id: str, resource_key: str) -> None:
+        """Release our claim by deleting it."""
+        self._in_flight.discard((event_id, resource_key))
+        await self._repo.release(event_id, resource_key, self._owner_id)
+
+    async def close(self) -> None:
+        """Stop renewing leases; unfinished claims expire on their own."""
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            self._heartbeat = None
+
+    async def _heartbeat_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._lease_seconds / 3)
+            try:
+                await self._repo.renew_leases(
+                    list(self._in_flight), self._owner_id, self._lease_seconds
+                )
+            except Exception as exc:
+                logger.warning(
+                    "Failed to renew idempotency leases for {}: {}",
+                    self._owner_id,
+                    exc,
+                )
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+
+from src.domain.idempotency.ports import (
+    AsyncIdempotencyChecker,
+    IdempotencyChecker,
+    IdempotencyKey,
+    IdempotencyStatus,
+)
+from src.domain.metrics.ports import NoopWorkerMetrics, WorkerMetrics
+
+_CACHE_NAME = "idempotency"
+
+
+class CompletedKeyCache:
+    """Bounded LRU set of completed ``(event_id, resource_key)`` pairs.
+
+    Entries expire ``ttl_seconds`` after they were added. Once the cache
+    holds ``max_entries`` pairs, adding one evicts the least recently used.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        metrics: WorkerMetrics | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._metrics = metrics or NoopWorkerMetrics()
+        self._clock = clock
+        self._expires_at: OrderedDict[tuple[str, str], float] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._expires_at)
+
+    def contains(self, event_id: str, resource_key: str) -> bool:
+        """Whether the pair is cached and unexpired; counts a hit or a miss."""
+        key = (event_id, resource_key)
+        with self._lock:
+            expires_at = self._expires_at.get(key)
+            hit = expires_at is not None and expires_at > self._clock()
+            if hit:
+                self._expires_at.move_to_end(key)
+                self.hits += 1
+            else:
+                if expires_at is not None:
+                    del self._expires_at[key]
+                self.misses += 1
+
+        self._metrics.cache_lookup(_CACHE_NAME, hit)
+        return hit
+
+    def add(self, event_id: str, resource_key: str) -> None:
+        key = (event_id, resource_key)
+        with self._lock:
+            self._expires_at[key] = self._clock() + self._ttl
+            self._expires_at.move_to_end(key)
+            while len(self._expires_at) > self._max_entries:
+                self._expires_at.popitem(last=False)
+
+    def discard(self, event_id: str, resource_key: str) -> None:
+        with self._lock:
+            self._expires_at.pop((event_id, resource_key), None)
+
+
+class CachingIdempotencyChecker(IdempotencyChecker):
+    """Answers COMPLETED for recently completed keys without a database call.
+
+    Wraps another checker. Keys are cached when this worker completes them
+    or when the wrapped checker reports them COMPLETED, so redeliveries and
+    duplicate publishes short-circuit in memory. COMPLETED is final, which is
+    what makes serving it from a per-process cache safe.
+    """
+
+    def __init__(self, inner: IdempotencyChecker, cache: CompletedKeyCache) -> None:
+        self._inner = inner
+        self._cache = cache
+
+    def check_and_claim(self, event_id: str, resource_key: str) -> IdempotencyStatus:
+        if self._cache.contains(event_id, resource_key):
+            return IdempotencyStatus.COMPLETED
+
+        status = self._inner.check_and_claim(event_id, resource_key)
+        if status is IdempotencyStatus.COMPLETED:
+            self._cache.add(event_id, resource_key)
+        return status
+
+    def mark_completed(self, event_id: str, resource_key: str) -> None:
+        self._inner.mark_completed(event_id, resource_key)
+        self._cache.add(event_id, resource_key)
+
+    def mark_failed(self, event_id: str, resource_key: str) -> None:
+        self._cache.discard(event_id, resource_key)
+        self._inner.mark_failed(event_id, resource_key)
+
+    def check_and_claim_many(
+        self, keys: Sequence[IdempotencyKey]
+    ) -> list[IdempotencyStatus]:
+        statuses: list[IdempotencyStatus | None] = [
+            IdempotencyStatus.COMPLETED if self._cache.contains(*key) else None
+            for key in keys
+        ]
+        misses = [key for key, status in zip(keys, statuses) if status is None]
+        if not misses:
+            return statuses
+
+        inner_statuses = iter(self._inner.check_and_claim_many(misses))
+        for position, status in enumerate(statuses):
+            if status is None:
+                statuses[position] = next(inner_statuses)
+                if statuses[position] is IdempotencyStatus.COMPLETED:
+                    self._cache.add(*keys[position])
+        return statuses
+
+    def mark_completed_many(self, keys: Sequence[IdempotencyKey]) -> None:
+        self._inner.mark_completed_many(keys)
+        for key in keys:
+            self._cache.add(*key)
+
+    def mark_failed_many(self, keys: Sequence[IdempotencyKey]) -> None:
+        for key in keys:
+            self._cache.discard(*key)
+        self._inner.mark_failed_many(keys)
+
+    def close(self) -> None:
+        self._inner.close()
+
+
+class AsyncCachingIdempotencyChecker(AsyncIdempotencyChecker):
+    """Asyncio counterpart of `CachingIdempotencyChecker`."""
+
+    def __init__(
+        self, inner: AsyncIdempotencyChecker, cache: CompletedKeyCache
+    ) -> None:
+        self._inner = inner
+        self._cache = cache
+
+    async def check_and_claim(
+        self, event_id: str, resource_key: str
+    ) -> IdempotencyStatus:
+        if self._cache.contains(event_id, resource_key):
+            return IdempotencyStatus.COMPLETED
+
+        status = await self._inner.check_and_claim(event_id, resource_key)
+        if status is IdempotencyStatus.COMPLETED:
+            self._cache.add(event_id, resource_key)
+        return status
+
+    async def mark_completed(self, event_id: str, resource_key: str) -> None:
+        await self._inner.mark_completed(event_id, resource_key)
+        self._cache.add(event_id, resource_key)
+
+    async def mark_failed(self, event_id: str, resource_key: str) -> None:
+        self._cache.discard(event_id, resource_key)
+        await self._inner.mark_failed(event_id, resource_key)
+
+    async def close(self) -> None:
+        await self._inner.close()
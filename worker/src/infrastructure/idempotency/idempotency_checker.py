@@ -1,9 +1,18 @@
 from __future__ import annotations
 
-from psycopg.errors import UniqueViolation
+import os
+import socket
+import threading
+import uuid
+from collections.abc import Sequence
+
 from loguru import logger
 
-from src.domain.idempotency.ports import IdempotencyChecker, IdempotencyStatus
+from src.domain.idempotency.ports import (
+    IdempotencyChecker,
+    IdempotencyKey,
+    IdempotencyStatus,
+)
 from src.infrastructure.postgres.idempotency_repository import (
     PostgresIdempotencyRepository,
 )
@@ -15,47 +24,136 @@ class PostgresIdempotencyChecker(IdempotencyChecker):
     This implementation is simpler than the Redis+Postgres version and
     suitable for moderate-scale background processing where sub-millisecond
     latency is not required.
+
+    Claims are leases held by this checker's owner id. A background thread
+    renews the claims this checker took and has not yet completed or
+    released every third of the lease, so a claim only expires (and can be
+    taken over by another worker) once this process stops heartbeating,
+    e.g. because it crashed. A claim whose completion or release failed is
+    no longer renewed either, so it expires instead of staying held.
     """
 
     def __init__(
         self,
         repo: PostgresIdempotencyRepository,
+        lease_seconds: float = 60.0,
+        owner_id: str | None = None,
     ) -> None:
         self._repo = repo
+        self._lease_seconds = lease_seconds
+        self._owner_id = owner_id or make_owner_id()
+        # Claims being processed; read by the heartbeat thread
+        self._in_flight: set[IdempotencyKey] = set()
+        self._in_flight_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._heartbeat = threading.Thread(
+            target=self._heartbeat_loop, name="idempotency-heartbeat", daemon=True
+        )
+        self._heartbeat.start()
 
     def check_and_claim(self, event_id: str, resource_key: str) -> IdempotencyStatus:
         """Check idempotency status and claim the key if new.
         
         This method is safe for concurrent execution across multiple workers.
+        The check and the claim happen in a single INSERT ... ON CONFLICT
+        statement, so there is one round trip and no exception on races.
         """
-        # 1. Check if record already exists
-        record = self._repo.get(event_id, resource_key)
-        if record is not None:
-            if record.status == "COMPLETED":
-                return IdempotencyStatus.COMPLETED
-            if record.status == "IN_PROGRESS":
-                return IdempotencyStatus.IN_PROGRESS
-
-        # 2. Attempt to claim by inserting IN_PROGRESS
-        try:
-            self._repo.insert_in_progress(event_id, resource_key)
+        status = self._repo.claim(
+            event_id, resource_key, self._owner_id, self._lease_seconds
+        )
+
+        if status == "NEW":
+            self._track((event_id, resource_key))
             return IdempotencyStatus.NEW
-        except UniqueViolation:
+        if status == "COMPLETED":
+            return IdempotencyStatus.COMPLETED
+
+        if status is None:
             logger.debug(
                 "Race condition for idempotency key {}/{} - already claimed",
                 event_id,
                 resource_key,
             )
-            return IdempotencyStatus.IN_PROGRESS
+        return IdempotencyStatus.IN_PROGRESS
 
     def mark_completed(self, event_id: str, resource_key: str) -> None:
         """Mark the idempotency key as completed."""
+        self._untrack([(event_id, resource_key)])
         self._repo.update_status(event_id, resource_key, "COMPLETED")
 
     def mark_failed(self, event_id: str, resource_key: str) -> None:
-        """Mark the idempotency key as failed by deleting it.
+        """Release our claim by deleting it.
         
         This allows the event to be retried on subsequent delivery.
         """
-        self._repo.delete(event_id, resource_key)
+        self._untrack([(event_id, resource_key)])
+        self._repo.release(event_id, resource_key, self._owner_id)
+
+    def check_and_claim_many(
+        self, keys: Sequence[IdempotencyKey]
+    ) -> list[IdempotencyStatus]:
+        """Claim a batch of keys with a single statement."""
+        claimed = self._repo.claim_many(keys, self._owner_id, self._lease_seconds)
+
+        statuses = []
+        seen: set[IdempotencyKey] = set()
+        for key in keys:
+            status = claimed[key]
+            if key in seen:
+                # A repeat within the batch; the first occurrence holds it
+                statuses.append(
+                    IdempotencyStatus.COMPLETED
+                    if status == "COMPLETED"
+                    else IdempotencyStatus.IN_PROGRESS
+                )
+            elif status == "NEW":
+                self._track(key)
+                statuses.append(IdempotencyStatus.NEW)
+            elif status == "COMPLETED":
+                statuses.append(IdempotencyStatus.COMPLETED)
+            else:
+                statuses.append(IdempotencyStatus.IN_PROGRESS)
+            seen.add(key)
+        return statuses
+
+    def mark_completed_many(self, keys: Sequence[IdempotencyKey]) -> None:
+        """Mark a batch of keys as completed with a single statement."""
+        self._untrack(keys)
+        self._repo.upsert_completed_many(keys)
+
+    def mark_failed_many(self, keys: Sequence[IdempotencyKey]) -> None:
+        """Release a batch of our claims with a single statement."""
+        self._untrack(keys)
+        self._repo.release_many(keys, self._owner_id)
+
+    def close(self) -> None:
+        """Stop renewing leases; unfinished claims expire on their own."""
+        self._stopping.set()
+        self._heartbeat.join()
+
+    def _track(self, key: IdempotencyKey) -> None:
+        with self._in_flight_lock:
+            self._in_flight.add(key)
+
+    def _untrack(self, keys: Sequence[IdempotencyKey]) -> None:
+        # Before the statement, so a claim it fails to settle is not renewed
+        with self._in_flight_lock:
+            self._in_flight.difference_update(keys)
+
+    def _heartbeat_loop(self) -> None:
+        while not self._stopping.wait(self._lease_seconds / 3):
+            with self._in_flight_lock:
+                keys = list(self._in_flight)
+            try:
+                self._repo.renew_leases(keys, self._owner_id, self._lease_seconds)
+            except Exception as exc:
+                logger.warning(
+                    "Failed to renew idempotency leases for {}: {}",
+                    self._owner_id,
+                    exc,
+                )
+
 
+def make_owner_id() -> str:
+    """Identify this process's claims: host, pid and a random suffix."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
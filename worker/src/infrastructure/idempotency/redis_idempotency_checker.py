@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import queue
+import threading
+import uuid
+from collections.abc import Sequence
+
+from loguru import logger
+from redis import Redis, WatchError
+
+from src.domain.article import MessageRequeueError
+from src.domain.idempotency.ports import (
+    IdempotencyChecker,
+    IdempotencyKey,
+    IdempotencyStatus,
+)
+from src.infrastructure.postgres.idempotency_repository import (
+    PostgresIdempotencyRepository,
+)
+
+_COMPLETED = b"COMPLETED"
+_IN_PROGRESS_PREFIX = b"IN_PROGRESS:"
+
+
+class RedisIdempotencyChecker(IdempotencyChecker):
+    """Tiered idempotency checker: Redis claims, Postgres as source of truth.
+
+    A claim is one ``SET key IN_PROGRESS:<owner> NX PX <lease> GET`` round
+    trip; the lease frees the key again if this worker dies mid-message.
+    Completions are written to Redis immediately and to Postgres in batches
+    by a background thread, so neither the claim nor the completion waits on
+    Postgres. Only when Redis knows nothing about a key (it expired, was
+    evicted or Redis lost its data) is Postgres read to check whether the
+    event was already completed.
+
+    Like `PostgresIdempotencyChecker`, a background thread extends the
+    leases this checker still holds every third of the lease, so only the
+    claims of a crashed or stalled worker expire.
+
+    While ``max_pending_completions`` completions wait for Postgres, e.g.
+    because it is unreachable, new claims raise `MessageRequeueError`
+    instead of growing the backlog further; the messages are tried again
+    once the flusher caught up.
+
+    Every worker has to use this checker for the lease to exclude the
+    others; it does not write IN_PROGRESS rows to Postgres.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        repo: PostgresIdempotencyRepository,
+        lease_ms: int = 60_000,
+        completed_ttl_ms: int = 86_400_000,
+        flush_interval_ms: int = 200,
+        flush_batch_size: int = 500,
+        max_pending_completions: int = 10_000,
+    ) -> None:
+        self._redis = redis
+        self._repo = repo
+        self._lease_ms = lease_ms
+        self._completed_ttl_ms = completed_ttl_ms
+        self._flush_interval = flush_interval_ms / 1000
+        self._flush_batch_size = flush_batch_size
+        self._max_pending = max_pending_completions
+        # Identifies this checker's leases, so it never releases another
+        # worker's claim
+        self._lease_value = _IN_PROGRESS_PREFIX + uuid.uuid4().hex.encode()
+
+        self._pending: queue.Queue[tuple[str, str]] = queue.Queue()
+        # Redis keys of the claims being processed; read by the heartbeat
+        self._in_flight: set[str] = set()
+        self._in_flight_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name="idempotency-flusher", daemon=True
+        )
+        self._flusher.start()
+        self._heartbeat = threading.Thread(
+            target=self._heartbeat_loop, name="idempotency-heartbeat", daemon=True
+        )
+        self._heartbeat.start()
+
+    def check_and_claim(self, event_id: str, resource_key: str) -> IdempotencyStatus:
+        """Claim the key in Redis, consulting Postgres only on a Redis miss."""
+        self._raise_if_backlogged()
+        key = _redis_key(event_id, resource_key)
+        previous = self._redis.set(
+            key, self._lease_value, nx=True, px=self._lease_ms, get=True
+        )
+
+        if previous == _COMPLETED:
+            return IdempotencyStatus.COMPLETED
+        if previous is not None:
+            return IdempotencyStatus.IN_PROGRESS
+
+        # Redis had no record; it may have forgotten a completed event
+        record = self._repo.get(event_id, resource_key)
+        if record is not None and record.status == "COMPLETED":
+            self._redis.set(key, _COMPLETED, px=self._completed_ttl_ms)
+            return IdempotencyStatus.COMPLETED
+
+        self._track([key])
+        return IdempotencyStatus.NEW
+
+    def mark_completed(self, event_id: str, resource_key: str) -> None:
+        """Queue the Postgres write and mark completed in Redis now.
+
+        The write is queued first, so the completion reaches Postgres even
+        when Redis is unreachable and this raises.
+        """
+        key = _redis_key(event_id, resource_key)
+        self._untrack([key])
+        self._pending.put((event_id, resource_key))
+        self._redis.set(key, _COMPLETED, px=self._completed_ttl_ms)
+
+    def check_and_claim_many(
+        self, keys: Sequence[IdempotencyKey]
+    ) -> list[IdempotencyStatus]:
+        """Claim a batch in one Redis pipeline and at most one Postgres read."""
+        self._raise_if_backlogged()
+        pipe = self._redis.pipeline(transaction=False)
+        for event_id, resource_key in keys:
+            pipe.set(
+                _redis_key(event_id, resource_key),
+                self._lease_value,
+                nx=True,
+                px=self._lease_ms,
+                get=True,
+            )
+        previous_values = pipe.execute()
+
+        statuses: list[IdempotencyStatus] = []
+        misses: list[IdempotencyKey] = []
+        for key, previous in zip(keys, previous_values):
+            if previous == _COMPLETED:
+                statuses.append(IdempotencyStatus.COMPLETED)
+            elif previous is not None:
+                statuses.append(IdempotencyStatus.IN_PROGRESS)
+            else:
+                statuses.append(IdempotencyStatus.NEW)
+                misses.append(key)
+
+        if not misses:
+            return statuses
+
+        # Redis had no record of these; it may have forgotten completed events
+        stored = self._repo.get_statuses(misses)
+        forgotten = {key for key in misses if stored.get(key) == "COMPLETED"}
+        if forgotten:
+            pipe = self._redis.pipeline(transaction=False)
+            for key in forgotten:
+                pipe.set(_redis_key(*key), _COMPLETED, px=self._completed_ttl_ms)
+            pipe.execute()
+            statuses = [
+                IdempotencyStatus.COMPLETED
+                if status is IdempotencyStatus.NEW and key in forgotten
+                else status
+                for key, status in zip(keys, statuses)
+            ]
+        self._track(
+            [
+                _redis_key(*key)
+                for key, status in zip(keys, statuses)
+                if status is IdempotencyStatus.NEW
+            ]
+        )
+        return statuses
+
+    def mark_completed_many(self, keys: Sequence[IdempotencyKey]) -> None:
+        """Batch variant of `mark_completed` in one Redis pipeline."""
+        self._untrack([_redis_key(*key) for key in keys])
+        for key in keys:
+            self._pending.put(key)
+        pipe = self._redis.pipeline(transaction=False)
+        for event_id, resource_key in keys:
+            pipe.set(
+                _redis_key(event_id, resource_key),
+                _COMPLETED,
+                px=self._completed_ttl_ms,
+            )
+        pipe.execute()
+
+    def mark_failed(self, event_id: str, resource_key: str) -> None:
+        """Release this worker's lease so the event can be retried."""
+        key = _redis_key(event_id, resource_key)
+        self._untrack([key])
+
+        def _release(pipe) -> None:
+            if pipe.get(key) == self._lease_value:
+                pipe.multi()
+                pipe.delete(key)
+
+        try:
+            self._redis.transaction(_release, key)
+        except WatchError:
+            # The key changed under us, so it is no longer our lease
+            pass
+
+    def close(self) -> None:
+        """Stop the flusher after writing every queued completion.
+
+        Leases are no longer renewed; unfinished claims expire on their own.
+        """
+        self._stopping.set()
+        self._heartbeat.join()
+        self._flusher.join()
+
+    def _raise_if_backlogged(self) -> None:
+        backlog = self._pending.qsize()
+        if backlog >= self._max_pending:
+            raise MessageRequeueError(
+                f"{backlog} idempotency completions are waiting for Postgres; "
+                "not claiming new events until they are written"
+            )
+
+    def _track(self, keys: Sequence[str]) -> None:
+        with self._in_flight_lock:
+            self._in_flight.update(keys)
+
+    def _untrack(self, keys: Sequence[str]) -> None:
+        # Before the Redis call, so a claim it fails to settle is not renewed
+        with self._in_flight_lock:
+            self._in_flight.difference_update(keys)
+
+    def _heartbeat_loop(self) -> None:
+        while not self._stopping.wait(self._lease_ms / 3000):
+            try:
+                self._renew_leases()
+            except Exception as exc:
+                logger.warning("Failed to renew idempotency leases: {}", exc)
+
+    def _renew_leases(self) -> None:
+        """Extend the leases of in-flight claims that are still this worker's.
+
+        The keys are watched, so a lease that expired and was taken by
+        another worker in the meantime is left alone.
+        """
+        with self._in_flight_lock:
+            keys = list(self._in_flight)
+        if not keys:
+            return
+
+        def _renew(pipe) -> None:
+            values = pipe.mget(keys)
+            pipe.multi()
+            for key, value in zip(keys, values):
+                if value == self._lease_value:
+                    pipe.pexpire(key, self._lease_ms)
+
+        self._redis.transaction(_renew, *keys)
+
+    def _flush_loop(self) -> None:
+        while not self._stopping.is_set():
+            self._stopping.wait(self._flush_interval)
+            self._flush()
+        self._flush()
+
+    def _flush(self) -> None:
+        while True:
+            batch = []
+            while len(batch) < self._flush_batch_size:
+                try:
+                    batch.append(self._pending.get_nowait())
+                except queue.Empty:
+                    break
+            if not batch:
+                return
+
+            try:
+                self._repo.upsert_completed_many(batch)
+            except Exception as exc:
+                logger.error(
+                    "Failed to persist {} completed idempotency keys; "
+                    "retrying later: {}",
+                    len(batch),
+                    exc,
+                )
+                for item in batch:
+                    self._pending.put(item)
+                return
+
+
+def _redis_key(event_id: str, resource_key: str) -> str:
+    # Same layout as the API service's idempotency keys
+    return f"idempotency:{resource_key}:{event_id}"
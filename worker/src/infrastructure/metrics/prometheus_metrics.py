@@ -0,0 +1,191 @@
+from collections.abc import Callable
+
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    start_http_server,
+)
+
+from src.domain.metrics.ports import (
+    DeliveryOutcome,
+    DocumentOutcome,
+    Stage,
+    WorkerMetrics,
+)
+from src.infrastructure.postgres import PoolStats
+
+# Stage latencies range from sub-millisecond Postgres round trips to
+# multi-second Elasticsearch bulk requests
+_STAGE_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# From a quick broker restart to a lengthy outage
+_DOWNTIME_BUCKETS = (0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+
+class PrometheusWorkerMetrics(WorkerMetrics):
+    """`WorkerMetrics` backed by prometheus_client collectors.
+
+    Collectors are registered in ``registry`` (a fresh one by default, so
+    several instances never clash) and exposed by `start_metrics_server`.
+    """
+
+    def __init__(self, registry: CollectorRegistry | None = None) -> None:
+        self.registry = registry or CollectorRegistry()
+
+        self._consumed = Counter(
+            "news_worker_messages_consumed_total",
+            "Deliveries received from RabbitMQ.",
+            ["queue"],
+            registry=self.registry,
+        )
+        self._settled = Counter(
+            "news_worker_messages_settled_total",
+            "Deliveries settled, by outcome (acked, requeued, retried, "
+            "dead_lettered).",
+            ["queue", "outcome"],
+            registry=self.registry,
+        )
+        self._stage_seconds = Histogram(
+            "news_worker_stage_duration_seconds",
+            "Time spent in each stage of handling a job message.",
+            ["stage"],
+            buckets=_STAGE_BUCKETS,
+            registry=self.registry,
+        )
+        self._in_flight = Gauge(
+            "news_worker_messages_in_flight",
+            "Deliveries received but not yet settled.",
+            ["queue"],
+            registry=self.registry,
+        )
+        self._queue_depth = Gauge(
+            "news_worker_queue_depth",
+            "Ready messages in a queue, sampled periodically.",
+            ["queue"],
+            registry=self.registry,
+        )
+        self._cache_lookups = Counter(
+            "news_worker_cache_lookups_total",
+            "In-process cache lookups, by result (hit or miss).",
+            ["cache", "result"],
+            registry=self.registry,
+        )
+        self._broker_connected = Gauge(
+            "news_worker_broker_connected",
+            "1 while the consumer is connected to RabbitMQ, 0 otherwise.",
+            registry=self.registry,
+        )
+        self._reconnect_downtime = Histogram(
+            "news_worker_reconnect_downtime_seconds",
+            "Time without a RabbitMQ connection before each reconnect; its "
+            "_count is the number of reconnects.",
+            buckets=_DOWNTIME_BUCKETS,
+            registry=self.registry,
+        )
+
+        self._search_request_seconds = Histogram(
+            "news_worker_search_request_duration_seconds",
+            "Latency of HTTP requests to each Elasticsearch node, by response "
+            "status (\"error\" when no response arrived).",
+            ["node", "status"],
+            buckets=_STAGE_BUCKETS,
+            registry=self.registry,
+        )
+        self._documents = Counter(
+            "news_worker_search_documents_total",
+            "Articles indexed, by outcome (written; unchanged when the stored "
+            "document already had the same content hash; stale when a newer "
+            "version is already indexed).",
+            ["outcome"],
+            registry=self.registry,
+        )
+
+        # Export every stage from startup so dashboards show empty series
+        # instead of missing ones
+        for stage in Stage:
+            self._stage_seconds.labels(stage=stage.value)
+        for outcome in DocumentOutcome:
+            self._documents.labels(outcome=outcome.value)
+
+    def message_consumed(self, queue: str) -> None:
+        self._consumed.labels(queue=queue).inc()
+
+    def message_settled(self, queue: str, outcome: DeliveryOutcome) -> None:
+        self._settled.labels(queue=queue, outcome=outcome.value).inc()
+
+    def observe_stage(self, stage: Stage, seconds: float) -> None:
+        self._stage_seconds.labels(stage=stage.value).observe(seconds)
+
+    def set_in_flight(self, queue: str, count: int) -> None:
+        self._in_flight.labels(queue=queue).set(count)
+
+    def set_queue_depth(self, queue: str, depth: int) -> None:
+        self._queue_depth.labels(queue=queue).set(depth)
+
+    def cache_lookup(self, cache: str, hit: bool) -> None:
+        self._cache_lookups.labels(cache=cache, result="hit" if hit else "miss").inc()
+
+    def set_broker_connected(self, connected: bool) -> None:
+        self._broker_connected.set(1 if connected else 0)
+
+    def observe_reconnect(self, downtime_seconds: float) -> None:
+        self._reconnect_downtime.observe(downtime_seconds)
+
+    def observe_search_request(self, node: str, status: str, seconds: float) -> None:
+        self._search_request_seconds.labels(node=node, status=status).observe(
+            seconds
+        )
+
+    def documents_indexed(self, outcome: DocumentOutcome, count: int = 1) -> None:
+        self._documents.labels(outcome=outcome.value).inc(count)
+
+    def watch_postgres_pool(self, stats: Callable[[], PoolStats]) -> None:
+        """Export the saturation of a Postgres pool, read on every scrape.
+
+        Call once per registry; ``stats`` is typically `get_pool_stats` of
+        the worker's pool.
+        """
+        Gauge(
+            "news_worker_postgres_pool_size",
+            "Connections currently opened by the Postgres pool.",
+            registry=self.registry,
+        ).set_function(lambda: stats().size)
+        Gauge(
+            "news_worker_postgres_pool_in_use",
+            "Pooled Postgres connections currently lent out.",
+            registry=self.registry,
+        ).set_function(lambda: stats().in_use)
+        Gauge(
+            "news_worker_postgres_pool_waiting",
+            "Callers waiting for a Postgres connection; non-zero means the "
+            "pool is saturated.",
+            registry=self.registry,
+        ).set_function(lambda: stats().waiting)
+        Gauge(
+            "news_worker_postgres_pool_opened",
+            "Connections the Postgres pool opened since it started; a steady "
+            "rise means connections keep being replaced.",
+            registry=self.registry,
+        ).set_function(lambda: stats().opened)
+
+
+def start_metrics_server(metrics: PrometheusWorkerMetrics, port: int) -> None:
+    """Serve ``metrics`` on ``http://0.0.0.0:<port>/metrics`` from a daemon thread."""
+    start_http_server(port, registry=metrics.registry)
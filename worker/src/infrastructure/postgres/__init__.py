@@ -1,9 +1,11 @@
 """PostgreSQL infrastructure adapter and setup."""
 
+from dataclasses import dataclass
 from typing import Any, cast
 
 import psycopg
 from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool, ConnectionPool
 
 
 def get_connection(connection_url: str):
@@ -16,3 +18,79 @@ def get_connection(connection_url: str):
         row_factory=cast(Any, dict_row),
     )
 
+
+def create_connection_pool(
+    connection_url: str,
+    min_size: int,
+    max_size: int,
+    max_lifetime_seconds: float,
+    max_idle_seconds: float,
+    timeout_seconds: float,
+) -> ConnectionPool:
+    """Create a connection pool whose connections match `get_connection`.
+
+    The pool is opened immediately but does not wait for its first
+    connections, so the worker can start while Postgres is still coming up.
+    """
+    return ConnectionPool(
+        connection_url,
+        kwargs={"row_factory": cast(Any, dict_row)},
+        min_size=min_size,
+        max_size=max_size,
+        max_lifetime=max_lifetime_seconds,
+        max_idle=max_idle_seconds,
+        timeout=timeout_seconds,
+        name="news-worker",
+        open=True,
+    )
+
+
+def create_async_connection_pool(
+    connection_url: str,
+    min_size: int,
+    max_size: int,
+    max_lifetime_seconds: float,
+    max_idle_seconds: float,
+    timeout_seconds: float,
+) -> AsyncConnectionPool:
+    """Create an asyncio connection pool of `psycopg.AsyncConnection`.
+
+    Async pools must be opened from a running event loop, so the caller is
+    responsible for ``await pool.open()``.
+    """
+    return AsyncConnectionPool(
+        connection_url,
+        kwargs={"row_factory": cast(Any, dict_row)},
+        min_size=min_size,
+        max_size=max_size,
+        max_lifetime=max_lifetime_seconds,
+        max_idle=max_idle_seconds,
+        timeout=timeout_seconds,
+        name="news-worker-async",
+        open=False,
+    )
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Point-in-time view of a connection pool's saturation."""
+
+    size: int
+    in_use: int
+    available: int
+    waiting: int
+    opened: int
+
+
+def get_pool_stats(pool: ConnectionPool | AsyncConnectionPool) -> PoolStats:
+    """Read the current statistics of a connection pool."""
+    stats = pool.get_stats()
+    size = stats.get("pool_size", 0)
+    available = stats.get("pool_available", 0)
+    return PoolStats(
+        size=size,
+        in_use=size - available,
+        available=available,
+        waiting=stats.get("requests_waiting", 0),
+        opened=stats.get("connections_num", 0),
+    )
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from uuid import UUID
+
+from loguru import logger
+from psycopg_pool import ConnectionPool
+
+from src.domain.article import Article
+from src.domain.article.ports import ArticleRepository
+
+_ARTICLE_COLUMNS = "id, title, content, source, author, link, created_at, updated_at"
+
+SELECT_BY_ID_SQL = f"""
+SELECT {_ARTICLE_COLUMNS}
+FROM articles
+WHERE id = %s
+"""
+
+# One keyset page, walked in primary key order so it is served by the
+# primary key index and a page can resume from the last ID of the previous one
+SELECT_PAGE_SQL = f"""
+SELECT {_ARTICLE_COLUMNS}
+FROM articles
+WHERE %(after_id)s::uuid IS NULL OR id > %(after_id)s::uuid
+ORDER BY id
+LIMIT %(limit)s
+"""
+
+# Chunks read per keyset page. Each page is one short transaction, so a long
+# reindex never pins a snapshot (and a pooled connection) for its whole run.
+_CHUNKS_PER_PAGE = 50
+
+
+class PostgresArticleRepository(ArticleRepository):
+    """Reads the ``articles`` table owned by the API service."""
+
+    def __init__(self, pool: ConnectionPool) -> None:
+        self._pool = pool
+
+    def _get_connection(self):
+        """Borrow a pooled connection; it is returned to the pool on exit."""
+        return self._pool.connection()
+
+    def get_by_id(self, article_id: UUID) -> Article | None:
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(SELECT_BY_ID_SQL, (article_id,))
+                    row = cur.fetchone()
+        except Exception as exc:
+            logger.error("Failed to fetch article {}: {}", article_id, exc)
+            raise
+
+        return None if row is None else _article_from_row(row)
+
+    def iter_articles(
+        self, after_id: UUID | None = None, chunk_size: int = 1000
+    ) -> Iterator[list[Article]]:
+        """Stream articles through a server-side cursor, one keyset page at a time.
+
+        Rows are fetched ``chunk_size`` at a time from a named cursor, so only
+        one chunk is held in memory regardless of the table size.
+        """
+        page_size = chunk_size * _CHUNKS_PER_PAGE
+        last_id = after_id
+
+        while True:
+            rows_in_page = 0
+            with self._get_connection() as conn:
+                with conn.cursor(name="news_worker_iter_articles") as cur:
+                    cur.itersize = chunk_size
+                    cur.execute(
+                        SELECT_PAGE_SQL, {"after_id": last_id, "limit": page_size}
+                    )
+                    while rows := cur.fetchmany(chunk_size):
+                        rows_in_page += len(rows)
+                        articles = [_article_from_row(row) for row in rows]
+                        last_id = articles[-1].id
+                        yield articles
+
+            if rows_in_page < page_size:
+                return
+
+
+def _article_from_row(row: dict) -> Article:
+    return Article(
+        id=row["id"],
+        title=row["title"],
+        content=row["content"],
+        source=row["source"],
+        author=row["author"],
+        link=row["link"],
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+    )
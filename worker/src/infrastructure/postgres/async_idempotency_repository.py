@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from loguru import logger
+from psycopg_pool import AsyncConnectionPool
+
+from src.infrastructure.postgres import PoolStats, get_pool_stats
+from src.infrastructure.postgres.idempotency_repository import (
+    CLAIM_SQL,
+    RELEASE_SQL,
+    RENEW_LEASES_SQL,
+    SCHEMA_CHECK_SQL,
+    UPDATE_STATUS_SQL,
+    raise_for_missing_schema,
+    schema_check_params,
+)
+
+
+class AsyncPostgresIdempotencyRepository:
+    """`psycopg.AsyncConnection` counterpart of `PostgresIdempotencyRepository`."""
+
+    def __init__(self, pool: AsyncConnectionPool) -> None:
+        self._pool = pool
+
+    def _get_connection(self):
+        """Borrow a pooled connection; it is returned to the pool on exit."""
+        return self._pool.connection()
+
+    def pool_stats(self) -> PoolStats:
+        """Current saturation of the underlying connection pool."""
+        return get_pool_stats(self._pool)
+
+    async def check_schema(self) -> None:
+        """Fail fast if the API's migrations have not been run yet."""
+        async with self._get_connection() as conn:
+            cursor = await conn.execute(SCHEMA_CHECK_SQL, schema_check_params())
+            row = await cursor.fetchone()
+        raise_for_missing_schema(row)
+
+    async def claim(
+        self,
+        idempotency_key: str,
+        resource_path: str,
+        owner_id: str,
+        lease_seconds: float,
+    ) -> str | None:
+        """Atomically claim a key; see `PostgresIdempotencyRepository.claim`."""
+        try:
+            async with self._get_connection() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(
+                        CLAIM_SQL,
+                        {
+                            "key": idempotency_key,
+                            "path": resource_path,
+                            "owner": owner_id,
+                            "lease": lease_seconds,
+                        },
+                        prepare=True,
+                    )
+                    row = await cur.fetchone()
+                    await conn.commit()
+        except Exception as exc:
+            logger.error(
+                "Failed to claim idempotency key {}/{}: {}",
+                idempotency_key,
+                resource_path,
+                exc,
+            )
+            raise
+
+        return None if row is None else row["status"]
+
+    async def update_status(
+        self, idempotency_key: str, resource_path: str, status: str
+    ) -> None:
+        try:
+            async with self._get_connection() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(
+                        UPDATE_STATUS_SQL,
+                        (status, idempotency_key, resource_path),
+                        prepare=True,
+                    )
+                    await conn.commit()
+        except Exception as exc:
+            logger.error(
+                "Failed to update idempotency key {}/{} to {}: {}",
+                idempotency_key,
+                resource_path,
+                status,
+                exc,
+            )
+            raise
+
+    async def release(
+        self, idempotency_key: str, resource_path: str, owner_id: str
+    ) -> None:
+        """Delete the claim if ``owner_id`` still holds it."""
+        try:
+            async with self._get_connection() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(
+                        RELEASE_SQL, (idempotency_key, resource_path, owner_id)
+                    )
+                    await conn.commit()
+        except Exception as exc:
+            logger.error(
+                "Failed to release idempotency key {}/{}: {}",
+                idempotency_key,
+                resource_path,
+                exc,
+            )
+            raise
+
+    async def renew_leases(
+        self, keys: Sequence[tuple[str, str]], owner_id: str, lease_seconds: float
+    ) -> int:
+        """Extend the IN_PROGRESS claims on ``keys`` held by ``owner_id``."""
+        if not keys:
+            return 0
+
+        async with self._get_connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    RENEW_LEASES_SQL,
+                    {
+                        "keys": [key for key, _ in keys],
+                        "paths": [path for _, path in keys],
+                        "owner": owner_id,
+                        "lease": lease_seconds,
+                    },
+                    prepare=True,
+                )
+                renewed = cur.rowcount
+                await conn.commit()
+        return renewed
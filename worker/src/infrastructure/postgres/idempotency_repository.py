@@ -1,10 +1,212 @@
 from __future__ import annotations
 
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
 from dataclasses import dataclass
 
 from loguru import logger
+from psycopg_pool import ConnectionPool
 
-from src.infrastructure.postgres import get_connection
+from src.domain.idempotency.ports import CompletedKeyPurger
+from src.infrastructure.postgres import PoolStats, get_pool_stats
+
+
+# Columns and indexes the worker relies on beyond the API's own. The table
+# belongs to the API service, whose AddIdempotencyKeyLeases and
+# AddIdempotencyKeyCompletedAgeIndex migrations create them.
+REQUIRED_COLUMNS = ("owner_id", "lease_expires_at")
+REQUIRED_INDEXES = (
+    "idx_idempotency_keys_in_progress_owner",
+    "idx_idempotency_keys_completed_age",
+)
+
+SCHEMA_CHECK_SQL = """
+SELECT
+    ARRAY(
+        SELECT column_name::text
+        FROM information_schema.columns
+        WHERE table_schema = current_schema()
+          AND table_name = 'idempotency_keys'
+          AND column_name = ANY(%(columns)s)
+    ) AS columns,
+    ARRAY(
+        SELECT indexname::text
+        FROM pg_indexes
+        WHERE schemaname = current_schema()
+          AND tablename = 'idempotency_keys'
+          AND indexname = ANY(%(indexes)s)
+    ) AS indexes
+"""
+
+# Held for a whole purge run, so concurrent runs do not fight over rows
+PURGE_LOCK_ID = 7_261_902
+
+# Inserts the claim, or takes over an IN_PROGRESS claim whose lease has
+# expired (rows from before leases fall back to updated_at), and otherwise
+# falls through to reading the existing status. The SELECT branch uses the
+# statement snapshot, so a row committed by a concurrent claim while we
+# waited on the conflict is not visible and no row is returned at all.
+CLAIM_SQL = """
+WITH claimed AS (
+    INSERT INTO idempotency_keys
+        (idempotency_key, resource_path, status, owner_id, lease_expires_at)
+    VALUES (
+        %(key)s,
+        %(path)s,
+        'IN_PROGRESS',
+        %(owner)s,
+        now() + make_interval(secs => %(lease)s)
+    )
+    ON CONFLICT (idempotency_key, resource_path) DO UPDATE
+    SET owner_id = EXCLUDED.owner_id,
+        lease_expires_at = EXCLUDED.lease_expires_at,
+        updated_at = now()
+    WHERE idempotency_keys.status = 'IN_PROGRESS'
+      AND COALESCE(
+          idempotency_keys.lease_expires_at,
+          idempotency_keys.updated_at + make_interval(secs => %(lease)s)
+      ) < now()
+    RETURNING 'NEW'::varchar AS status
+)
+SELECT status FROM claimed
+UNION ALL
+SELECT status
+FROM idempotency_keys
+WHERE idempotency_key = %(key)s
+  AND resource_path = %(path)s
+  AND NOT EXISTS (SELECT 1 FROM claimed)
+"""
+
+UPDATE_STATUS_SQL = """
+UPDATE idempotency_keys
+SET status = %s, lease_expires_at = NULL, updated_at = now()
+WHERE idempotency_key = %s AND resource_path = %s
+"""
+
+# Only deletes a claim this owner still holds; a claim taken over after our
+# lease expired belongs to the new owner.
+RELEASE_SQL = """
+DELETE FROM idempotency_keys
+WHERE idempotency_key = %s
+  AND resource_path = %s
+  AND owner_id = %s
+  AND status = 'IN_PROGRESS'
+"""
+
+RENEW_LEASES_SQL = """
+UPDATE idempotency_keys
+SET lease_expires_at = now() + make_interval(secs => %(lease)s)
+FROM unnest(%(keys)s::varchar[], %(paths)s::varchar[]) AS batch(key, path)
+WHERE idempotency_keys.idempotency_key = batch.key
+  AND idempotency_keys.resource_path = batch.path
+  AND idempotency_keys.owner_id = %(owner)s
+  AND idempotency_keys.status = 'IN_PROGRESS'
+"""
+
+# Batch variant of CLAIM_SQL over distinct keys. Rows are inserted in key
+# order so concurrent batches lock overlapping keys in the same order. The
+# final SELECT cannot see rows the CTE inserted or updated, so those come
+# from ``claimed``; the others report their existing status, or NULL for a
+# concurrent claim committed after our snapshot.
+CLAIM_MANY_SQL = """
+WITH batch AS (
+    SELECT key, path
+    FROM unnest(%(keys)s::varchar[], %(paths)s::varchar[]) AS batch(key, path)
+),
+claimed AS (
+    INSERT INTO idempotency_keys
+        (idempotency_key, resource_path, status, owner_id, lease_expires_at)
+    SELECT
+        key,
+        path,
+        'IN_PROGRESS',
+        %(owner)s,
+        now() + make_interval(secs => %(lease)s)
+    FROM batch
+    ORDER BY key, path
+    ON CONFLICT (idempotency_key, resource_path) DO UPDATE
+    SET owner_id = EXCLUDED.owner_id,
+        lease_expires_at = EXCLUDED.lease_expires_at,
+        updated_at = now()
+    WHERE idempotency_keys.status = 'IN_PROGRESS'
+      AND COALESCE(
+          idempotency_keys.lease_expires_at,
+          idempotency_keys.updated_at + make_interval(secs => %(lease)s)
+      ) < now()
+    RETURNING idempotency_key, resource_path
+)
+SELECT
+    batch.key AS idempotency_key,
+    batch.path AS resource_path,
+    CASE
+        WHEN claimed.idempotency_key IS NOT NULL THEN 'NEW'
+        ELSE existing.status
+    END AS status
+FROM batch
+LEFT JOIN claimed
+    ON claimed.idempotency_key = batch.key AND claimed.resource_path = batch.path
+LEFT JOIN idempotency_keys AS existing
+    ON existing.idempotency_key = batch.key AND existing.resource_path = batch.path
+"""
+
+GET_STATUSES_SQL = """
+SELECT k.idempotency_key, k.resource_path, k.status
+FROM unnest(%(keys)s::varchar[], %(paths)s::varchar[]) AS batch(key, path)
+JOIN idempotency_keys AS k
+    ON k.idempotency_key = batch.key AND k.resource_path = batch.path
+"""
+
+# Upserts a whole batch of keys as COMPLETED in one statement
+UPSERT_COMPLETED_MANY_SQL = """
+INSERT INTO idempotency_keys (idempotency_key, resource_path, status)
+SELECT key, path, 'COMPLETED'
+FROM unnest(%(keys)s::varchar[], %(paths)s::varchar[]) AS batch(key, path)
+ORDER BY key, path
+ON CONFLICT (idempotency_key, resource_path)
+DO UPDATE SET status = 'COMPLETED', lease_expires_at = NULL, updated_at = now()
+"""
+
+# Batch variant of RELEASE_SQL
+RELEASE_MANY_SQL = """
+DELETE FROM idempotency_keys
+USING unnest(%(keys)s::varchar[], %(paths)s::varchar[]) AS batch(key, path)
+WHERE idempotency_keys.idempotency_key = batch.key
+  AND idempotency_keys.resource_path = batch.path
+  AND idempotency_keys.owner_id = %(owner)s
+  AND idempotency_keys.status = 'IN_PROGRESS'
+"""
+
+# Deletes one batch of expired COMPLETED keys. The ctids are collected into an
+# array first so the DELETE is a TID scan over exactly those rows; a row that
+# changed since the subquery read it has a new ctid and is left alone.
+PURGE_COMPLETED_SQL = """
+DELETE FROM idempotency_keys
+WHERE ctid = ANY(ARRAY(
+    SELECT ctid
+    FROM idempotency_keys
+    WHERE status = 'COMPLETED'
+      AND resource_path = ANY(%(paths)s)
+      AND updated_at < now() - make_interval(secs => %(older_than)s)
+    LIMIT %(limit)s
+))
+"""
+
+
+def schema_check_params() -> dict:
+    return {"columns": list(REQUIRED_COLUMNS), "indexes": list(REQUIRED_INDEXES)}
+
+
+def raise_for_missing_schema(row: dict) -> None:
+    """Raise if `SCHEMA_CHECK_SQL` found a required column or index missing."""
+    missing = [
+        *(name for name in REQUIRED_COLUMNS if name not in row["columns"]),
+        *(name for name in REQUIRED_INDEXES if name not in row["indexes"]),
+    ]
+    if missing:
+        raise RuntimeError(
+            f"idempotency_keys is missing {', '.join(missing)}; "
+            "run the API's migrations first"
+        )
 
 
 @dataclass
@@ -14,12 +216,17 @@ class IdempotencyRecord:
     status: str
 
 
-class PostgresIdempotencyRepository:
-    def __init__(self, connection_url: str) -> None:
-        self._connection_url = connection_url
+class PostgresIdempotencyRepository(CompletedKeyPurger):
+    def __init__(self, pool: ConnectionPool) -> None:
+        self._pool = pool
 
     def _get_connection(self):
-        return get_connection(self._connection_url)
+        """Borrow a pooled connection; it is returned to the pool on exit."""
+        return self._pool.connection()
+
+    def pool_stats(self) -> PoolStats:
+        """Current saturation of the underlying connection pool."""
+        return get_pool_stats(self._pool)
 
     def get(self, idempotency_key: str, resource_path: str) -> IdempotencyRecord | None:
         """Fetch a record by composite key."""
@@ -48,46 +255,67 @@ class PostgresIdempotencyRepository:
             return None
 
         return IdempotencyRecord(
-            idempotency_key=row[0],
-            resource_path=row[1],
-            status=row[2],
+            idempotency_key=row["idempotency_key"],
+            resource_path=row["resource_path"],
+            status=row["status"],
         )
 
-    def insert_in_progress(self, idempotency_key: str, resource_path: str) -> None:
-        """Insert a new IN_PROGRESS record.
+    def check_schema(self) -> None:
+        """Fail fast if the API's migrations have not been run yet."""
+        with self._get_connection() as conn:
+            row = conn.execute(SCHEMA_CHECK_SQL, schema_check_params()).fetchone()
+        raise_for_missing_schema(row)
+
+    def claim(
+        self,
+        idempotency_key: str,
+        resource_path: str,
+        owner_id: str,
+        lease_seconds: float,
+    ) -> str | None:
+        """Atomically claim a key as IN_PROGRESS in a single round trip.
 
+        The claim is held by ``owner_id`` until ``lease_seconds`` from now
+        unless renewed. Returns ``"NEW"`` when this call inserted the record
+        or took over an expired lease, otherwise the status of the existing
+        record. Returns ``None`` when a concurrent claim committed the record
+        after this statement took its snapshot, which callers should treat as
+        IN_PROGRESS.
         """
         try:
             with self._get_connection() as conn:
                 with conn.cursor() as cur:
                     cur.execute(
-                        """
-                        INSERT INTO idempotency_keys (idempotency_key, resource_path, status)
-                        VALUES (%s, %s, 'IN_PROGRESS')
-                        """,
-                        (idempotency_key, resource_path),
+                        CLAIM_SQL,
+                        {
+                            "key": idempotency_key,
+                            "path": resource_path,
+                            "owner": owner_id,
+                            "lease": lease_seconds,
+                        },
+                        prepare=True,
                     )
+                    row = cur.fetchone()
                     conn.commit()
         except Exception as exc:
             logger.error(
-                "Failed to insert idempotency key {}/{}: {}",
+                "Failed to claim idempotency key {}/{}: {}",
                 idempotency_key,
                 resource_path,
                 exc,
             )
             raise
 
+        return None if row is None else row["status"]
+
     def update_status(self, idempotency_key: str, resource_path: str, status: str) -> None:
         try:
             with self._get_connection() as conn:
                 with conn.cursor() as cur:
                     cur.execute(
-                        """
-                        UPDATE idempotency_keys
-                        SET status = %s
-                        WHERE idempotency_key = %s AND resource_path = %s
-                        """,
+                        UPDATE_STATUS_SQL,
                         (status, idempotency_key, resource_path),
+                        prepare=True,
                     )
                     conn.commit()
         except Exception as exc:
@@ -100,24 +328,209 @@ class PostgresIdempotencyRepository:
             )
             raise
 
-    def delete(self, idempotency_key: str, resource_path: str) -> None:
+    def release(self, idempotency_key: str, resource_path: str, owner_id: str) -> None:
+        """Delete the claim if ``owner_id`` still holds it."""
         try:
             with self._get_connection() as conn:
                 with conn.cursor() as cur:
                     cur.execute(
-                        """
-                        DELETE FROM idempotency_keys
-                        WHERE idempotency_key = %s AND resource_path = %s
-                        """,
-                        (idempotency_key, resource_path),
+                        RELEASE_SQL, (idempotency_key, resource_path, owner_id)
                     )
                     conn.commit()
         except Exception as exc:
             logger.error(
-                "Failed to delete idempotency key {}/{}: {}",
+                "Failed to release idempotency key {}/{}: {}",
                 idempotency_key,
                 resource_path,
                 exc,
             )
             raise
 
+    def get_statuses(
+        self, keys: Sequence[tuple[str, str]]
+    ) -> dict[tuple[str, str], str]:
+        """Status of every pair that has a record, in one round trip."""
+        if not keys:
+            return {}
+
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        GET_STATUSES_SQL,
+                        {
+                            "keys": [key for key, _ in keys],
+                            "paths": [path for _, path in keys],
+                        },
+                    )
+                    rows = cur.fetchall()
+        except Exception as exc:
+            logger.error(
+                "Failed to fetch {} idempotency keys: {}", len(keys), exc
+            )
+            raise
+
+        return {
+            (row["idempotency_key"], row["resource_path"]): row["status"]
+            for row in rows
+        }
+
+    def claim_many(
+        self,
+        keys: Sequence[tuple[str, str]],
+        owner_id: str,
+        lease_seconds: float,
+    ) -> dict[tuple[str, str], str | None]:
+        """Claim ``(idempotency_key, resource_path)`` pairs in one round trip.
+
+        Returns the `claim` result for every distinct pair.
+        """
+        if not keys:
+            return {}
+
+        # ON CONFLICT cannot touch the same row twice in one statement
+        unique_keys = list(dict.fromkeys(keys))
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        CLAIM_MANY_SQL,
+                        {
+                            "keys": [key for key, _ in unique_keys],
+                            "paths": [path for _, path in unique_keys],
+                            "owner": owner_id,
+                            "lease": lease_seconds,
+                        },
+                        prepare=True,
+                    )
+                    rows = cur.fetchall()
+                    conn.commit()
+        except Exception as exc:
+            logger.error(
+                "Failed to claim {} idempotency keys: {}", len(unique_keys), exc
+            )
+            raise
+
+        return {
+            (row["idempotency_key"], row["resource_path"]): row["status"]
+            for row in rows
+        }
+
+    def release_many(self, keys: Sequence[tuple[str, str]], owner_id: str) -> None:
+        """Batch variant of `release`, in one round trip."""
+        if not keys:
+            return
+
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        RELEASE_MANY_SQL,
+                        {
+                            "keys": [key for key, _ in keys],
+                            "paths": [path for _, path in keys],
+                            "owner": owner_id,
+                        },
+                    )
+                    conn.commit()
+        except Exception as exc:
+            logger.error(
+                "Failed to release {} idempotency keys: {}", len(keys), exc
+            )
+            raise
+
+    def renew_leases(
+        self, keys: Sequence[tuple[str, str]], owner_id: str, lease_seconds: float
+    ) -> int:
+        """Extend the IN_PROGRESS claims on ``keys`` held by ``owner_id``.
+
+        Returns the number of claims renewed.
+        """
+        if not keys:
+            return 0
+
+        with self._get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    RENEW_LEASES_SQL,
+                    {
+                        "keys": [key for key, _ in keys],
+                        "paths": [path for _, path in keys],
+                        "owner": owner_id,
+                        "lease": lease_seconds,
+                    },
+                    prepare=True,
+                )
+                renewed = cur.rowcount
+                conn.commit()
+        return renewed
+
+    def upsert_completed_many(self, keys: Sequence[tuple[str, str]]) -> None:
+        """Record ``(idempotency_key, resource_path)`` pairs as COMPLETED.
+
+        Rows that do not exist yet are inserted, so this also works for keys
+        that were claimed somewhere other than Postgres.
+        """
+        if not keys:
+            return
+
+        # ON CONFLICT cannot touch the same row twice in one statement
+        unique_keys = list(dict.fromkeys(keys))
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        UPSERT_COMPLETED_MANY_SQL,
+                        {
+                            "keys": [key for key, _ in unique_keys],
+                            "paths": [path for _, path in unique_keys],
+                        },
+                    )
+                    conn.commit()
+        except Exception as exc:
+            logger.error(
+                "Failed to mark {} idempotency keys as completed: {}",
+                len(unique_keys),
+                exc,
+            )
+            raise
+
+    @contextmanager
+    def purge_lock(self) -> Iterator[bool]:
+        """Hold a session advisory lock on a dedicated pooled connection."""
+        with self._get_connection() as conn:
+            conn.autocommit = True
+            try:
+                row = conn.execute(
+                    "SELECT pg_try_advisory_lock(%s) AS locked", (PURGE_LOCK_ID,)
+                ).fetchone()
+                locked = bool(row["locked"])
+                try:
+                    yield locked
+                finally:
+                    if locked:
+                        conn.execute("SELECT pg_advisory_unlock(%s)", (PURGE_LOCK_ID,))
+            finally:
+                conn.autocommit = False
+
+    def purge_completed(
+        self, resource_paths: Sequence[str], older_than_seconds: float, limit: int
+    ) -> int:
+        """Delete one batch of COMPLETED keys older than ``older_than_seconds``.
+
+        Each batch is its own short transaction. Returns the rows deleted.
+        """
+        with self._get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    PURGE_COMPLETED_SQL,
+                    {
+                        "paths": list(resource_paths),
+                        "older_than": older_than_seconds,
+                        "limit": limit,
+                    },
+                    prepare=True,
+                )
+                purged = cur.rowcount
+                conn.commit()
+        return purged
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from psycopg_pool import ConnectionPool
+
+from src.domain.outbox.ports import Outbox, OutboxBatch, OutboxEntry
+
+# Channel notified once per transaction that inserted outbox rows. The
+# table and its notify trigger belong to the API's CreateArticleOutbox
+# migration.
+NOTIFY_CHANNEL = "article_outbox"
+
+# Rows locked by another relay are skipped rather than waited for, so
+# concurrent relays each take a disjoint batch
+LOCK_BATCH_SQL = """
+SELECT id, payload::text AS payload
+FROM article_outbox
+WHERE available_at <= now()
+ORDER BY id
+LIMIT %(limit)s
+FOR UPDATE SKIP LOCKED
+"""
+
+DELETE_SQL = """
+DELETE FROM article_outbox
+WHERE id = ANY(%(ids)s)
+"""
+
+DEFER_SQL = """
+UPDATE article_outbox
+SET attempts = attempts + 1,
+    available_at = now() + make_interval(secs => %(delay)s)
+WHERE id = ANY(%(ids)s)
+"""
+
+HAS_DUE_SQL = """
+SELECT EXISTS (
+    SELECT 1 FROM article_outbox WHERE available_at <= now()
+) AS due
+"""
+
+
+class PostgresOutboxRepository(Outbox):
+    """Reads and clears the ``article_outbox`` table written by the API service."""
+
+    def __init__(self, pool: ConnectionPool) -> None:
+        self._pool = pool
+
+    def _get_connection(self):
+        """Borrow a pooled connection; it is returned to the pool on exit."""
+        return self._pool.connection()
+
+    @contextmanager
+    def lock_batch(
+        self, limit: int, retry_delay_seconds: float
+    ) -> Iterator[OutboxBatch]:
+        """Lock a batch in a transaction held open until the context exits.
+
+        An error inside the context rolls the transaction back, which only
+        unlocks the entries for the next poll.
+        """
+        with self._get_connection() as conn:
+            with conn.transaction():
+                rows = conn.execute(
+                    LOCK_BATCH_SQL, {"limit": limit}, prepare=True
+                ).fetchall()
+                batch = OutboxBatch(
+                    [OutboxEntry(row["id"], row["payload"].encode()) for row in rows]
+                )
+                yield batch
+
+                if batch.done:
+                    conn.execute(DELETE_SQL, {"ids": batch.done}, prepare=True)
+                if batch.deferred:
+                    conn.execute(
+                        DEFER_SQL,
+                        {"ids": batch.deferred, "delay": retry_delay_seconds},
+                        prepare=True,
+                    )
+
+    def wait_for_entries(self, timeout_seconds: float) -> None:
+        """LISTEN for inserts, unless a due entry is already waiting.
+
+        Entries that become due after their retry delay are not announced, so
+        they are picked up when the timeout elapses.
+        """
+        with self._get_connection() as conn:
+            conn.autocommit = True
+            try:
+                conn.execute(f"LISTEN {NOTIFY_CHANNEL}")
+                try:
+                    # Checked after LISTEN so an insert committed in between
+                    # is either seen here or notified
+                    if not conn.execute(HAS_DUE_SQL).fetchone()["due"]:
+                        for _ in conn.notifies(timeout=timeout_seconds, stop_after=1):
+                            pass
+                finally:
+                    conn.execute(f"UNLISTEN {NOTIFY_CHANNEL}")
+            finally:
+                conn.autocommit = False
@@ -0,0 +1,477 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Mapping
+
+import aio_pika
+from aio_pika.abc import (
+    AbstractChannel,
+    AbstractExchange,
+    AbstractIncomingMessage,
+    AbstractQueue,
+    AbstractRobustConnection,
+)
+from loguru import logger
+
+from src.domain.article import InvalidJobMessageError, MessageRequeueError
+from src.domain.message_queue.ports import AsyncMessageConsumer, HandlerResult
+from src.domain.metrics.ports import DeliveryOutcome, NoopWorkerMetrics, WorkerMetrics
+from src.infrastructure.rabbitmq.rabbitmq_consumer import (
+    ORIGINAL_QUEUE_HEADER,
+    RETRY_COUNT_HEADER,
+    calculate_backoff_delay_ms,
+    queue_depth_targets,
+    reconnect_delay_seconds,
+    retry_count_from_headers,
+    retry_delays_ms,
+    retry_queue_name,
+)
+from src.infrastructure.rabbitmq.settlement_log import SettlementLog
+
+_DRAIN_POLL_INTERVAL_SECONDS = 0.05
+
+
+class AioPikaConsumer(AsyncMessageConsumer):
+    """aio-pika consumer that keeps several messages in flight at once.
+
+    Declares the same topology as `RabbitMQConsumer` (DLX/DLQ, retry queues,
+    bindings) and applies the same retry/DLQ routing. Up to
+    ``max_concurrency`` messages are processed concurrently; the prefetch
+    count matches it so the broker never hands out more than can run.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        namespace: str,
+        events_exchange: str,
+        queue_callbacks: Mapping[str, Callable[[bytes], Awaitable[bool]]],
+        max_concurrency: int = 32,
+        max_retries: int = 3,
+        initial_backoff_seconds: int = 1,
+        max_backoff_seconds: int = 60,
+        backoff_multiplier: float = 2.0,
+        metrics: WorkerMetrics | None = None,
+        queue_depth_interval_seconds: float = 15.0,
+        in_progress_retry_delay_ms: int = 2000,
+        reconnect_initial_seconds: float = 0.5,
+        reconnect_max_seconds: float = 30.0,
+        drain_timeout_seconds: float = 8.0,
+        log_summary_interval_seconds: float = 30.0,
+    ) -> None:
+        self._url = url
+        self._max_concurrency = max_concurrency
+        self._max_retries = max_retries
+        self._initial_backoff = initial_backoff_seconds
+        self._max_backoff = max_backoff_seconds
+        self._backoff_multiplier = backoff_multiplier
+        self._namespace = namespace
+        self._events_exchange = events_exchange
+        self._queue_callbacks = queue_callbacks
+        self._metrics = metrics or NoopWorkerMetrics()
+        self._queue_depth_interval = queue_depth_interval_seconds
+        self._in_progress_retry_delay_ms = in_progress_retry_delay_ms
+        self._retry_delays_ms = retry_delays_ms(
+            max_retries,
+            initial_backoff_seconds,
+            max_backoff_seconds,
+            backoff_multiplier,
+            extra_delays_ms=(in_progress_retry_delay_ms,),
+        )
+        self._reconnect_initial = reconnect_initial_seconds
+        self._reconnect_max = reconnect_max_seconds
+        self._disconnected_at: float | None = None
+        self._closing = False
+        self._in_flight: dict[str, int] = {}
+        self._drain_timeout = drain_timeout_seconds
+        self._stop_requested = asyncio.Event()
+        self._settlement_log = SettlementLog(log_summary_interval_seconds)
+
+    async def _setup_dlx_and_dlq(
+        self, channel: AbstractChannel
+    ) -> tuple[AbstractExchange, str]:
+        dlx_name = f"{self._namespace}.dlx"
+        dlq_name = f"{self._namespace}.dlq"
+
+        dlx = await channel.declare_exchange(
+            dlx_name, aio_pika.ExchangeType.DIRECT, durable=True
+        )
+        dlq = await channel.declare_queue(dlq_name, durable=True)
+        await dlq.bind(dlx, routing_key=dlq_name)
+
+        logger.info("Set up DLX '{}' and DLQ '{}'", dlx_name, dlq_name)
+        return dlx, dlq_name
+
+    async def _connect(self) -> AbstractRobustConnection | None:
+        """Connect, retrying with jittered backoff until the broker is up.
+
+        Returns ``None`` if `stop` is called before a connection succeeded.
+
+        After that the robust connection reconnects by itself every
+        ``reconnect_initial_seconds`` and restores the channel, topology and
+        consumers; the callbacks only record the downtime.
+        """
+        attempt = 0
+        while True:
+            try:
+                connection = await aio_pika.connect_robust(
+                    self._url, reconnect_interval=self._reconnect_initial
+                )
+                break
+            except (ConnectionError, aio_pika.exceptions.AMQPConnectionError) as exc:
+                delay = reconnect_delay_seconds(
+                    attempt, self._reconnect_initial, self._reconnect_max
+                )
+                attempt += 1
+                logger.warning(
+                    "Retrying RabbitMQ connection in {:.1f}s (attempt {}): {}",
+                    delay,
+                    attempt,
+                    exc,
+                )
+                try:
+                    await asyncio.wait_for(self._stop_requested.wait(), delay)
+                except asyncio.TimeoutError:
+                    continue
+                return None
+
+        logger.info("Connected to RabbitMQ")
+        self._metrics.set_broker_connected(True)
+        connection.close_callbacks.add(self._on_connection_lost)
+        connection.reconnect_callbacks.add(self._on_reconnected)
+        return connection
+
+    def _on_connection_lost(self, _connection, exc: BaseException | None) -> None:
+        if self._closing or self._disconnected_at is not None:
+            # Closed by us, or a failed reconnect attempt
+            return
+        self._disconnected_at = time.monotonic()
+        logger.error("Lost RabbitMQ connection: {!r}", exc)
+        self._metrics.set_broker_connected(False)
+
+    def _on_reconnected(self, _connection) -> None:
+        self._metrics.set_broker_connected(True)
+        if self._disconnected_at is None:
+            return
+        downtime = time.monotonic() - self._disconnected_at
+        self._disconnected_at = None
+        self._metrics.observe_reconnect(downtime)
+        logger.info("Reconnected to RabbitMQ after {:.1f}s", downtime)
+
+    async def start_consuming(self) -> None:
+        """Consume all configured queues until `stop` is called or cancelled."""
+        connection = await self._connect()
+        if connection is None:
+            return
+
+        try:
+            channel = await connection.channel()
+            await channel.set_qos(prefetch_count=self._max_concurrency)
+            semaphore = asyncio.Semaphore(self._max_concurrency)
+
+            dlx, dlq_name = await self._setup_dlx_and_dlq(channel)
+            events = await channel.declare_exchange(
+                self._events_exchange, aio_pika.ExchangeType.TOPIC, durable=True
+            )
+
+            # Retries and dead letters go out on their own confirm-mode
+            # channel; concurrent handlers publish without waiting on each
+            # other and the broker confirms them together
+            publish_channel = await connection.channel(publisher_confirms=True)
+            publish_dlx = await publish_channel.get_exchange(dlx.name)
+
+            consumers: list[tuple[AbstractQueue, str]] = []
+            for queue_name, callback in self._queue_callbacks.items():
+                for delay_ms in self._retry_delays_ms:
+                    await channel.declare_queue(
+                        retry_queue_name(queue_name, delay_ms),
+                        durable=True,
+                        arguments={
+                            "x-message-ttl": delay_ms,
+                            "x-dead-letter-exchange": dlx.name,
+                            "x-dead-letter-routing-key": queue_name,
+                        },
+                    )
+                queue = await channel.declare_queue(
+                    queue_name,
+                    durable=True,
+                    arguments={
+                        "x-dead-letter-exchange": dlx.name,
+                        "x-dead-letter-routing-key": dlq_name,
+                    },
+                )
+                await queue.bind(events, routing_key=queue_name)
+                await queue.bind(dlx, routing_key=queue_name)
+
+                consumer_tag = await queue.consume(
+                    self._make_on_message(
+                        publish_channel,
+                        queue_name,
+                        callback,
+                        semaphore,
+                        publish_dlx,
+                        dlq_name,
+                    )
+                )
+                consumers.append((queue, consumer_tag))
+                logger.info("Registered consumer for queue '{}'", queue_name)
+
+            depth_channel = await connection.channel()
+            sampler = asyncio.create_task(
+                self._sample_queue_depths(
+                    depth_channel,
+                    queue_depth_targets(
+                        self._queue_callbacks, self._retry_delays_ms, dlq_name
+                    ),
+                )
+            )
+
+            logger.info(
+                "Waiting for messages on queues: {} with up to {} in flight",
+                ", ".join(self._queue_callbacks.keys()),
+                self._max_concurrency,
+            )
+            try:
+                await self._stop_requested.wait()
+                await self._drain(consumers)
+            finally:
+                sampler.cancel()
+        finally:
+            self._closing = True
+            await connection.close()
+            self._metrics.set_broker_connected(False)
+            logger.info("RabbitMQ connection closed")
+            self._settlement_log.flush()
+
+    def stop(self) -> None:
+        """Drain and make `start_consuming` return.
+
+        The consumers are cancelled, so the broker hands undelivered
+        prefetched messages to other workers, and messages already being
+        handled get up to ``drain_timeout_seconds`` to finish and be settled
+        before the connection is closed.
+        """
+        if not self._stop_requested.is_set():
+            logger.info("Stopping: draining in-flight messages")
+            self._stop_requested.set()
+
+    async def _drain(self, consumers: list[tuple[AbstractQueue, str]]) -> None:
+        for queue, consumer_tag in consumers:
+            await queue.cancel(consumer_tag)
+
+        deadline = time.monotonic() + self._drain_timeout
+        while any(self._in_flight.values()):
+            if time.monotonic() >= deadline:
+                logger.warning(
+                    "Closing with {} messages still in flight; the broker "
+                    "redelivers them",
+                    sum(self._in_flight.values()),
+                )
+                return
+            await asyncio.sleep(_DRAIN_POLL_INTERVAL_SECONDS)
+        logger.info("Drained all in-flight messages")
+
+    def _make_on_message(
+        self,
+        publish_channel: AbstractChannel,
+        q_name: str,
+        cb: Callable[[bytes], Awaitable[bool]],
+        semaphore: asyncio.Semaphore,
+        dlx: AbstractExchange,
+        dlq_name: str,
+    ) -> Callable[[AbstractIncomingMessage], Awaitable[None]]:
+        async def _on_message(message: AbstractIncomingMessage) -> None:
+            self._on_received(q_name)
+            async with semaphore:
+                logger.debug(
+                    "Processing message from queue '{}': {} (retry {}/{})",
+                    q_name,
+                    message.delivery_tag,
+                    retry_count_from_headers(message.headers),
+                    self._max_retries,
+                )
+
+                try:
+                    result: HandlerResult = await cb(message.body)
+                except Exception as exc:
+                    result = exc
+
+                await self._settle(
+                    publish_channel, message, q_name, result, dlx, dlq_name
+                )
+
+        return _on_message
+
+    async def _settle(
+        self,
+        publish_channel: AbstractChannel,
+        message: AbstractIncomingMessage,
+        q_name: str,
+        result: HandlerResult,
+        dlx: AbstractExchange,
+        dlq_name: str,
+    ) -> None:
+        """Ack, requeue, retry or dead-letter a delivery based on its result."""
+        try:
+            outcome = await self._route(
+                publish_channel, message, q_name, result, dlx, dlq_name
+            )
+        finally:
+            self._in_flight[q_name] -= 1
+            self._metrics.set_in_flight(q_name, self._in_flight[q_name])
+        self._metrics.message_settled(q_name, outcome)
+        self._settlement_log.record(q_name, outcome)
+
+    async def _route(
+        self,
+        publish_channel: AbstractChannel,
+        message: AbstractIncomingMessage,
+        q_name: str,
+        result: HandlerResult,
+        dlx: AbstractExchange,
+        dlq_name: str,
+    ) -> DeliveryOutcome:
+        if result is True:
+            await message.ack()
+            logger.debug("Message {} acknowledged", message.delivery_tag)
+            return DeliveryOutcome.ACKED
+
+        headers = dict(message.headers or {})
+        headers[ORIGINAL_QUEUE_HEADER] = q_name
+        retry_count = retry_count_from_headers(message.headers)
+
+        if isinstance(result, MessageRequeueError):
+            logger.info(
+                "Requeuing message {} in {}ms: {}",
+                message.delivery_tag,
+                self._in_progress_retry_delay_ms,
+                result,
+            )
+            # Parked in the retry queue with the retry count unchanged; see
+            # `RabbitMQConsumer`
+            return await self._republish(
+                message,
+                publish_channel.default_exchange,
+                retry_queue_name(q_name, self._in_progress_retry_delay_ms),
+                headers,
+                DeliveryOutcome.REQUEUED,
+            )
+
+        if isinstance(result, InvalidJobMessageError):
+            logger.error(
+                "Invalid message {}, routing to DLQ: {}", message.delivery_tag, result
+            )
+            headers[RETRY_COUNT_HEADER] = 0
+            headers["x-error-reason"] = "invalid_message"
+            return await self._republish(
+                message, dlx, dlq_name, headers, DeliveryOutcome.DEAD_LETTERED
+            )
+
+        if isinstance(result, Exception):
+            logger.opt(exception=result).error(
+                "Error in message callback for {}: {}", message.delivery_tag, result
+            )
+
+        if retry_count >= self._max_retries:
+            logger.error(
+                "Message exceeded max retries ({}), routing to DLQ",
+                self._max_retries,
+            )
+            headers[RETRY_COUNT_HEADER] = retry_count
+            return await self._republish(
+                message, dlx, dlq_name, headers, DeliveryOutcome.DEAD_LETTERED
+            )
+
+        delay_ms = calculate_backoff_delay_ms(
+            retry_count,
+            self._initial_backoff,
+            self._max_backoff,
+            self._backoff_multiplier,
+        )
+        logger.warning(
+            "Message failed (retry {}/{}), republishing to retry queue "
+            "with {}ms delay",
+            retry_count + 1,
+            self._max_retries,
+            delay_ms,
+        )
+        headers[RETRY_COUNT_HEADER] = retry_count + 1
+        return await self._republish(
+            message,
+            publish_channel.default_exchange,
+            retry_queue_name(q_name, delay_ms),
+            headers,
+            DeliveryOutcome.RETRIED,
+        )
+
+    async def _republish(
+        self,
+        message: AbstractIncomingMessage,
+        exchange: AbstractExchange,
+        routing_key: str,
+        headers: dict,
+        outcome: DeliveryOutcome,
+    ) -> DeliveryOutcome:
+        """Publish a copy of ``message`` and ack the original once confirmed.
+
+        ``exchange`` belongs to the confirm-mode publishing channel, so the
+        publish returns only after the broker confirmed it; a nacked copy
+        requeues the original instead.
+        """
+        try:
+            await exchange.publish(
+                _persistent(message.body, headers), routing_key=routing_key
+            )
+        except aio_pika.exceptions.DeliveryError as exc:
+            logger.error(
+                "Broker rejected the republish of message {} to '{}'; "
+                "requeuing the original: {}",
+                message.delivery_tag,
+                routing_key,
+                exc,
+            )
+            await message.nack(requeue=True)
+            return DeliveryOutcome.REQUEUED
+
+        await message.ack()
+        return outcome
+
+    def _on_received(self, q_name: str) -> None:
+        self._metrics.message_consumed(q_name)
+        self._in_flight[q_name] = self._in_flight.get(q_name, 0) + 1
+        self._metrics.set_in_flight(q_name, self._in_flight[q_name])
+
+    async def _sample_queue_depths(
+        self, channel: AbstractChannel, queue_names: list[str]
+    ) -> None:
+        """Periodically record the ready message count of ``queue_names``."""
+        while True:
+            await self._record_queue_depths(channel, queue_names)
+            await asyncio.sleep(self._queue_depth_interval)
+
+    async def _record_queue_depths(
+        self, channel: AbstractChannel, queue_names: list[str]
+    ) -> None:
+        """Record the ready message count of ``queue_names`` once.
+
+        ``channel`` is used for nothing else, so a failed declare cannot
+        close the consuming channel. The passive declares go straight to its
+        AMQP channel: declaring through aio-pika returns the queue object
+        it cached on the first declare, with that declare's count.
+        """
+        for name in queue_names:
+            try:
+                amqp_channel = await channel.get_underlay_channel()
+                declared = await amqp_channel.queue_declare(name, passive=True)
+            except Exception as exc:
+                # E.g. while reconnecting; try again next interval
+                logger.warning("Could not sample depth of '{}': {}", name, exc)
+                return
+            self._metrics.set_queue_depth(name, declared.message_count or 0)
+
+
+def _persistent(body: bytes, headers: dict) -> aio_pika.Message:
+    return aio_pika.Message(
+        body,
+        headers=headers,
+        delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+    )
@@ -0,0 +1,196 @@
+import functools
+import threading
+from collections.abc import Callable
+
+import pika
+from loguru import logger
+from pika.connection import Parameters
+from pika.exceptions import AMQPConnectionError, ConnectionWrongStateError
+from pika.frame import Method
+from pika.spec import Basic, BasicProperties
+
+ConfirmCallback = Callable[[bool], None]
+
+# How long opening the publisher connection may take before giving up
+_OPEN_TIMEOUT_SECONDS = 30.0
+
+
+class ConfirmedPublisher:
+    """Publishes in confirm mode on its own connection and I/O thread.
+
+    `BlockingChannel.confirm_delivery` makes every ``basic_publish`` block
+    until its own confirm arrives, which serializes republishing with
+    consumption. This publisher runs a `SelectConnection` on a background
+    thread instead: publishes are handed to that thread and go out back to
+    back, and it tracks the outstanding delivery tags, so the broker can
+    acknowledge many of them with a single ``multiple`` ack.
+
+    Each publish takes a callback that is called with ``True`` once the
+    broker acked the message and ``False`` if it nacked it. Callbacks are
+    handed back to ``connection``, the consumer's `BlockingConnection`, and
+    run on its thread from its event loop, never in the middle of another
+    channel call.
+
+    If the publisher connection is lost, the consumer's event loop raises
+    `AMQPConnectionError`, so the consumer reconnects and the broker
+    redelivers the originals whose copies were never confirmed.
+    """
+
+    def __init__(
+        self, parameters: Parameters, connection: pika.BlockingConnection
+    ) -> None:
+        self._consumer_connection = connection
+        self._pending = 0
+        self._closing = False
+        self._closed_reason: BaseException | None = None
+        self._ready = threading.Event()
+
+        # Only touched on the publisher thread
+        self._channel = None
+        self._next_tag = 1
+        self._callbacks: dict[int, ConfirmCallback] = {}
+
+        self._connection = pika.SelectConnection(
+            parameters,
+            on_open_callback=self._on_connection_open,
+            on_open_error_callback=self._on_connection_closed,
+            on_close_callback=self._on_connection_closed,
+        )
+        self._thread = threading.Thread(
+            target=self._connection.ioloop.start,
+            name="confirmed-publisher",
+            daemon=True,
+        )
+        self._thread.start()
+
+        if not self._ready.wait(_OPEN_TIMEOUT_SECONDS):
+            self.close()
+            raise AMQPConnectionError("Timed out opening the publisher connection")
+        if self._closed_reason is not None:
+            raise AMQPConnectionError(
+                f"Could not open the publisher connection: {self._closed_reason!r}"
+            )
+
+    @property
+    def pending(self) -> int:
+        """Number of publishes whose confirm callback has not run yet."""
+        return self._pending
+
+    def publish(
+        self,
+        exchange: str,
+        routing_key: str,
+        body: bytes,
+        properties: BasicProperties,
+        on_confirmed: ConfirmCallback,
+    ) -> None:
+        """Hand a publish to the publisher thread without waiting for it.
+
+        Raises `AMQPConnectionError` once the publisher connection is lost.
+        """
+        if self._closed_reason is not None:
+            raise AMQPConnectionError(
+                f"Publisher connection lost: {self._closed_reason!r}"
+            )
+
+        self._pending += 1
+        self._connection.ioloop.add_callback_threadsafe(
+            functools.partial(
+                self._publish, exchange, routing_key, body, properties, on_confirmed
+            )
+        )
+
+    def close(self) -> None:
+        """Close the publisher connection; unconfirmed callbacks are dropped."""
+        self._closing = True
+        if self._thread.is_alive():
+            self._connection.ioloop.add_callback_threadsafe(self._close_connection)
+            self._thread.join(_OPEN_TIMEOUT_SECONDS)
+
+    # Publisher thread
+
+    def _on_connection_open(self, connection: pika.SelectConnection) -> None:
+        connection.channel(on_open_callback=self._on_channel_open)
+
+    def _on_channel_open(self, channel) -> None:
+        self._channel = channel
+        channel.add_on_close_callback(self._on_channel_closed)
+        channel.confirm_delivery(
+            ack_nack_callback=self._on_ack_nack,
+            callback=lambda _frame: self._ready.set(),
+        )
+
+    def _on_channel_closed(self, channel, reason: BaseException) -> None:
+        self._channel = None
+        self._close_connection()
+
+    def _on_connection_closed(
+        self, connection: pika.SelectConnection, reason: BaseException
+    ) -> None:
+        self._channel = None
+        self._closed_reason = reason
+        self._connection.ioloop.stop()
+        self._ready.set()
+
+        if self._closing:
+            return
+
+        logger.error("Lost the RabbitMQ publisher connection: {!r}", reason)
+        self._callbacks.clear()
+        self._to_consumer(functools.partial(_raise_connection_lost, reason))
+
+    def _close_connection(self) -> None:
+        if not (self._connection.is_closing or self._connection.is_closed):
+            self._connection.close()
+
+    def _publish(
+        self,
+        exchange: str,
+        routing_key: str,
+        body: bytes,
+        properties: BasicProperties,
+        on_confirmed: ConfirmCallback,
+    ) -> None:
+        if self._channel is None:
+            # The connection is going away; the consumer reconnects
+            return
+
+        self._channel.basic_publish(
+            exchange=exchange,
+            routing_key=routing_key,
+            body=body,
+            properties=properties,
+        )
+        # Confirm delivery tags count the channel's publishes from 1
+        self._callbacks[self._next_tag] = on_confirmed
+        self._next_tag += 1
+
+    def _on_ack_nack(self, frame: Method) -> None:
+        method = frame.method
+        acked = isinstance(method, Basic.Ack)
+        if method.multiple:
+            tags = [tag for tag in self._callbacks if tag <= method.delivery_tag]
+        else:
+            tags = [method.delivery_tag]
+
+        for tag in tags:
+            callback = self._callbacks.pop(tag, None)
+            if callback is not None:
+                self._to_consumer(functools.partial(self._dispatch, callback, acked))
+
+    def _to_consumer(self, callback: Callable[[], None]) -> None:
+        try:
+            self._consumer_connection.add_callback_threadsafe(callback)
+        except ConnectionWrongStateError:
+            # The consumer connection is gone and its deliveries with it
+            pass
+
+    # Consumer thread
+
+    def _dispatch(self, callback: ConfirmCallback, acked: bool) -> None:
+        self._pending -= 1
+        callback(acked)
+
+
+def _raise_connection_lost(reason: BaseException) -> None:
+    raise AMQPConnectionError(f"Publisher connection lost: {reason!r}")
@@ -1,17 +1,26 @@
-from collections.abc import Callable, Mapping
+import random
+import time
+from collections.abc import Callable, Iterable, Mapping, Sequence
 
 import pika
 from loguru import logger
+from pika.exceptions import AMQPChannelError, AMQPConnectionError
 from pika.adapters.blocking_connection import BlockingChannel
-from pika.spec import BasicProperties
+from pika.spec import Basic, BasicProperties
 
 from src.domain.article import InvalidJobMessageError, MessageRequeueError
-from src.domain.message_queue.ports import MessageConsumer
+from src.domain.message_queue.ports import HandlerResult, MessageConsumer
+from src.domain.metrics.ports import DeliveryOutcome, NoopWorkerMetrics, WorkerMetrics
+from src.infrastructure.rabbitmq.confirmed_publisher import ConfirmedPublisher
+from src.infrastructure.rabbitmq.settlement_log import SettlementLog
 
 # Header keys for retry tracking
 RETRY_COUNT_HEADER = "x-retry-count"
 ORIGINAL_QUEUE_HEADER = "x-original-queue"
 
+# How often the event loop checks whether `stop` was called
+_STOP_POLL_INTERVAL_SECONDS = 0.25
+
 
 class RabbitMQConsumer(MessageConsumer):
 
@@ -25,6 +34,19 @@ class RabbitMQConsumer(MessageConsumer):
         initial_backoff_seconds: int = 1,
         max_backoff_seconds: int = 60,
         backoff_multiplier: float = 2.0,
+        queue_batch_callbacks: (
+            Mapping[str, Callable[[Sequence[bytes]], Sequence[HandlerResult]]]
+            | None
+        ) = None,
+        batch_size: int = 1,
+        batch_max_wait_ms: int = 200,
+        metrics: WorkerMetrics | None = None,
+        queue_depth_interval_seconds: float = 15.0,
+        in_progress_retry_delay_ms: int = 2000,
+        reconnect_initial_seconds: float = 0.5,
+        reconnect_max_seconds: float = 30.0,
+        drain_timeout_seconds: float = 8.0,
+        log_summary_interval_seconds: float = 30.0,
     ) -> None:
         self._url = url
         self._max_retries = max_retries
@@ -34,6 +56,28 @@ class RabbitMQConsumer(MessageConsumer):
         self._namespace = namespace
         self._events_exchange = events_exchange
         self._queue_callbacks = queue_callbacks
+        self._queue_batch_callbacks = queue_batch_callbacks or {}
+        self._batch_size = batch_size
+        self._batch_max_wait_ms = batch_max_wait_ms
+        self._metrics = metrics or NoopWorkerMetrics()
+        self._queue_depth_interval = queue_depth_interval_seconds
+        self._in_progress_retry_delay_ms = in_progress_retry_delay_ms
+        self._retry_delays_ms = retry_delays_ms(
+            max_retries,
+            initial_backoff_seconds,
+            max_backoff_seconds,
+            backoff_multiplier,
+            extra_delays_ms=(in_progress_retry_delay_ms,),
+        )
+        self._reconnect_initial = reconnect_initial_seconds
+        self._reconnect_max = reconnect_max_seconds
+        self._in_flight: dict[str, int] = {}
+        self._publisher: ConfirmedPublisher | None = None
+        self._drain_timeout = drain_timeout_seconds
+        self._stop_requested = False
+        self._drain_deadline = 0.0
+        self._batch_flushers: list[Callable[[BlockingChannel], None]] = []
+        self._settlement_log = SettlementLog(log_summary_interval_seconds)
 
     def _connect(self) -> pika.BlockingConnection:
         try:
@@ -46,11 +90,12 @@ class RabbitMQConsumer(MessageConsumer):
             raise
 
     def _calculate_backoff_delay(self, retry_count: int) -> int:
-        delay_seconds = min(
-            self._initial_backoff * (self._backoff_multiplier ** retry_count),
+        return calculate_backoff_delay_ms(
+            retry_count,
+            self._initial_backoff,
             self._max_backoff,
+            self._backoff_multiplier,
         )
-        return int(delay_seconds * 1000)
 
     def _setup_dlx_and_dlq(self, channel: BlockingChannel) -> tuple[str, str]:
         """Set up Dead Letter Exchange and Dead Letter Queue.
@@ -81,64 +126,76 @@ class RabbitMQConsumer(MessageConsumer):
         )
         return dlx_name, dlq_name
 
-    def _setup_retry_queue(
+    def _setup_retry_queues(
         self, channel: BlockingChannel, main_queue: str, dlx_name: str
-    ) -> str:
-        retry_queue = f"{main_queue}.retry"
-
-        # Declare retry queue with:
-        # - TTL: messages expire and go to DLX
-        # - DLX: routes expired messages back to main queue via routing key
-        channel.queue_declare(
-            queue=retry_queue,
-            durable=True,
-            arguments={
-                "x-message-ttl": self._max_backoff * 1000,
-                "x-dead-letter-exchange": dlx_name,
-                "x-dead-letter-routing-key": main_queue,
-            },
-        )
+    ) -> list[str]:
+        """Declare one retry queue per delay tier of ``main_queue``.
+
+        RabbitMQ only expires messages at the head of a queue, so a single
+        retry queue with per-message TTLs holds short delays behind long
+        ones. Within a tier every message has the same TTL and expires in
+        publish order.
+        """
+        retry_queues = []
+        for delay_ms in self._retry_delays_ms:
+            retry_queue = retry_queue_name(main_queue, delay_ms)
+
+            # Declare retry queue with:
+            # - TTL: messages expire and go to DLX
+            # - DLX: routes expired messages back to main queue via routing key
+            channel.queue_declare(
+                queue=retry_queue,
+                durable=True,
+                arguments={
+                    "x-message-ttl": delay_ms,
+                    "x-dead-letter-exchange": dlx_name,
+                    "x-dead-letter-routing-key": main_queue,
+                },
+            )
+            retry_queues.append(retry_queue)
 
         logger.info(
-            "Set up retry queue '{}' for main queue '{}'",
-            retry_queue,
+            "Set up retry queues {} for main queue '{}'",
+            retry_queues,
             main_queue,
         )
-        return retry_queue
+        return retry_queues
 
-    def _handle_retry_or_dlq(
+    def _retry_or_dead_letter(
         self,
-        channel: BlockingChannel,
-        body: bytes,
+        ch: BlockingChannel,
+        method: Basic.Deliver,
         properties: BasicProperties,
+        body: bytes,
         queue_name: str,
         retry_count: int,
         dlx_name: str,
         dlq_name: str,
     ) -> None:
+        headers = {}
+        if properties.headers:
+            headers.update(properties.headers)
+        headers[ORIGINAL_QUEUE_HEADER] = queue_name
+
         if retry_count >= self._max_retries:
             # Max retries exceeded - route to DLQ
             logger.error(
                 "Message exceeded max retries ({}), routing to DLQ",
                 self._max_retries,
             )
-            headers = {}
-            if properties.headers:
-                headers.update(properties.headers)
             headers[RETRY_COUNT_HEADER] = retry_count
-            headers[ORIGINAL_QUEUE_HEADER] = queue_name
-            channel.basic_publish(
+            self._republish(
+                ch,
+                method,
+                queue_name,
                 exchange=dlx_name,
                 routing_key=dlq_name,
                 body=body,
-                properties=pika.BasicProperties(
-                    headers=headers,
-                    delivery_mode=2, 
-                ),
+                headers=headers,
+                outcome=DeliveryOutcome.DEAD_LETTERED,
             )
         else:
             delay_ms = self._calculate_backoff_delay(retry_count)
-            retry_queue = f"{queue_name}.retry"
 
             logger.warning(
                 "Message failed (retry {}/{}), republishing to retry queue "
@@ -148,38 +205,410 @@ class RabbitMQConsumer(MessageConsumer):
                 delay_ms,
             )
 
-            headers = {}
-            if properties.headers:
-                headers.update(properties.headers)
             headers[RETRY_COUNT_HEADER] = retry_count + 1
-            headers[ORIGINAL_QUEUE_HEADER] = queue_name
-            channel.basic_publish(
+            self._republish(
+                ch,
+                method,
+                queue_name,
                 exchange="",
-                routing_key=retry_queue,
+                routing_key=retry_queue_name(queue_name, delay_ms),
                 body=body,
-                properties=pika.BasicProperties(
-                    headers=headers,
-                    expiration=str(delay_ms),
-                    delivery_mode=2,
+                headers=headers,
+                outcome=DeliveryOutcome.RETRIED,
+            )
+
+    def _republish(
+        self,
+        ch: BlockingChannel,
+        method: Basic.Deliver,
+        q_name: str,
+        exchange: str,
+        routing_key: str,
+        body: bytes,
+        headers: dict,
+        outcome: DeliveryOutcome,
+    ) -> None:
+        """Publish a copy of a delivery and settle the original once confirmed.
+
+        The original is acked only after the broker confirmed the copy, so a
+        publish lost to a broker failure leaves the original unacked for
+        redelivery instead of dropping the message. A nacked copy requeues
+        the original.
+        """
+
+        def _on_confirmed(acked: bool) -> None:
+            if acked:
+                ch.basic_ack(delivery_tag=method.delivery_tag)
+                self._on_settled(q_name, outcome)
+                return
+
+            logger.error(
+                "Broker rejected the republish of message {} to '{}'; "
+                "requeuing the original",
+                method.delivery_tag,
+                routing_key,
+            )
+            ch.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
+            self._on_settled(q_name, DeliveryOutcome.REQUEUED)
+
+        self._publisher.publish(
+            exchange=exchange,
+            routing_key=routing_key,
+            body=body,
+            properties=pika.BasicProperties(headers=headers, delivery_mode=2),
+            on_confirmed=_on_confirmed,
+        )
+
+    def _make_on_message(
+        self,
+        q_name: str,
+        cb: Callable[[bytes], bool],
+        dlx_name: str,
+        dlq_name: str,
+    ) -> Callable:
+        """Create a message handler closure for a specific queue and callback."""
+
+        def _on_message(ch, method, properties, body: bytes):
+            """Internal RabbitMQ callback wrapping the domain callback."""
+            self._on_received(q_name)
+            logger.debug(
+                "Processing message from queue '{}': {} (retry {}/{})",
+                q_name,
+                method.delivery_tag,
+                _get_retry_count(properties),
+                self._max_retries,
+            )
+
+            try:
+                result: HandlerResult = cb(body)
+            except Exception as exc:
+                result = exc
+
+            self._settle(
+                ch, method, properties, body, q_name, result, dlx_name, dlq_name
+            )
+
+        return _on_message
+
+    def _make_batch_on_message(
+        self,
+        q_name: str,
+        cb: Callable[[Sequence[bytes]], Sequence[HandlerResult]],
+        dlx_name: str,
+        dlq_name: str,
+    ) -> Callable:
+        """Create a handler that buffers deliveries and flushes them as a batch.
+
+        A batch is flushed once it holds ``batch_size`` messages or when
+        ``batch_max_wait_ms`` has elapsed since its first message arrived,
+        whichever comes first. Each delivery is then settled on its own
+        according to its entry in the callback's results.
+        """
+        pending: list[tuple[Basic.Deliver, BasicProperties, bytes]] = []
+        timer_id: int | None = None
+
+        def _flush(ch: BlockingChannel) -> None:
+            nonlocal timer_id
+            if timer_id is not None:
+                ch.connection.remove_timeout(timer_id)
+                timer_id = None
+            _flush_pending(ch)
+
+        self._batch_flushers.append(_flush)
+
+        def _on_timeout(ch: BlockingChannel) -> None:
+            nonlocal timer_id
+            timer_id = None
+            _flush_pending(ch)
+
+        def _flush_pending(ch: BlockingChannel) -> None:
+            if not pending:
+                return
+
+            batch = pending[:]
+            pending.clear()
+
+            logger.debug(
+                "Processing batch of {} messages from queue '{}'",
+                len(batch),
+                q_name,
+            )
+
+            try:
+                results = list(cb([body for _, _, body in batch]))
+                if len(results) != len(batch):
+                    raise RuntimeError(
+                        f"Batch callback returned {len(results)} results "
+                        f"for {len(batch)} messages"
+                    )
+            except Exception as exc:
+                results = [exc] * len(batch)
+
+            for (method, properties, body), result in zip(batch, results):
+                self._settle(
+                    ch, method, properties, body, q_name, result, dlx_name, dlq_name
+                )
+
+        def _on_message(ch, method, properties, body: bytes):
+            """Internal RabbitMQ callback buffering the delivery."""
+            nonlocal timer_id
+            self._on_received(q_name)
+            pending.append((method, properties, body))
+
+            if len(pending) >= self._batch_size:
+                _flush(ch)
+            elif timer_id is None:
+                timer_id = ch.connection.call_later(
+                    self._batch_max_wait_ms / 1000, lambda: _on_timeout(ch)
+                )
+
+        return _on_message
+
+    def _settle(
+        self,
+        ch: BlockingChannel,
+        method: Basic.Deliver,
+        properties: BasicProperties,
+        body: bytes,
+        q_name: str,
+        result: HandlerResult,
+        dlx_name: str,
+        dlq_name: str,
+    ) -> None:
+        """Ack, requeue, retry or dead-letter a delivery based on its result.
+
+        Acks are immediate; every other outcome republishes the message and
+        settles the delivery once the broker confirmed the copy.
+        """
+        if result is True:
+            ch.basic_ack(delivery_tag=method.delivery_tag)
+            logger.debug("Message {} acknowledged", method.delivery_tag)
+            self._on_settled(q_name, DeliveryOutcome.ACKED)
+        elif isinstance(result, MessageRequeueError):
+            logger.info(
+                "Requeuing message {} in {}ms: {}",
+                method.delivery_tag,
+                self._in_progress_retry_delay_ms,
+                result,
+            )
+            # Parked in the retry queue rather than nacked, so a duplicate of
+            # a message another worker is still processing does not bounce
+            # straight back; the retry count is left unchanged.
+            headers = dict(properties.headers or {})
+            headers[ORIGINAL_QUEUE_HEADER] = q_name
+            self._republish(
+                ch,
+                method,
+                q_name,
+                exchange="",
+                routing_key=retry_queue_name(
+                    q_name, self._in_progress_retry_delay_ms
                 ),
+                body=body,
+                headers=headers,
+                outcome=DeliveryOutcome.REQUEUED,
+            )
+        elif isinstance(result, InvalidJobMessageError):
+            logger.error(
+                "Invalid message {}, routing to DLQ: {}",
+                method.delivery_tag,
+                result,
             )
+            headers = {}
+            if properties.headers:
+                headers.update(properties.headers)
+            headers[RETRY_COUNT_HEADER] = 0
+            headers[ORIGINAL_QUEUE_HEADER] = q_name
+            headers["x-error-reason"] = "invalid_message"
+            self._republish(
+                ch,
+                method,
+                q_name,
+                exchange=dlx_name,
+                routing_key=dlq_name,
+                body=body,
+                headers=headers,
+                outcome=DeliveryOutcome.DEAD_LETTERED,
+            )
+        else:
+            if isinstance(result, Exception):
+                logger.opt(exception=result).error(
+                    "Error in message callback for {}: {}",
+                    method.delivery_tag,
+                    result,
+                )
+            self._retry_or_dead_letter(
+                ch,
+                method,
+                properties,
+                body,
+                q_name,
+                _get_retry_count(properties),
+                dlx_name,
+                dlq_name,
+            )
+
+    def _on_received(self, q_name: str) -> None:
+        self._metrics.message_consumed(q_name)
+        self._in_flight[q_name] = self._in_flight.get(q_name, 0) + 1
+        self._metrics.set_in_flight(q_name, self._in_flight[q_name])
+
+    def _on_settled(self, q_name: str, outcome: DeliveryOutcome) -> None:
+        self._metrics.message_settled(q_name, outcome)
+        self._settlement_log.record(q_name, outcome)
+        self._in_flight[q_name] -= 1
+        self._metrics.set_in_flight(q_name, self._in_flight[q_name])
+
+    def _schedule_queue_depth_sampling(
+        self, connection: pika.BlockingConnection, queue_names: Sequence[str]
+    ) -> None:
+        """Periodically record the ready message count of ``queue_names``.
+
+        Runs on the connection's own timer so sampling never races the
+        consumer.
+        """
+
+        def _sample() -> None:
+            self._record_queue_depths(connection, queue_names)
+            connection.call_later(self._queue_depth_interval, _sample)
+
+        connection.call_later(0, _sample)
+
+    def _record_queue_depths(
+        self, connection: pika.BlockingConnection, queue_names: Sequence[str]
+    ) -> None:
+        """Record the ready message count of ``queue_names`` once.
+
+        Uses passive declares, which only read the queue's counters, on a
+        channel opened for this round alone: the broker closes the channel
+        when a queue is missing, which must not stop consumption.
+        """
+        channel = connection.channel()
+        try:
+            for name in queue_names:
+                try:
+                    declared = channel.queue_declare(queue=name, passive=True)
+                except AMQPChannelError as exc:
+                    # The channel is closed now; try again next interval
+                    logger.warning("Could not sample depth of '{}': {}", name, exc)
+                    return
+                self._metrics.set_queue_depth(name, declared.method.message_count)
+        finally:
+            if channel.is_open:
+                channel.close()
 
     def start_consuming(self) -> None:
-        """Start consuming messages from multiple queues with their callbacks."""
+        """Start consuming messages from multiple queues with their callbacks.
 
-        connection = self._connect()
+        Runs until `stop` is called or the process is interrupted. When the
+        connection drops, the consumer reconnects with jittered exponential
+        backoff, declares the topology again and resumes; deliveries that
+        were not settled yet are redelivered by the broker.
+        """
+        try:
+            self._consume_with_reconnects()
+        except KeyboardInterrupt:
+            logger.info("Shutting down worker...")
+        self._metrics.set_broker_connected(False)
+        self._settlement_log.flush()
+
+    def stop(self) -> None:
+        """Drain and make `start_consuming` return.
+
+        Only sets a flag, so it is safe to call from a signal handler. Within
+        ``_STOP_POLL_INTERVAL_SECONDS`` of the current message finishing, the
+        consumers are cancelled, so the broker hands undelivered prefetched
+        messages to other workers, and pending batches are processed. The
+        connection is closed once every republished message was confirmed or
+        ``drain_timeout_seconds`` after the call, whichever comes first.
+        """
+        if not self._stop_requested:
+            self._drain_deadline = time.monotonic() + self._drain_timeout
+            self._stop_requested = True
+
+    def _consume_with_reconnects(self) -> None:
+        attempt = 0
+        disconnected_at: float | None = None
+
+        while not self._stop_requested:
+            try:
+                connection = self._connect()
+            except AMQPConnectionError:
+                delay = reconnect_delay_seconds(
+                    attempt, self._reconnect_initial, self._reconnect_max
+                )
+                attempt += 1
+                logger.warning(
+                    "Retrying RabbitMQ connection in {:.1f}s (attempt {})",
+                    delay,
+                    attempt,
+                )
+                self._sleep_unless_stopped(delay)
+                continue
+
+            attempt = 0
+            self._metrics.set_broker_connected(True)
+            if disconnected_at is not None:
+                downtime = time.monotonic() - disconnected_at
+                self._metrics.observe_reconnect(downtime)
+                logger.info("Reconnected to RabbitMQ after {:.1f}s", downtime)
+                disconnected_at = None
+
+            try:
+                self._consume(connection)
+                return
+            except (AMQPConnectionError, AMQPChannelError) as exc:
+                disconnected_at = time.monotonic()
+                logger.error("Lost RabbitMQ connection: {!r}", exc)
+                self._metrics.set_broker_connected(False)
+                self._reset_in_flight()
+            finally:
+                if self._publisher is not None:
+                    self._publisher.close()
+                    self._publisher = None
+                if connection.is_open:
+                    try:
+                        connection.close()
+                    except Exception as exc:
+                        logger.debug("Error closing RabbitMQ connection: {}", exc)
+                logger.info("RabbitMQ connection closed")
+
+    def _sleep_unless_stopped(self, seconds: float) -> None:
+        deadline = time.monotonic() + seconds
+        while not self._stop_requested:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(remaining, _STOP_POLL_INTERVAL_SECONDS))
+
+    def _consume(self, connection: pika.BlockingConnection) -> None:
+        """Declare the topology on ``connection`` and consume until stopped.
+
+        Returns once `stop` drained the consumers; raises when the connection
+        fails.
+        """
         channel = connection.channel()
+        self._batch_flushers = []
 
-        # Process one message at a time per worker
-        channel.basic_qos(prefetch_count=1)
+        # Process one message at a time per worker, or let a whole batch be
+        # outstanding when batching is enabled
+        channel.basic_qos(
+            prefetch_count=self._batch_size if self._queue_batch_callbacks else 1
+        )
 
         # Set up DLX and DLQ (shared across all queues)
         dlx_name, dlq_name = self._setup_dlx_and_dlq(channel)
 
+        # Retries and dead letters are republished in confirm mode on their
+        # own connection and thread, so consuming never waits for a confirm
+        self._publisher = ConfirmedPublisher(
+            pika.URLParameters(self._url), connection
+        )
+
         # Set up consumers for each queue
         for queue_name, callback in self._queue_callbacks.items():
-            # Set up retry queue for this main queue
-            self._setup_retry_queue(channel, queue_name, dlx_name)
+            # Set up the retry queues for this main queue
+            self._setup_retry_queues(channel, queue_name, dlx_name)
 
             # Declare main queue with DLX configured for final failures
             channel.queue_declare(
@@ -218,112 +647,17 @@ class RabbitMQConsumer(MessageConsumer):
                 routing_key=queue_name,
             )
 
-            def _make_on_message(
-                q_name: str, cb: Callable[[bytes], bool]
-            ) -> Callable:
-                """Create a message handler closure for a specific queue and callback."""
-
-                def _on_message(ch, method, properties, body: bytes):
-                    """Internal RabbitMQ callback wrapping the domain callback."""
-                    try:
-                        # Extract retry count from headers
-                        # (default to 0 for new messages)
-                        retry_count = 0
-                        if (
-                            properties.headers
-                            and RETRY_COUNT_HEADER in properties.headers
-                        ):
-                            retry_count = int(
-                                properties.headers[RETRY_COUNT_HEADER]
-                            )
-
-                        logger.info(
-                            "Processing message from queue '{}': {} "
-                            "(retry {}/{})",
-                            q_name,
-                            method.delivery_tag,
-                            retry_count,
-                            self._max_retries,
-                        )
-
-                        success = cb(body)
-
-                        if success:
-                            ch.basic_ack(delivery_tag=method.delivery_tag)
-                            logger.info(
-                                "Message {} acknowledged", method.delivery_tag
-                            )
-                        else:
-                            ch.basic_ack(delivery_tag=method.delivery_tag)
-                            self._handle_retry_or_dlq(
-                                ch,
-                                body,
-                                properties,
-                                q_name,
-                                retry_count,
-                                dlx_name,
-                                dlq_name,
-                            )
-                    except MessageRequeueError as exc:
-                        logger.info(
-                            "Requeuing message {} immediately: {}",
-                            method.delivery_tag,
-                            exc,
-                        )
-                        ch.basic_nack(
-                            delivery_tag=method.delivery_tag, requeue=True
-                        )
-                    except InvalidJobMessageError as exc:
-                        logger.error(
-                            "Invalid message {}, routing to DLQ: {}",
-                            method.delivery_tag,
-                            exc,
-                        )
-                        ch.basic_ack(delivery_tag=method.delivery_tag)
-                        headers = {}
-                        if properties.headers:
-                            headers.update(properties.headers)
-                        headers[RETRY_COUNT_HEADER] = 0
-                        headers[ORIGINAL_QUEUE_HEADER] = q_name
-                        headers["x-error-reason"] = "invalid_message"
-                        ch.basic_publish(
-                            exchange=dlx_name,
-                            routing_key=dlq_name,
-                            body=body,
-                            properties=pika.BasicProperties(
-                                headers=headers,
-                                delivery_mode=2,
-                            ),
-                        )
-                    except Exception as exc:
-                        retry_count = 0
-                        if (
-                            properties.headers
-                            and RETRY_COUNT_HEADER in properties.headers
-                        ):
-                            retry_count = int(
-                                properties.headers[RETRY_COUNT_HEADER]
-                            )
-
-                        logger.exception(
-                            "Error in message callback for {}: {}",
-                            method.delivery_tag,
-                            exc,
-                        )
-                        ch.basic_ack(delivery_tag=method.delivery_tag)
-                        self._handle_retry_or_dlq(
-                            ch,
-                            body,
-                            properties,
-                            q_name,
-                            retry_count,
-                            dlx_name,
-                            dlq_name,
-                        )
-
-                return _on_message
-
-            on_message = _make_on_message(queue_name, callback)
+            if queue_name in self._queue_batch_callbacks:
+                on_message = self._make_batch_on_message(
+                    queue_name,
+                    self._queue_batch_callbacks[queue_name],
+                    dlx_name,
+                    dlq_name,
+                )
+            else:
+                on_message = self._make_on_message(
+                    queue_name, callback, dlx_name, dlq_name
+                )
 
             channel.basic_consume(
                 queue=queue_name,
@@ -333,19 +667,141 @@ class RabbitMQConsumer(MessageConsumer):
 
             logger.info("Registered consumer for queue '{}'", queue_name)
 
+        self._schedule_queue_depth_sampling(
+            connection,
+            queue_depth_targets(
+                self._queue_callbacks, self._retry_delays_ms, dlq_name
+            ),
+        )
+
+        self._schedule_stop_check(channel)
+
         queue_names = ", ".join(self._queue_callbacks.keys())
         logger.info(
             "Waiting for messages on queues: {}. Press CTRL+C to exit.",
             queue_names,
         )
 
-        try:
-            channel.start_consuming()
-        except KeyboardInterrupt:
-            logger.info("Shutting down worker...")
+        # Returns once every consumer is cancelled
+        channel.start_consuming()
+        self._wait_for_confirms(connection)
+
+    def _schedule_stop_check(self, channel: BlockingChannel) -> None:
+        """Start draining on the connection's timer once `stop` was called.
+
+        Timers only run between deliveries, so the message being handled
+        when the signal arrived is always finished and settled first.
+        """
+
+        def _check() -> None:
+            if not self._stop_requested:
+                channel.connection.call_later(_STOP_POLL_INTERVAL_SECONDS, _check)
+                return
+
+            logger.info("Stopping: cancelling consumers and flushing pending batches")
+            for flush in self._batch_flushers:
+                flush(channel)
             channel.stop_consuming()
-        finally:
-            connection.close()
-            logger.info("RabbitMQ connection closed")
+
+        channel.connection.call_later(_STOP_POLL_INTERVAL_SECONDS, _check)
+
+    def _wait_for_confirms(self, connection: pika.BlockingConnection) -> None:
+        """Settle the originals of republished messages before closing."""
+        while (
+            self._publisher.pending
+            and time.monotonic() < self._drain_deadline
+        ):
+            connection.process_data_events(time_limit=_STOP_POLL_INTERVAL_SECONDS)
+
+        if self._publisher.pending:
+            logger.warning(
+                "Closing with {} republished messages unconfirmed; the broker "
+                "redelivers their originals",
+                self._publisher.pending,
+            )
+        else:
+            logger.info("Drained all in-flight messages")
+
+    def _reset_in_flight(self) -> None:
+        """Forget deliveries of a lost connection; the broker requeues them."""
+        for q_name in self._in_flight:
+            self._in_flight[q_name] = 0
+            self._metrics.set_in_flight(q_name, 0)
+
+
+def reconnect_delay_seconds(
+    attempt: int, initial_seconds: float, max_seconds: float
+) -> float:
+    """Delay before reconnect ``attempt`` (0-based), with full jitter.
+
+    A random point below the exponential backoff, so workers that lost the
+    broker at the same moment do not all reconnect at once.
+    """
+    return random.uniform(0, min(initial_seconds * 2**attempt, max_seconds))
+
+
+def calculate_backoff_delay_ms(
+    retry_count: int,
+    initial_backoff_seconds: int,
+    max_backoff_seconds: int,
+    backoff_multiplier: float,
+) -> int:
+    """Exponential backoff delay in milliseconds for the given retry count."""
+    delay_seconds = min(
+        initial_backoff_seconds * (backoff_multiplier ** retry_count),
+        max_backoff_seconds,
+    )
+    return int(delay_seconds * 1000)
+
+
+def retry_delays_ms(
+    max_retries: int,
+    initial_backoff_seconds: int,
+    max_backoff_seconds: int,
+    backoff_multiplier: float,
+    extra_delays_ms: Iterable[int] = (),
+) -> list[int]:
+    """Distinct delays, ascending, that messages can be retried after.
+
+    One per retry count below ``max_retries``, plus ``extra_delays_ms``; each
+    gets its own retry queue.
+    """
+    delays = {
+        calculate_backoff_delay_ms(
+            retry_count,
+            initial_backoff_seconds,
+            max_backoff_seconds,
+            backoff_multiplier,
+        )
+        for retry_count in range(max_retries)
+    }
+    return sorted(delays.union(extra_delays_ms))
+
+
+def retry_queue_name(queue_name: str, delay_ms: int) -> str:
+    """Name of the retry queue holding ``queue_name`` messages for ``delay_ms``."""
+    return f"{queue_name}.retry.{delay_ms}ms"
+
+
+def retry_count_from_headers(headers: Mapping | None) -> int:
+    """Extract the retry count from message headers (0 for new messages)."""
+    if headers and RETRY_COUNT_HEADER in headers:
+        return int(headers[RETRY_COUNT_HEADER])
+    return 0
+
+
+def queue_depth_targets(
+    queue_names: Iterable[str], delays_ms: Iterable[int], dlq_name: str
+) -> list[str]:
+    """Main and retry queues of every consumed queue, plus the shared DLQ."""
+    delays_ms = list(delays_ms)
+    sampled = []
+    for name in queue_names:
+        sampled.append(name)
+        sampled += [retry_queue_name(name, delay_ms) for delay_ms in delays_ms]
+    return [*sampled, dlq_name]
 
 
+def _get_retry_count(properties: BasicProperties) -> int:
+    """Extract the retry count from headers (0 for new messages)."""
+    return retry_count_from_headers(properties.headers)
@@ -0,0 +1,48 @@
+"""Periodic summary of settled deliveries, in place of a log line per message."""
+
+import time
+from collections import Counter
+
+from loguru import logger
+
+from src.domain.metrics.ports import DeliveryOutcome
+
+
+class SettlementLog:
+    """Counts settled deliveries and logs one INFO line per interval.
+
+    Per-message lines are logged at DEBUG; at INFO this summary is what shows
+    the worker making progress. The line for an interval is written by the
+    first settlement after it elapsed, or by `flush`.
+    """
+
+    def __init__(self, interval_seconds: float = 30.0) -> None:
+        self._interval = interval_seconds
+        self._counts: Counter[tuple[str, DeliveryOutcome]] = Counter()
+        self._started = time.monotonic()
+
+    def record(self, q_name: str, outcome: DeliveryOutcome) -> None:
+        self._counts[(q_name, outcome)] += 1
+        if time.monotonic() - self._started >= self._interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Log the counts gathered since the last line, if any."""
+        now = time.monotonic()
+        elapsed = now - self._started
+        self._started = now
+        if not self._counts:
+            return
+
+        total = sum(self._counts.values())
+        logger.info(
+            "Settled {} messages in {:.0f}s ({:.1f}/s): {}",
+            total,
+            elapsed,
+            total / elapsed if elapsed else 0.0,
+            ", ".join(
+                f"{q_name} {outcome.value}={count}"
+                for (q_name, outcome), count in sorted(self._counts.items())
+            ),
+        )
+        self._counts.clear()
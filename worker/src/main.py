@@ -1,20 +1,128 @@
 """Worker entry point using hexagonal architecture wiring."""
 
+import _thread
+import asyncio
+import signal
+import threading
+
 from loguru import logger
 
-from src.config.config import load_config, setup_logger
-from src.di.container import build_container
+from src.config.config import WorkerRuntime, load_config, setup_logger
+from src.di.container import Container, build_container
+from src.domain.message_queue.ports import MessageConsumer
+from src.infrastructure.metrics.prometheus_metrics import (
+    PrometheusWorkerMetrics,
+    start_metrics_server,
+)
+from src.infrastructure.postgres import get_pool_stats
+
+# Time the consumer gets to close its connection after its own drain deadline
+# before the backstop interrupts it
+_BACKSTOP_GRACE_SECONDS = 1.0
+
 
+def main(worker_index: int = 0) -> None:
+    """Application entry point.
 
-def main() -> None:
-    """Application entry point."""
+    ``worker_index`` is the supervisor slot running this worker; it offsets
+    the metrics port so sibling processes do not collide.
+    """
     config = load_config()
-    setup_logger(config.LOG_LEVEL)
+    setup_logger(config.LOG_LEVEL, config.LOG_FORMAT, config.LOG_ENQUEUE)
 
-    logger.info("Starting worker...")
+    logger.info("Starting worker ({} runtime)...", config.WORKER_RUNTIME.value)
     container = build_container(config)
 
-    container.article_message_consumer.start_consuming()
+    if isinstance(container.metrics, PrometheusWorkerMetrics):
+        metrics_port = config.METRICS_PORT + worker_index
+        container.metrics.watch_postgres_pool(
+            lambda: get_pool_stats(container.postgres_pool)
+        )
+        start_metrics_server(container.metrics, metrics_port)
+        logger.info("Serving metrics on port {}", metrics_port)
+
+    if config.WORKER_RUNTIME is WorkerRuntime.ASYNCIO:
+        try:
+            asyncio.run(_run_async(container))
+        except KeyboardInterrupt:
+            logger.info("Shutting down worker...")
+        return
+
+    backstop = _drain_on_stop_signals(
+        container.article_message_consumer, config.SHUTDOWN_DRAIN_TIMEOUT_SECONDS
+    )
+    try:
+        container.article_message_consumer.start_consuming()
+    finally:
+        backstop.cancel()
+        container.idempotency_checker.close()
+        _log_pool_stats(container)
+        container.postgres_pool.close()
+
+
+def _drain_on_stop_signals(
+    consumer: MessageConsumer, drain_timeout_seconds: float
+) -> threading.Timer:
+    """Make SIGTERM and SIGINT drain ``consumer`` instead of killing it.
+
+    The consumer only drains between messages, so a handler still stuck
+    shortly after ``drain_timeout_seconds``, or a second signal, interrupts
+    the worker the way Ctrl+C used to. Returns that backstop timer for the
+    caller to cancel once consuming returned.
+
+    Under the supervisor the worker has its own process group, so Ctrl+C
+    in the terminal reaches it only as the supervisor's SIGTERM.
+    """
+    backstop = threading.Timer(
+        drain_timeout_seconds + _BACKSTOP_GRACE_SECONDS, _thread.interrupt_main
+    )
+    backstop.daemon = True
+    stopping = False
+
+    def _on_signal(_signum: int, _frame) -> None:
+        nonlocal stopping
+        if stopping:
+            raise KeyboardInterrupt
+        stopping = True
+        consumer.stop()
+        backstop.start()
+
+    signal.signal(signal.SIGTERM, _on_signal)
+    signal.signal(signal.SIGINT, _on_signal)
+    return backstop
+
+
+async def _run_async(container: Container) -> None:
+    """Run the asyncio runtime, owning the lifetime of its async clients."""
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, container.article_message_consumer.stop)
+
+    await container.postgres_pool.open()
+    try:
+        await container.idempotency_repo.check_schema()
+        try:
+            await container.search_engine.ensure_index_exists()
+        except Exception as exc:
+            logger.warning("Could not bootstrap Elasticsearch index: {}", exc)
+
+        await container.article_message_consumer.start_consuming()
+    finally:
+        await container.idempotency_checker.close()
+        _log_pool_stats(container)
+        await container.postgres_pool.close()
+        await container.search_engine.close()
+
+
+def _log_pool_stats(container: Container) -> None:
+    stats = get_pool_stats(container.postgres_pool)
+    logger.info(
+        "Closing Postgres pool (size={}, in_use={}, waiting={}, opened={})",
+        stats.size,
+        stats.in_use,
+        stats.waiting,
+        stats.opened,
+    )
 
 
 def start_consumer() -> None:
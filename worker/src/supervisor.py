@@ -0,0 +1,172 @@
+"""Supervisor entry point running several worker processes side by side.
+
+Each child runs `src.main.main` in its own process and therefore builds its
+own container: its own RabbitMQ connection, Postgres pool and Elasticsearch
+client. Crashed children are restarted with a backoff; SIGTERM/SIGINT stop
+the supervisor, which sends SIGTERM to the children and gives them a bounded
+time to drain and exit.
+"""
+
+import multiprocessing
+import os
+import signal
+import time
+from collections.abc import Callable
+from multiprocessing.process import BaseProcess
+
+from loguru import logger
+
+from src.config.config import load_config, setup_logger
+from src.main import main as run_worker
+
+# A child that lived at least this long is considered healthy, which resets
+# its restart backoff.
+_HEALTHY_UPTIME_SECONDS = 30.0
+_INITIAL_RESTART_DELAY_SECONDS = 1.0
+_MAX_RESTART_DELAY_SECONDS = 30.0
+_POLL_INTERVAL_SECONDS = 0.5
+
+
+class Supervisor:
+    """Keeps a fixed number of worker processes running.
+
+    ``target`` is called with the child's slot number, which stays the same
+    across restarts.
+    """
+
+    def __init__(
+        self,
+        target: Callable[[int], None],
+        processes: int,
+        shutdown_timeout_seconds: float,
+    ) -> None:
+        self._target = target
+        self._processes = processes
+        self._shutdown_timeout = shutdown_timeout_seconds
+        # Spawned children start from a fresh interpreter, so nothing opened
+        # by the parent (sockets, pools, logger handlers) leaks into them.
+        self._context = multiprocessing.get_context("spawn")
+        self._children: dict[int, BaseProcess] = {}
+        self._started_at: dict[int, float] = {}
+        self._restart_delay: dict[int, float] = {}
+        self._restart_at: dict[int, float] = {}
+        self._stopping = False
+
+    def run(self) -> None:
+        """Start the children and supervise them until asked to stop."""
+        signal.signal(signal.SIGTERM, self._request_stop)
+        signal.signal(signal.SIGINT, self._request_stop)
+
+        logger.info("Starting {} worker processes", self._processes)
+        for slot in range(self._processes):
+            self._start(slot)
+
+        while not self._stopping:
+            self._reap_and_restart()
+            time.sleep(_POLL_INTERVAL_SECONDS)
+
+        self._stop_children()
+
+    def _request_stop(self, signum: int, _frame) -> None:
+        if not self._stopping:
+            logger.info(
+                "Received {}, stopping worker processes",
+                signal.Signals(signum).name,
+            )
+        self._stopping = True
+
+    def _start(self, slot: int) -> None:
+        process = self._context.Process(
+            target=_run_child,
+            args=(self._target, slot),
+            name=f"news-worker-{slot}",
+            daemon=False,
+        )
+        process.start()
+        self._children[slot] = process
+        self._started_at[slot] = time.monotonic()
+        logger.info("Started worker {} (pid {})", slot, process.pid)
+
+    def _reap_and_restart(self) -> None:
+        now = time.monotonic()
+        for slot, process in list(self._children.items()):
+            if process.is_alive():
+                continue
+
+            if slot not in self._restart_at:
+                uptime = now - self._started_at[slot]
+                delay = (
+                    _INITIAL_RESTART_DELAY_SECONDS
+                    if uptime >= _HEALTHY_UPTIME_SECONDS
+                    else min(
+                        self._restart_delay.get(slot, 0) * 2
+                        or _INITIAL_RESTART_DELAY_SECONDS,
+                        _MAX_RESTART_DELAY_SECONDS,
+                    )
+                )
+                self._restart_delay[slot] = delay
+                self._restart_at[slot] = now + delay
+                logger.error(
+                    "Worker {} (pid {}) exited with code {} after {:.1f}s; "
+                    "restarting in {:.1f}s",
+                    slot,
+                    process.pid,
+                    process.exitcode,
+                    uptime,
+                    delay,
+                )
+
+            if now >= self._restart_at[slot]:
+                del self._restart_at[slot]
+                process.close()
+                self._start(slot)
+
+    def _stop_children(self) -> None:
+        alive = [p for p in self._children.values() if p.is_alive()]
+        for process in alive:
+            if process.pid is not None:
+                os.kill(process.pid, signal.SIGTERM)
+
+        deadline = time.monotonic() + self._shutdown_timeout
+        for process in alive:
+            process.join(max(0.0, deadline - time.monotonic()))
+
+        for process in alive:
+            if process.is_alive():
+                logger.warning(
+                    "Worker pid {} did not stop within {}s; killing it",
+                    process.pid,
+                    self._shutdown_timeout,
+                )
+                process.kill()
+                process.join()
+
+        logger.info("All worker processes stopped")
+
+
+def _run_child(target: Callable[[int], None], slot: int) -> None:
+    """Run ``target`` in a process group of its own.
+
+    Ctrl+C sends SIGINT to the terminal's whole foreground process group.
+    Children outside it only receive the supervisor's SIGTERM; a SIGINT
+    as well would count as a second stop signal and abort their drain.
+    """
+    os.setpgid(0, 0)
+    target(slot)
+
+
+def main() -> None:
+    """Supervisor entry point for the Poetry script."""
+    config = load_config()
+    setup_logger(config.LOG_LEVEL, config.LOG_FORMAT, config.LOG_ENQUEUE)
+
+    processes = config.WORKER_PROCESSES or os.cpu_count() or 1
+    Supervisor(
+        target=run_worker,
+        processes=processes,
+        shutdown_timeout_seconds=config.SUPERVISOR_SHUTDOWN_TIMEOUT_SECONDS,
+    ).run()
+
+
+if __name__ == "__main__":
+    main()
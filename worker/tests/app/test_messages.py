@@ -0,0 +1,54 @@
+import json
+from datetime import datetime, timezone
+from uuid import UUID
+
+import pytest
+
+from src.app.messages import decode_job_message
+from src.domain.article import InvalidJobMessageError
+
+
+def make_body(**overrides) -> bytes:
+    message = {
+        "event": "news.created",
+        "version": 1,
+        "event_id": "e1",
+        "data": {
+            "id": "550e8400-e29b-41d4-a716-446655440000",
+            "title": "Title",
+            "content": "Content",
+            "source": "source",
+            "author": "Author",
+            "link": "https://example.com/a",
+            "createdAt": "2025-01-01T12:00:00.123Z",
+            "updatedAt": "2025-01-01T12:30:00.456Z",
+        },
+    }
+    message.update(overrides)
+    return json.dumps(message).encode()
+
+
+def test_decodes_a_news_created_event():
+    envelope = decode_job_message(make_body())
+
+    assert envelope.event_id == "e1"
+    assert envelope.data.id == UUID("550e8400-e29b-41d4-a716-446655440000")
+    assert envelope.data.created_at == datetime(
+        2025, 1, 1, 12, 0, 0, 123000, tzinfo=timezone.utc
+    )
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b"not json",
+        make_body(event="news.deleted"),
+        make_body(version=2),
+        make_body(data={"id": "550e8400-e29b-41d4-a716-446655440000"}),
+        make_body(event_id=1),
+    ],
+    ids=["malformed", "event", "version", "missing-fields", "wrong-type"],
+)
+def test_rejects_invalid_messages(body):
+    with pytest.raises(InvalidJobMessageError):
+        decode_job_message(body)
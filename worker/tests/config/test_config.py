@@ -0,0 +1,15 @@
+import pytest
+from pydantic import ValidationError
+
+from src.config.config import Config
+
+
+def test_purge_batch_pause_can_be_disabled():
+    config = Config(IDEMPOTENCY_PURGE_BATCH_PAUSE_SECONDS=0)
+
+    assert config.IDEMPOTENCY_PURGE_BATCH_PAUSE_SECONDS == 0
+
+
+def test_purge_batch_pause_must_not_be_negative():
+    with pytest.raises(ValidationError, match="must be non-negative"):
+        Config(IDEMPOTENCY_PURGE_BATCH_PAUSE_SECONDS=-0.5)
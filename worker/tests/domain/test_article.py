@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from src.domain.article import Article, content_hash
+
+ARTICLE_ID = UUID("550e8400-e29b-41d4-a716-446655440000")
+
+
+def make_article(created_at: datetime, updated_at: datetime, **fields) -> Article:
+    values = {
+        "id": ARTICLE_ID,
+        "title": "Title",
+        "content": "Content",
+        "source": "source",
+        "author": "Author",
+        "link": "https://example.com/a",
+        "created_at": created_at,
+        "updated_at": updated_at,
+    }
+    values.update(fields)
+    return Article(**values)
+
+
+def test_content_hash_ignores_time_zone_and_sub_millisecond_precision():
+    # As the event carries it: UTC, milliseconds
+    from_event = make_article(
+        datetime(2025, 1, 1, 12, 0, 0, 123000, tzinfo=timezone.utc),
+        datetime(2025, 1, 1, 12, 30, 0, 456000, tzinfo=timezone.utc),
+    )
+    # As Postgres returns it: session time zone, microseconds
+    jakarta = timezone(timedelta(hours=7))
+    from_postgres = make_article(
+        datetime(2025, 1, 1, 19, 0, 0, 123456, tzinfo=jakarta),
+        datetime(2025, 1, 1, 19, 30, 0, 456789, tzinfo=jakarta),
+    )
+
+    assert content_hash(from_event) == content_hash(from_postgres)
+
+
+def test_content_hash_treats_naive_timestamps_as_utc():
+    aware = make_article(
+        datetime(2025, 1, 1, tzinfo=timezone.utc),
+        datetime(2025, 1, 2, tzinfo=timezone.utc),
+    )
+    naive = make_article(datetime(2025, 1, 1), datetime(2025, 1, 2))
+
+    assert content_hash(aware) == content_hash(naive)
+
+
+def test_content_hash_changes_with_content_and_update_time():
+    created = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    article = make_article(created, created)
+
+    assert content_hash(article) != content_hash(
+        make_article(created, created, content="Edited")
+    )
+    assert content_hash(article) != content_hash(
+        make_article(created, created + timedelta(milliseconds=1))
+    )
+
+
+def test_content_hash_is_a_stable_hex_digest():
+    created = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    digest = content_hash(make_article(created, created))
+
+    assert len(digest) == 32
+    assert digest == content_hash(make_article(created, created))
@@ -0,0 +1,93 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.metrics.ports import NoopWorkerMetrics
+from src.infrastructure.rabbitmq import aio_pika_consumer
+from src.infrastructure.rabbitmq.aio_pika_consumer import AioPikaConsumer
+
+
+class DepthRecorder(NoopWorkerMetrics):
+    def __init__(self) -> None:
+        self.depths: list[tuple[str, int]] = []
+
+    def set_queue_depth(self, queue: str, depth: int) -> None:
+        self.depths.append((queue, depth))
+
+
+def sample(consumer: AioPikaConsumer, channel, queue_names: list[str]) -> None:
+    """Run two sampling rounds, as two intervals of the sampling loop would."""
+
+    async def run() -> None:
+        for _ in range(2):
+            await consumer._record_queue_depths(channel, queue_names)
+
+    asyncio.run(run())
+
+
+def make_consumer(metrics: DepthRecorder) -> AioPikaConsumer:
+    return AioPikaConsumer(
+        "amqp://localhost",
+        "news",
+        "news.events",
+        {},
+        metrics=metrics,
+    )
+
+
+def test_queue_depths_are_read_from_a_fresh_declare_every_round():
+    metrics = DepthRecorder()
+    amqp_channel = AsyncMock()
+    amqp_channel.queue_declare.side_effect = [
+        SimpleNamespace(message_count=5),
+        SimpleNamespace(message_count=2),
+    ]
+    channel = AsyncMock()
+    channel.get_underlay_channel.return_value = amqp_channel
+
+    sample(make_consumer(metrics), channel, ["news.created"])
+
+    assert metrics.depths == [("news.created", 5), ("news.created", 2)]
+    amqp_channel.queue_declare.assert_awaited_with("news.created", passive=True)
+    channel.declare_queue.assert_not_called()
+
+
+def test_failed_sample_skips_the_round():
+    metrics = DepthRecorder()
+    amqp_channel = AsyncMock()
+    amqp_channel.queue_declare.return_value = SimpleNamespace(message_count=0)
+    channel = AsyncMock()
+    channel.get_underlay_channel.side_effect = [
+        RuntimeError("channel closed"),
+        amqp_channel,
+        amqp_channel,
+    ]
+
+    sample(make_consumer(metrics), channel, ["news.created", "news.dlq"])
+
+    assert metrics.depths == [("news.created", 0), ("news.dlq", 0)]
+
+
+def test_sampling_loop_waits_the_interval_between_rounds(monkeypatch):
+    metrics = DepthRecorder()
+    amqp_channel = AsyncMock()
+    amqp_channel.queue_declare.return_value = SimpleNamespace(message_count=3)
+    channel = AsyncMock()
+    channel.get_underlay_channel.return_value = amqp_channel
+    consumer = make_consumer(metrics)
+    waits: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        waits.append(seconds)
+        if len(waits) == 2:
+            raise asyncio.CancelledError
+
+    monkeypatch.setattr(aio_pika_consumer.asyncio, "sleep", fake_sleep)
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(consumer._sample_queue_depths(channel, ["news.created"]))
+
+    assert metrics.depths == [("news.created", 3), ("news.created", 3)]
+    assert waits == [15.0, 15.0]
@@ -0,0 +1,89 @@
+from src.domain.idempotency.ports import IdempotencyStatus
+from src.infrastructure.idempotency.caching_idempotency_checker import (
+    CachingIdempotencyChecker,
+    CompletedKeyCache,
+)
+
+KEY = ("e1", "news.created")
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeChecker:
+    """Reports every key COMPLETED and counts the lookups that reach it."""
+
+    def __init__(self) -> None:
+        self.lookups = 0
+
+    def check_and_claim(self, event_id, resource_key):
+        self.lookups += 1
+        return IdempotencyStatus.COMPLETED
+
+    def check_and_claim_many(self, keys):
+        self.lookups += len(keys)
+        return [IdempotencyStatus.COMPLETED for _ in keys]
+
+
+def test_cache_counts_hits_and_misses():
+    cache = CompletedKeyCache(max_entries=10, ttl_seconds=60)
+
+    assert not cache.contains(*KEY)
+    cache.add(*KEY)
+    assert cache.contains(*KEY)
+
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_entries_expire():
+    clock = FakeClock()
+    cache = CompletedKeyCache(max_entries=10, ttl_seconds=60, clock=clock)
+    cache.add(*KEY)
+
+    clock.now = 60.0
+
+    assert not cache.contains(*KEY)
+    assert len(cache) == 0
+
+
+def test_cache_evicts_the_least_recently_used_entry():
+    cache = CompletedKeyCache(max_entries=2, ttl_seconds=60)
+    cache.add("e1", "news.created")
+    cache.add("e2", "news.created")
+    cache.contains("e1", "news.created")
+
+    cache.add("e3", "news.created")
+
+    assert cache.contains("e1", "news.created")
+    assert not cache.contains("e2", "news.created")
+    assert cache.contains("e3", "news.created")
+
+
+def test_cache_discard():
+    cache = CompletedKeyCache(max_entries=10, ttl_seconds=60)
+    cache.add(*KEY)
+
+    cache.discard(*KEY)
+    cache.discard(*KEY)
+
+    assert not cache.contains(*KEY)
+
+
+def test_checker_serves_completed_keys_from_the_cache():
+    inner = FakeChecker()
+    checker = CachingIdempotencyChecker(
+        inner, CompletedKeyCache(max_entries=10, ttl_seconds=60)
+    )
+
+    assert checker.check_and_claim(*KEY) is IdempotencyStatus.COMPLETED
+    assert checker.check_and_claim_many([KEY, ("e2", "news.created")]) == [
+        IdempotencyStatus.COMPLETED,
+        IdempotencyStatus.COMPLETED,
+    ]
+
+    assert inner.lookups == 2
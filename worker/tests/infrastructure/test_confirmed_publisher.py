@@ -0,0 +1,149 @@
+import pika
+import pytest
+from pika.exceptions import AMQPConnectionError, ConnectionClosedByBroker
+from pika.frame import Method
+from pika.spec import Basic
+
+from src.infrastructure.rabbitmq import confirmed_publisher
+from src.infrastructure.rabbitmq.confirmed_publisher import ConfirmedPublisher
+
+
+class FakeIOLoop:
+    """Runs thread-safe callbacks right away; `start` opens the connection."""
+
+    def __init__(self, connection: "FakeSelectConnection") -> None:
+        self._connection = connection
+
+    def start(self) -> None:
+        self._connection.on_open_callback(self._connection)
+
+    def stop(self) -> None:
+        pass
+
+    def add_callback_threadsafe(self, callback) -> None:
+        callback()
+
+
+class FakeChannel:
+    def __init__(self) -> None:
+        self.published: list[str] = []
+        self.ack_nack_callback = None
+        self.on_close = None
+
+    def add_on_close_callback(self, callback) -> None:
+        self.on_close = callback
+
+    def confirm_delivery(self, ack_nack_callback, callback) -> None:
+        self.ack_nack_callback = ack_nack_callback
+        callback(Method(1, Basic.Ack()))
+
+    def basic_publish(self, exchange, routing_key, body, properties) -> None:
+        self.published.append(routing_key)
+
+    def confirm(self, method) -> None:
+        self.ack_nack_callback(Method(1, method))
+
+
+class FakeSelectConnection:
+    instances: list["FakeSelectConnection"] = []
+
+    def __init__(
+        self, parameters, on_open_callback, on_open_error_callback, on_close_callback
+    ) -> None:
+        self.on_open_callback = on_open_callback
+        self.on_close_callback = on_close_callback
+        self.ioloop = FakeIOLoop(self)
+        self.channel_ = FakeChannel()
+        self.is_closing = False
+        self.is_closed = False
+        FakeSelectConnection.instances.append(self)
+
+    def channel(self, on_open_callback) -> None:
+        on_open_callback(self.channel_)
+
+    def close(self) -> None:
+        self.is_closed = True
+        self.on_close_callback(self, ConnectionClosedByBroker(200, "Normal"))
+
+
+class FakeConsumerConnection:
+    """Queues thread-safe callbacks until `run_callbacks`, like an event loop."""
+
+    def __init__(self) -> None:
+        self.callbacks = []
+
+    def add_callback_threadsafe(self, callback) -> None:
+        self.callbacks.append(callback)
+
+    def run_callbacks(self) -> None:
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+
+
+@pytest.fixture
+def consumer_connection():
+    return FakeConsumerConnection()
+
+
+@pytest.fixture
+def publisher(monkeypatch, consumer_connection):
+    FakeSelectConnection.instances = []
+    monkeypatch.setattr(
+        confirmed_publisher.pika, "SelectConnection", FakeSelectConnection
+    )
+    publisher = ConfirmedPublisher(pika.URLParameters("amqp://"), consumer_connection)
+    yield publisher
+    publisher.close()
+
+
+def publish(publisher, routing_key, confirmed):
+    publisher.publish(
+        "",
+        routing_key,
+        b"{}",
+        pika.BasicProperties(),
+        lambda acked: confirmed.append((routing_key, acked)),
+    )
+
+
+def test_publishes_do_not_wait_for_confirms(publisher, consumer_connection):
+    confirmed = []
+
+    for number in range(3):
+        publish(publisher, f"retry.{number}", confirmed)
+
+    channel = FakeSelectConnection.instances[0].channel_
+    assert channel.published == ["retry.0", "retry.1", "retry.2"]
+    assert publisher.pending == 3
+    assert confirmed == []
+
+
+def test_multiple_ack_confirms_every_earlier_publish(publisher, consumer_connection):
+    confirmed = []
+    for number in range(3):
+        publish(publisher, f"retry.{number}", confirmed)
+    channel = FakeSelectConnection.instances[0].channel_
+
+    channel.confirm(Basic.Ack(delivery_tag=2, multiple=True))
+    channel.confirm(Basic.Nack(delivery_tag=3))
+    # Callbacks only run from the consumer's event loop
+    assert confirmed == []
+
+    consumer_connection.run_callbacks()
+
+    assert confirmed == [("retry.0", True), ("retry.1", True), ("retry.2", False)]
+    assert publisher.pending == 0
+
+
+def test_lost_connection_stops_the_consumer(publisher, consumer_connection):
+    confirmed = []
+    publish(publisher, "retry.0", confirmed)
+
+    FakeSelectConnection.instances[0].close()
+
+    with pytest.raises(AMQPConnectionError):
+        consumer_connection.run_callbacks()
+    with pytest.raises(AMQPConnectionError):
+        publish(publisher, "retry.1", confirmed)
+    assert confirmed == []
@@ -0,0 +1,150 @@
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+from uuid import UUID
+
+import pytest
+
+from src.domain.article import Article
+from src.domain.metrics.ports import DocumentOutcome, NoopWorkerMetrics
+from src.infrastructure.elasticsearch.elasticsearch_engine import (
+    ElasticsearchEngine,
+    document_version,
+    is_version_conflict_item,
+    merge_target_outcomes,
+    stored_hash_lookups,
+    unchanged_positions,
+)
+
+WRITTEN = (True, {"index": {"result": "created"}})
+CONFLICT = (
+    False,
+    {"index": {"error": {"type": "version_conflict_engine_exception"}}},
+)
+FAILED = (False, {"index": {"error": {"type": "mapper_parsing_exception"}}})
+
+
+def make_article(number: int, content_hash: str | None = "hash") -> Article:
+    timestamp = datetime(2025, 1, 1, 12, 0, 0, 123000, tzinfo=timezone.utc)
+    return Article(
+        id=UUID(int=number),
+        title="Title",
+        content="Content",
+        source="source",
+        author="Author",
+        link="https://example.com/a",
+        created_at=timestamp,
+        updated_at=timestamp,
+        content_hash=content_hash,
+    )
+
+
+def test_document_version_is_updated_at_in_milliseconds():
+    assert document_version(make_article(1)) == 1735732800123
+
+
+def test_is_version_conflict_item():
+    assert is_version_conflict_item(CONFLICT[1])
+    assert not is_version_conflict_item(FAILED[1])
+    assert not is_version_conflict_item(WRITTEN[1])
+    assert not is_version_conflict_item({"index": {"error": "reason"}})
+
+
+def test_merge_keeps_a_written_item_over_a_conflict():
+    assert merge_target_outcomes([CONFLICT, WRITTEN], targets=2) == [WRITTEN]
+
+
+def test_merge_counts_a_conflict_as_accepted():
+    assert merge_target_outcomes([CONFLICT, CONFLICT], targets=2) == [
+        (True, CONFLICT[1])
+    ]
+
+
+def test_merge_fails_an_article_any_target_rejected():
+    assert merge_target_outcomes(
+        [WRITTEN, FAILED, WRITTEN, WRITTEN], targets=2
+    ) == [FAILED, WRITTEN]
+
+
+def test_stored_hash_lookups_are_grouped_by_article():
+    articles = [make_article(1), make_article(2)]
+
+    assert stored_hash_lookups(articles, ["articles_v1", "articles_v2"]) == [
+        {"_index": "articles_v1", "_id": str(UUID(int=1))},
+        {"_index": "articles_v2", "_id": str(UUID(int=1))},
+        {"_index": "articles_v1", "_id": str(UUID(int=2))},
+        {"_index": "articles_v2", "_id": str(UUID(int=2))},
+    ]
+
+
+def test_unchanged_only_when_every_target_stores_the_same_hash():
+    same = {"found": True, "_source": {"content_hash": "hash"}}
+    other = {"found": True, "_source": {"content_hash": "other"}}
+    missing = {"found": False}
+    articles = [make_article(1), make_article(2), make_article(3, None)]
+    docs = [same, same, same, missing, same, same]
+
+    assert unchanged_positions(articles, docs, targets=2) == {0}
+    assert unchanged_positions(articles[:1], [same, other], targets=2) == set()
+
+
+class OutcomeRecorder(NoopWorkerMetrics):
+    def __init__(self) -> None:
+        self.outcomes: list[DocumentOutcome] = []
+
+    def documents_indexed(self, outcome: DocumentOutcome, count: int = 1) -> None:
+        self.outcomes.extend([outcome] * count)
+
+
+@pytest.fixture
+def metrics():
+    return OutcomeRecorder()
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.indices.exists_alias.return_value = True
+    client.indices.get_alias.return_value.body = {"articles_v1": {}}
+    return client
+
+
+@pytest.fixture
+def engine(client, metrics):
+    engine = ElasticsearchEngine("http://localhost:9200", metrics=metrics)
+    engine._client = client
+    return engine
+
+
+def test_new_fields_are_added_to_existing_indices(engine, client):
+    engine.ensure_index_exists()
+
+    client.indices.put_mapping.assert_called_once_with(
+        index="articles_write",
+        properties={"content_hash": {"type": "keyword", "index": False}},
+    )
+
+
+def test_single_article_indexed_unchanged_is_not_written(engine, client, metrics):
+    client.mget.return_value = {
+        "docs": [{"found": True, "_source": {"content_hash": "hash"}}]
+    }
+
+    engine.index_article(make_article(1))
+
+    client.index.assert_not_called()
+    assert metrics.outcomes == [DocumentOutcome.UNCHANGED]
+
+
+def test_single_changed_article_is_written(engine, client, metrics):
+    client.mget.return_value = {
+        "docs": [{"found": True, "_source": {"content_hash": "other"}}]
+    }
+
+    engine.index_article(make_article(1))
+
+    client.mget.assert_called_once_with(
+        docs=[{"_index": "articles_v1", "_id": str(UUID(int=1))}],
+        source_includes=["content_hash"],
+    )
+    client.index.assert_called_once()
+    assert metrics.outcomes == [DocumentOutcome.WRITTEN]
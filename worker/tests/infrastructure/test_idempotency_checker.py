@@ -0,0 +1,94 @@
+import threading
+
+import pytest
+
+from src.domain.idempotency.ports import IdempotencyStatus
+from src.infrastructure.idempotency.idempotency_checker import (
+    PostgresIdempotencyChecker,
+)
+
+
+class FakeRepository:
+    """Claims every key as NEW and records each lease renewal."""
+
+    def __init__(self, fail_release: bool = False) -> None:
+        self.fail_release = fail_release
+        self.renewed: list[set[tuple[str, str]]] = []
+        self.renewal = threading.Event()
+
+    def claim(self, event_id, resource_key, owner_id, lease_seconds):
+        return "NEW"
+
+    def claim_many(self, keys, owner_id, lease_seconds):
+        return {key: "NEW" for key in keys}
+
+    def update_status(self, event_id, resource_key, status):
+        pass
+
+    def upsert_completed_many(self, keys):
+        pass
+
+    def release(self, event_id, resource_key, owner_id):
+        if self.fail_release:
+            raise RuntimeError("connection lost")
+
+    def release_many(self, keys, owner_id):
+        pass
+
+    def renew_leases(self, keys, owner_id, lease_seconds):
+        self.renewed.append(set(keys))
+        self.renewal.set()
+        return len(keys)
+
+    def next_renewal(self) -> set[tuple[str, str]]:
+        self.renewal.clear()
+        assert self.renewal.wait(1.0)
+        return self.renewed[-1]
+
+
+@pytest.fixture
+def repo():
+    return FakeRepository()
+
+
+@pytest.fixture
+def checker(repo):
+    checker = PostgresIdempotencyChecker(repo, lease_seconds=0.03, owner_id="w1")
+    yield checker
+    checker.close()
+
+
+def test_heartbeat_renews_only_claims_in_flight(repo, checker):
+    assert checker.check_and_claim("e1", "news.created") is IdempotencyStatus.NEW
+    assert checker.check_and_claim("e2", "news.created") is IdempotencyStatus.NEW
+    assert repo.next_renewal() == {("e1", "news.created"), ("e2", "news.created")}
+
+    checker.mark_completed("e1", "news.created")
+    checker.mark_failed("e2", "news.created")
+
+    assert repo.next_renewal() == set()
+
+
+def test_batch_claims_are_renewed_until_settled(repo, checker):
+    keys = [("e1", "news.created"), ("e2", "news.created")]
+    checker.check_and_claim_many(keys)
+    assert repo.next_renewal() == set(keys)
+
+    checker.mark_completed_many(keys[:1])
+    assert repo.next_renewal() == {keys[1]}
+
+    checker.mark_failed_many(keys[1:])
+    assert repo.next_renewal() == set()
+
+
+def test_claim_whose_release_failed_is_not_renewed():
+    repo = FakeRepository(fail_release=True)
+    checker = PostgresIdempotencyChecker(repo, lease_seconds=0.03, owner_id="w1")
+    try:
+        checker.check_and_claim("e1", "news.created")
+        with pytest.raises(RuntimeError):
+            checker.mark_failed("e1", "news.created")
+
+        assert repo.next_renewal() == set()
+    finally:
+        checker.close()
@@ -0,0 +1,34 @@
+from src.infrastructure.metrics.prometheus_metrics import PrometheusWorkerMetrics
+from src.infrastructure.postgres import get_pool_stats
+
+
+class FakePool:
+    """Answers `get_stats` like psycopg_pool does."""
+
+    def __init__(self) -> None:
+        self.stats = {
+            "pool_size": 4,
+            "pool_available": 1,
+            "requests_waiting": 2,
+            "connections_num": 7,
+        }
+
+    def get_stats(self) -> dict[str, int]:
+        return dict(self.stats)
+
+
+def test_postgres_pool_gauges_are_read_on_every_scrape():
+    metrics = PrometheusWorkerMetrics()
+    pool = FakePool()
+    metrics.watch_postgres_pool(lambda: get_pool_stats(pool))
+
+    def sample(name: str) -> float | None:
+        return metrics.registry.get_sample_value(f"news_worker_postgres_pool_{name}")
+
+    assert sample("size") == 4
+    assert sample("in_use") == 3
+    assert sample("waiting") == 2
+    assert sample("opened") == 7
+
+    pool.stats["connections_num"] = 9
+    assert sample("opened") == 9
@@ -0,0 +1,76 @@
+from types import SimpleNamespace
+
+from pika.exceptions import ChannelClosedByBroker
+
+from src.domain.metrics.ports import NoopWorkerMetrics
+from src.infrastructure.rabbitmq.rabbitmq_consumer import RabbitMQConsumer
+
+
+class DepthRecorder(NoopWorkerMetrics):
+    def __init__(self) -> None:
+        self.depths: list[tuple[str, int]] = []
+
+    def set_queue_depth(self, queue: str, depth: int) -> None:
+        self.depths.append((queue, depth))
+
+
+class FakeChannel:
+    def __init__(self, counts: dict[str, int]) -> None:
+        self._counts = counts
+        self.is_open = True
+
+    def queue_declare(self, queue: str, passive: bool):
+        assert passive
+        if queue not in self._counts:
+            # The broker closes the channel on a failed passive declare
+            self.is_open = False
+            raise ChannelClosedByBroker(404, f"NOT_FOUND - no queue '{queue}'")
+        method = SimpleNamespace(message_count=self._counts[queue])
+        return SimpleNamespace(method=method)
+
+    def close(self) -> None:
+        self.is_open = False
+
+
+class FakeConnection:
+    def __init__(self, counts: dict[str, int]) -> None:
+        self._counts = counts
+        self.channels: list[FakeChannel] = []
+
+    def channel(self) -> FakeChannel:
+        channel = FakeChannel(self._counts)
+        self.channels.append(channel)
+        return channel
+
+
+def make_consumer(metrics: DepthRecorder) -> RabbitMQConsumer:
+    return RabbitMQConsumer(
+        "amqp://localhost", "news", "news.events", {}, metrics=metrics
+    )
+
+
+def test_queue_depths_are_sampled_on_a_channel_of_their_own():
+    metrics = DepthRecorder()
+    connection = FakeConnection({"news.created": 4, "news.dlq": 1})
+
+    make_consumer(metrics)._record_queue_depths(
+        connection, ["news.created", "news.dlq"]
+    )
+
+    assert metrics.depths == [("news.created", 4), ("news.dlq", 1)]
+    assert len(connection.channels) == 1
+    assert not connection.channels[0].is_open
+
+
+def test_missing_queue_only_closes_the_sampling_channel():
+    metrics = DepthRecorder()
+    connection = FakeConnection({"news.dlq": 1})
+    consumer = make_consumer(metrics)
+
+    for _ in range(2):
+        consumer._record_queue_depths(connection, ["news.created", "news.dlq"])
+
+    # Each round gives up on its own channel and the next opens a new one
+    assert metrics.depths == []
+    assert len(connection.channels) == 2
+    assert not any(channel.is_open for channel in connection.channels)
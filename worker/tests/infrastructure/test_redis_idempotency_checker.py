@@ -0,0 +1,211 @@
+import fakeredis
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.domain.article import MessageRequeueError
+from src.domain.idempotency.ports import IdempotencyStatus
+from src.infrastructure.idempotency.redis_idempotency_checker import (
+    RedisIdempotencyChecker,
+)
+from src.infrastructure.postgres.idempotency_repository import IdempotencyRecord
+
+KEY = ("e1", "news.created")
+REDIS_KEY = "idempotency:news.created:e1"
+
+
+class FakeRepository:
+    """In-memory stand-in for the Postgres idempotency repository."""
+
+    def __init__(self) -> None:
+        self.statuses: dict[tuple[str, str], str] = {}
+        self.failures = 0
+        self.reads = 0
+
+    def get(self, idempotency_key, resource_path):
+        self.reads += 1
+        status = self.statuses.get((idempotency_key, resource_path))
+        if status is None:
+            return None
+        return IdempotencyRecord(idempotency_key, resource_path, status)
+
+    def get_statuses(self, keys):
+        self.reads += 1
+        return {key: self.statuses[key] for key in keys if key in self.statuses}
+
+    def upsert_completed_many(self, keys):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("connection lost")
+        for key in keys:
+            self.statuses[key] = "COMPLETED"
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.FakeRedis()
+
+
+@pytest.fixture
+def repo():
+    return FakeRepository()
+
+
+@pytest.fixture
+def make_checker(redis, repo):
+    checkers = []
+
+    def make(client=redis, **kwargs):
+        # A long interval, so only close() flushes
+        checker = RedisIdempotencyChecker(
+            client, repo, flush_interval_ms=60_000, **kwargs
+        )
+        checkers.append(checker)
+        return checker
+
+    yield make
+    for checker in checkers:
+        checker.close()
+
+
+def test_claim_is_exclusive_until_released(make_checker):
+    first, second = make_checker(), make_checker()
+
+    assert first.check_and_claim(*KEY) is IdempotencyStatus.NEW
+    assert second.check_and_claim(*KEY) is IdempotencyStatus.IN_PROGRESS
+
+    first.mark_failed(*KEY)
+    assert second.check_and_claim(*KEY) is IdempotencyStatus.NEW
+
+
+def test_release_leaves_another_workers_lease_alone(make_checker):
+    first, second = make_checker(), make_checker()
+    first.check_and_claim(*KEY)
+
+    second.mark_failed(*KEY)
+
+    assert second.check_and_claim(*KEY) is IdempotencyStatus.IN_PROGRESS
+
+
+def test_completed_key_is_answered_from_redis(make_checker, repo):
+    checker = make_checker()
+    checker.check_and_claim(*KEY)
+    checker.mark_completed(*KEY)
+    reads = repo.reads
+
+    assert checker.check_and_claim(*KEY) is IdempotencyStatus.COMPLETED
+    assert repo.reads == reads
+
+
+def test_completions_are_flushed_to_postgres(make_checker, repo):
+    checker = make_checker()
+    checker.check_and_claim(*KEY)
+    checker.mark_completed(*KEY)
+    checker.mark_completed_many([("e2", "news.created"), ("e3", "news.created")])
+    assert repo.statuses == {}
+
+    checker.close()
+
+    assert repo.statuses == {
+        KEY: "COMPLETED",
+        ("e2", "news.created"): "COMPLETED",
+        ("e3", "news.created"): "COMPLETED",
+    }
+
+
+def test_failed_flush_is_retried(make_checker, repo):
+    repo.failures = 1
+    checker = make_checker()
+    checker.mark_completed(*KEY)
+
+    checker._flush()
+    assert repo.statuses == {}
+    checker._flush()
+
+    assert repo.statuses == {KEY: "COMPLETED"}
+
+
+def test_completion_forgotten_by_redis_is_read_from_postgres(
+    make_checker, redis, repo
+):
+    repo.statuses[KEY] = "COMPLETED"
+    repo.statuses[("e2", "news.created")] = "COMPLETED"
+    checker = make_checker()
+
+    assert checker.check_and_claim(*KEY) is IdempotencyStatus.COMPLETED
+    assert checker.check_and_claim_many(
+        [("e2", "news.created"), ("e3", "news.created")]
+    ) == [IdempotencyStatus.COMPLETED, IdempotencyStatus.NEW]
+    # Written back, so the next lookup stays in Redis
+    assert redis.get("idempotency:news.created:e1") == b"COMPLETED"
+
+
+def test_claim_fails_instead_of_reporting_new_while_redis_is_down(
+    make_checker, repo
+):
+    checker = make_checker(fakeredis.FakeRedis(server=_down_server()))
+
+    with pytest.raises(RedisConnectionError):
+        checker.check_and_claim(*KEY)
+    with pytest.raises(RedisConnectionError):
+        checker.check_and_claim_many([KEY])
+    assert repo.reads == 0
+
+
+def test_completion_reaches_postgres_while_redis_is_down(make_checker, repo):
+    checker = make_checker(fakeredis.FakeRedis(server=_down_server()))
+
+    with pytest.raises(RedisConnectionError):
+        checker.mark_completed(*KEY)
+    checker.close()
+
+    assert repo.statuses == {KEY: "COMPLETED"}
+
+
+def test_heartbeat_extends_only_leases_still_held(make_checker, redis):
+    checker = make_checker()
+    checker.check_and_claim(*KEY)
+    checker.check_and_claim_many([("e2", "news.created"), ("e3", "news.created")])
+    checker.mark_completed("e2", "news.created")
+    # e3's lease expired and another worker claimed it
+    redis.set("idempotency:news.created:e3", b"IN_PROGRESS:other", px=1_000)
+    redis.pexpire(REDIS_KEY, 1_000)
+
+    checker._renew_leases()
+
+    assert redis.pttl(REDIS_KEY) > 59_000
+    assert redis.pttl("idempotency:news.created:e2") > 86_000_000
+    assert redis.pttl("idempotency:news.created:e3") <= 1_000
+
+
+def test_settled_claims_are_no_longer_renewed(make_checker, redis):
+    checker = make_checker()
+    checker.check_and_claim(*KEY)
+    checker.mark_failed(*KEY)
+    redis.set(REDIS_KEY, checker._lease_value, px=1_000)
+
+    checker._renew_leases()
+
+    assert redis.pttl(REDIS_KEY) <= 1_000
+
+
+def test_claims_are_refused_while_completions_are_backlogged(make_checker, repo):
+    repo.failures = 1
+    checker = make_checker(max_pending_completions=2)
+    checker.mark_completed_many([("e2", "news.created"), ("e3", "news.created")])
+
+    with pytest.raises(MessageRequeueError):
+        checker.check_and_claim(*KEY)
+    with pytest.raises(MessageRequeueError):
+        checker.check_and_claim_many([KEY])
+
+    checker._flush()  # Postgres is still down
+    with pytest.raises(MessageRequeueError):
+        checker.check_and_claim(*KEY)
+    checker._flush()
+    assert checker.check_and_claim(*KEY) is IdempotencyStatus.NEW
+
+
+def _down_server() -> fakeredis.FakeServer:
+    server = fakeredis.FakeServer()
+    server.connected = False
+    return server
@@ -0,0 +1,31 @@
+from src.infrastructure.rabbitmq.rabbitmq_consumer import (
+    retry_delays_ms,
+    retry_queue_name,
+)
+
+
+def test_retry_delays_grow_until_capped():
+    assert retry_delays_ms(
+        max_retries=5,
+        initial_backoff_seconds=1,
+        max_backoff_seconds=5,
+        backoff_multiplier=2.0,
+    ) == [1000, 2000, 4000, 5000]
+
+
+def test_retry_delays_include_extra_delays_once():
+    assert retry_delays_ms(
+        max_retries=2,
+        initial_backoff_seconds=1,
+        max_backoff_seconds=60,
+        backoff_multiplier=2.0,
+        extra_delays_ms=[2000, 500],
+    ) == [500, 1000, 2000]
+
+
+def test_retry_delays_without_retries():
+    assert retry_delays_ms(0, 1, 60, 2.0) == []
+
+
+def test_retry_queue_name_includes_delay():
+    assert retry_queue_name("news.created", 4000) == "news.created.retry.4000ms"